@@ -0,0 +1,86 @@
+"""
+Compare the generic validation helper against compiled converters.
+
+Usage: python benchmarks/converters.py [--repeat N] [--json]
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Optional
+
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict
+else:
+    from typing_extensions import NotRequired, TypedDict
+
+from flask import Flask
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flask_parameter_validation import Json, Query, ValidateParameters  # noqa: E402
+from flask_parameter_validation.converters import compile_converter  # noqa: E402
+
+
+class Item(TypedDict):
+    id: int
+    name: str
+    price: float
+    tags: NotRequired[list[str]]
+
+
+def get_cases():
+    """Return (name, type annotation, source, user input) for each benchmark case"""
+    return [
+        ("wide list[int] (10k)", list[int], Json(), list(range(10_000))),
+        ("wide list[str] Query (1k)", list[str], Query(), [str(i) for i in range(1_000)]),
+        ("wide dict[str, float] (10k)", dict[str, float], Json(), {str(i): i / 2 for i in range(10_000)}),
+        ("wide Optional[dict[str, float]] (10k)", Optional[dict[str, float]], Json(),
+         {str(i): i / 2 for i in range(10_000)}),
+        ("deep list[list[list[int]]] (20x20x20)", list[list[list[int]]], Json(),
+         [[list(range(20)) for _ in range(20)] for _ in range(20)]),
+        ("deep dict[str, list[Optional[int]]] (100x100)", dict[str, list[Optional[int]]], Json(),
+         {str(i): [j if j % 3 else None for j in range(100)] for i in range(100)}),
+        ("wide list[TypedDict] (5k)", list[Item], Json(),
+         [{"id": i, "name": f"item {i}", "price": i / 4, "tags": ["a", "b"]} for i in range(5_000)]),
+    ]
+
+
+def run(repeat: int) -> list[dict]:
+    app = Flask(__name__)
+    helper = ValidateParameters()._generic_types_validation_helper
+    results = []
+    with app.app_context():
+        for name, expected_input_type, source, user_input in get_cases():
+            converter = compile_converter("v", expected_input_type, source)
+            assert helper("v", expected_input_type, user_input, source) == converter(user_input)
+            generic = min(timeit.repeat(lambda: helper("v", expected_input_type, user_input, source),
+                                        number=1, repeat=repeat))
+            compiled = min(timeit.repeat(lambda: converter(user_input), number=1, repeat=repeat))
+            results.append({
+                "case": name,
+                "generic_ms": generic * 1000,
+                "compiled_ms": compiled * 1000,
+                "speedup": generic / compiled,
+            })
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=20, help="timing repetitions, the fastest is reported")
+    arg_parser.add_argument("--json", action="store_true", help="emit results as JSON")
+    args = arg_parser.parse_args()
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'case':<48}{'generic ms':>12}{'compiled ms':>13}{'speedup':>9}")
+    for result in results:
+        print(f"{result['case']:<48}{result['generic_ms']:>12.3f}{result['compiled_ms']:>13.3f}"
+              f"{result['speedup']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
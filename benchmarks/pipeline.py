@@ -0,0 +1,159 @@
+"""
+Measure the per-request overhead of ValidateParameters on the testing blueprints.
+
+Each case is requested through the Flask test client, both on a decorated route of
+the testing application and on an undecorated baseline route reading the same input,
+so the difference between the two is the cost of validation.
+
+Usage: python benchmarks/pipeline.py [--requests N] [--repeat N] [--json] [--output PATH]
+                                     [--compare PATH [--tolerance RATIO]]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from importlib import metadata
+from pathlib import Path
+
+from flask import jsonify, request
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flask_parameter_validation.test.testing_application import create_app  # noqa: E402
+
+
+def get_cases():
+    """Return (name, baseline source, request method, url, request kwargs) for each benchmark case"""
+    cases = [
+        ("str Query", "query", "get", "/query/str/required?v=value", {}),
+        ("str Json", "json", "post", "/json/str/required", {"json": {"v": "value"}}),
+        ("str pattern Form", "form", "post", "/form/str/pattern", {"data": {"v": "abc123"}}),
+        ("bool MultiSource Query|Json", "query", "get", "/ms_query_json/required_bool?v=true", {}),
+    ]
+    for size in (1, 100, 10_000):
+        cases.append((f"list[int] Json ({size})", "json", "post", "/json/list/req_int",
+                      {"json": {"v": list(range(size))}}))
+    for size in (1, 100, 1_000):
+        cases.append((f"list[str] Query CSV ({size})", "query", "get",
+                      "/query/list/req_str?v=" + ",".join(f"s{i}" for i in range(size)), {}))
+    for size in (1, 100, 1_000):
+        children = [{"id": i, "name": f"child {i}", "timestamp": "2024-01-01T12:00:00"} for i in range(size)]
+        cases.append((f"TypedDict Json ({size} children)", "json", "post", "/json/typeddict/complex", {"json": {"v": {
+            "children": children,
+            "left": {"x": 0.5, "y": 1.5, "z": 2.5},
+            "right": {"x": 3.5, "y": 4.5, "z": 5.5},
+            "name": "complex",
+        }}}))
+    return cases
+
+
+def create_benchmark_app():
+    app = create_app()
+
+    # Undecorated routes, reading each source the way a route without validation would
+    @app.route("/baseline/query", methods=["GET", "POST"])
+    def baseline_query():
+        return jsonify({"v": request.args.get("v")})
+
+    @app.route("/baseline/json", methods=["GET", "POST"])
+    def baseline_json():
+        return jsonify({"v": request.get_json().get("v")})
+
+    @app.route("/baseline/form", methods=["GET", "POST"])
+    def baseline_form():
+        return jsonify({"v": request.form.get("v")})
+
+    return app
+
+
+def time_requests(send, requests: int, repeat: int) -> float:
+    """Return the fastest mean seconds per request, out of repeat runs"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(requests):
+            send()
+        elapsed = (time.perf_counter() - started) / requests
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(requests: int, repeat: int) -> list[dict]:
+    app = create_benchmark_app()
+    client = app.test_client()
+    results = []
+    for name, baseline_source, method, url, kwargs in get_cases():
+        # The query string is part of the url, which the baseline must also receive
+        query = url[url.index("?"):] if "?" in url else ""
+        send = lambda: getattr(client, method)(url, **kwargs)  # noqa: E731
+        send_baseline = lambda: getattr(client, method)(f"/baseline/{baseline_source}{query}", **kwargs)  # noqa: E731
+        # Warm up, which also checks that each case is valid
+        for response in (send(), send_baseline()):
+            assert response.status_code == 200, f"{name}: {response.status_code} {response.get_data(as_text=True)}"
+        decorated = time_requests(send, requests, repeat)
+        baseline = time_requests(send_baseline, requests, repeat)
+        results.append({
+            "case": name,
+            "requests_per_second": 1 / decorated,
+            "baseline_requests_per_second": 1 / baseline,
+            "request_us": decorated * 1_000_000,
+            "baseline_request_us": baseline * 1_000_000,
+            "overhead_us": (decorated - baseline) * 1_000_000,
+        })
+    return results
+
+
+def compare(results: list[dict], previous: list[dict], tolerance: float) -> list[str]:
+    """
+    Compare overhead against previous results
+
+    :return: a description of each case whose overhead grew by more than the tolerance ratio
+    """
+    previous_overhead = {result["case"]: result["overhead_us"] for result in previous}
+    regressions = []
+    for result in results:
+        before = previous_overhead.get(result["case"])
+        # Overheads within a few microseconds are indistinguishable from noise
+        if before is not None and result["overhead_us"] > max(before, 5) * tolerance:
+            regressions.append(f"{result['case']}: {before:.1f}us -> {result['overhead_us']:.1f}us")
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--requests", type=int, default=200, help="requests per timing run")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="timing runs per case, the fastest is reported")
+    arg_parser.add_argument("--json", action="store_true", help="emit results as JSON")
+    arg_parser.add_argument("--output", type=Path, help="also write the JSON results to a file")
+    arg_parser.add_argument("--compare", type=Path, help="JSON results of a previous run to check for regressions")
+    arg_parser.add_argument("--tolerance", type=float, default=1.25,
+                            help="ratio of overhead growth, over the compared run, counted as a regression")
+    args = arg_parser.parse_args()
+    report = {
+        "python": platform.python_version(),
+        "flask": metadata.version("flask"),
+        "platform": platform.platform(),
+        "requests": args.requests,
+        "repeat": args.repeat,
+        "results": run(args.requests, args.repeat),
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'case':<36}{'req/s':>10}{'baseline req/s':>16}{'overhead us':>13}")
+        for result in report["results"]:
+            print(f"{result['case']:<36}{result['requests_per_second']:>10.0f}"
+                  f"{result['baseline_requests_per_second']:>16.0f}{result['overhead_us']:>13.1f}")
+    if args.compare is not None:
+        regressions = compare(report["results"], json.loads(args.compare.read_text())["results"], args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+    Batched validation.
+    Parameters given the same batch_func are checked together once every
+    parameter of a request has been validated, so that a validator looking up
+    values in a backing store makes one round trip per request, rather than
+    one per value.
+"""
+from typing import Any, Iterator, Optional
+
+from .converters import json_pointer
+from .exceptions import ValidationError
+from .parameter_types.parameter import check_func_result
+
+# Step of a batch_path selecting every item of a list, or every value of a dict
+WILDCARD = "*"
+
+
+def compile_batch_path(batch_path: Optional[str]) -> Optional[tuple]:
+    """
+    Split a batch_path, such as "*/customer/id", into its steps,
+    or None to select the items of a list value, otherwise the value itself
+    """
+    if batch_path is None:
+        return None
+    return tuple(step for step in batch_path.split("/") if step != "")
+
+
+def select_elements(value: Any, steps: Optional[tuple], path: str) -> Iterator[tuple[str, Any]]:
+    """
+    Yield a tuple of format (JSON pointer, element) for each element of a
+    validated value selected by the steps of a batch_path. Missing keys and
+    None values are skipped, as they are optional.
+    """
+    if steps is None:
+        steps = (WILDCARD,) if type(value) is list or hasattr(value, "tolist") else ()
+    yield from _select(value, steps, path)
+
+
+def _select(value, steps, path):
+    if value is None:
+        return
+    if not steps:
+        yield path, value
+        return
+    step, steps = steps[0], steps[1:]
+    if hasattr(value, "tolist") and not isinstance(value, (list, dict)):
+        # Validated as a numpy.ndarray (see Json ndarray)
+        value = value.tolist()
+    if isinstance(value, dict):
+        if step == WILDCARD:
+            for key, item in value.items():
+                yield from _select(item, steps, json_pointer(path, key))
+        elif step in value:
+            yield from _select(value[step], steps, json_pointer(path, step))
+    elif type(value) is list:
+        if step == WILDCARD:
+            for index, item in enumerate(value):
+                yield from _select(item, steps, json_pointer(path, index))
+        elif step.isdigit() and int(step) < len(value):
+            yield from _select(value[int(step)], steps, json_pointer(path, step))
+
+
+class BatchPlan:
+    """Parameters of a view function with a batch_func, grouped by their batch_func"""
+
+    def __init__(self, parameters: list):
+        """
+        :param parameters: ParameterPlans of the view function, in argument order
+        """
+        self.groups = {}
+        # Argument order, in which errors are reported
+        self.order = {parameter.name: index for index, parameter in enumerate(parameters)}
+        for parameter in parameters:
+            if parameter.batch_func is not None:
+                self.groups.setdefault(parameter.batch_func, []).append(parameter)
+
+    def __bool__(self) -> bool:
+        return bool(self.groups)
+
+    def validate(self, validated_inputs: dict, skip: frozenset = frozenset()) -> list[tuple[str, Exception]]:
+        """
+        Call each batch_func once with the selected elements of every parameter using it,
+        returning a tuple of format (argument name, error) for each invalid element, in argument order.
+        A ValidationError is returned for each invalid element. Other exceptions raised by a batch_func
+        are returned as the error of its first parameter, to be handled as those raised by a func are.
+
+        :param validated_inputs: validated values, by argument name
+        :param skip: names of arguments which failed validation, so aren't checked
+        """
+        failures = []
+        for batch_func, parameters in self.groups.items():
+            elements = [
+                (parameter, path, element)
+                for parameter in parameters
+                if parameter.name not in skip
+                for path, element in select_elements(
+                    validated_inputs.get(parameter.name), parameter.batch_steps, parameter.path
+                )
+            ]
+            if not elements:
+                continue
+            parameter = elements[0][0]
+            try:
+                verdicts = list(batch_func([element for _, _, element in elements]))
+            except ValueError as e:
+                # As with func, a ValueError is a validation error
+                failures.append((parameter, parameter.path, e))
+                continue
+            except Exception as e:
+                failures.append((parameter, None, e))
+                continue
+            if len(verdicts) != len(elements):
+                failures.append((parameter, parameter.path, ValueError(
+                    f"batch validator function returned {len(verdicts)} verdicts for {len(elements)} values"
+                )))
+                continue
+            for (parameter, path, _), verdict in zip(elements, verdicts):
+                try:
+                    check_func_result(verdict)
+                except ValueError as e:
+                    failures.append((parameter, path, e))
+        failures.sort(key=lambda failure: self.order[failure[0].name])
+        return [
+            (parameter.name, e if path is None else ValidationError(
+                str(e), parameter.expected_name, parameter.expected_input_type, path=path
+            ))
+            for parameter, path, e in failures
+        ]
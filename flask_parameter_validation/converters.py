@@ -0,0 +1,542 @@
+"""
+    Type-specialized converters.
+    A type annotation is compiled once into a tree of converter functions,
+    each taking the API user's input and returning a tuple of format
+    (converted user_input, validation_success), with the same semantics as
+    ValidateParameters._generic_types_validation_helper.
+    Containers are only copied when one of their items converts to a different
+    value, otherwise the user_input container itself is returned.
+"""
+import functools
+import json
+import sys
+import uuid
+import weakref
+from datetime import date, datetime, time
+from enum import Enum, EnumMeta
+from inspect import isclass
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Union, get_args, get_origin, get_type_hints
+
+from .exceptions import ValidationError
+from .parameter_types import File, Form, Json, Query, Route, Parameter
+from .settings import Settings
+
+# from 3.10 onwards, Unions written X | Y have the type UnionType
+UNION_TYPES = [Union]
+if sys.version_info >= (3, 10):
+    from types import UnionType
+    UNION_TYPES = [Union, UnionType]
+
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, Required, is_typeddict
+elif sys.version_info >= (3, 9):
+    from typing_extensions import NotRequired, Required, is_typeddict
+
+Converter = Callable[[Any], tuple[Any, bool]]
+
+# convert() implementations of the built-in sources, which leave a value of the
+# expected type untouched unless other types are allowed alongside it
+BUILTIN_CONVERTS = {source_class.convert for source_class in (Route, Json, Query, Form, File)}
+
+# Types of immutable values, which can be cached and shared between requests
+IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), date, time, datetime, uuid.UUID})
+
+# Types which the built-in sources may convert a value of another type into, other than from str
+NON_STR_CONVERTED_TYPES = frozenset({date, time, datetime, uuid.UUID})
+
+
+class SourceOptions(NamedTuple):
+    """Options of a source resolved from an app's settings, shared by the converters compiled for it"""
+
+    # Whether blank strings convert to None, or None to resolve it from the current app on each conversion
+    blank_none: Optional[bool] = None
+    # Memoized convert() of the source (see Parameter.create_conversion_cache), or None
+    conversion_cache: Optional[Callable] = None
+
+
+# Kinds of union member, for union dispatch
+_ANY, _LIST, _DICT, _VALUE = range(4)
+
+# Resolved TypedDict fields, shared by every parameter using the TypedDict
+_typeddict_fields = weakref.WeakKeyDictionary()
+
+
+def get_typeddict_fields(typeddict: type) -> tuple[Mapping[str, type], frozenset[str]]:
+    """
+    Resolve the type hints of a TypedDict once per process
+
+    :return: tuple of format (field types, with Required and NotRequired unwrapped, required keys)
+    """
+    fields = _typeddict_fields.get(typeddict)
+    if fields is None:
+        field_types = {}
+        for key, annotation_type in get_type_hints(typeddict).items():
+            # get the Required and NotRequired decorators out of the way, if present
+            if get_origin(annotation_type) is NotRequired or get_origin(annotation_type) is Required:
+                annotation_type = get_args(annotation_type)[0]
+            field_types[key] = annotation_type
+        fields = _typeddict_fields[typeddict] = (MappingProxyType(field_types), frozenset(typeddict.__required_keys__))
+    return fields
+
+
+def compile_converter(expected_name: str,
+                      expected_input_type: type,
+                      source: Parameter,
+                      other_union_allowed_types: list[type] = [],
+                      in_place: bool = False,
+                      settings: Optional[Settings] = None,
+                      conversion_cache: Optional[Callable] = None) -> Converter:
+    """
+    Compile a type annotation into a converter function for a single parameter source
+
+    :param expected_name: the name of the parameter we are checking against
+    :param expected_input_type: the type annotation of the parameter
+    :param source: the type of Parameter we are taking input from
+    :param other_union_allowed_types: the other types that are unioned at this level
+    :param in_place: whether to write converted items back into the user_input containers,
+        rather than into copies. If conversion fails, containers may be partially converted
+    :param settings: the settings of the app the converter is used for, whose config the source's options
+        default to, or None to resolve them from the current app on each conversion
+    :param conversion_cache: memoized convert() of the source, used for values of immutable types
+
+    :return: function of format converter(user_input) -> (converted user_input, validation_success)
+    """
+    options = SourceOptions(None if settings is None else source.get_blank_none(settings), conversion_cache)
+    return _compile(expected_name, expected_input_type, source, list(other_union_allowed_types), {}, in_place,
+                    options)
+
+
+def _compile(expected_name, expected_input_type, source, other_union_allowed_types, typeddicts, in_place,
+             options) -> Converter:
+    if get_origin(expected_input_type) in UNION_TYPES:
+        return _compile_union(expected_name, expected_input_type, source, typeddicts, in_place, options)
+    elif get_origin(expected_input_type) is list or expected_input_type is list:
+        return _compile_list(expected_name, expected_input_type, source, typeddicts, in_place, options)
+    elif is_typeddict(expected_input_type):
+        return _compile_typeddict(expected_name, expected_input_type, source, typeddicts, in_place, options)
+    elif get_origin(expected_input_type) is dict or expected_input_type is dict:
+        return _compile_dict(expected_name, expected_input_type, source, typeddicts, in_place, options)
+    return _compile_value(expected_name, expected_input_type, source, other_union_allowed_types, options)
+
+
+def _compile_union(expected_name, expected_input_type, source, typeddicts, in_place, options) -> Converter:
+    # check for unions (Optional is just a Union with None)
+    sub_expected_input_types = list(expected_input_type.__args__)
+    # a partially converted container would be seen by the next type in the union,
+    # so only convert in place if None is the only other type
+    if len([t for t in sub_expected_input_types if t is not type(None)]) > 1:
+        in_place = False
+    sub_converters = [
+        _compile(expected_name, sub_expected_input_type, source, sub_expected_input_types, typeddicts, in_place,
+                 options)
+        for sub_expected_input_type in sub_expected_input_types
+    ]
+    if type(source).convert in BUILTIN_CONVERTS:
+        enums = [t for t in sub_expected_input_types if isinstance(t, EnumMeta)]
+        # with several Enums, conversion depends on which is expected, as the expected one is tried first
+        if len(enums) <= 1:
+            return _compile_union_dispatch(source, sub_expected_input_types, sub_converters, enums)
+
+    def convert_union(user_input):
+        # go through each type in the union and see if we get a match
+        for sub_converter in sub_converters:
+            sub_converted_input, sub_success = sub_converter(user_input)
+            if sub_success:
+                return sub_converted_input, True
+        return user_input, False
+
+    return convert_union
+
+
+def _compile_union_dispatch(source, sub_expected_input_types, sub_converters, enums) -> Converter:
+    """
+    Compile a union into a converter which tries only the members that can accept the type of user_input.
+    Value members (i.e. not containers) are converted with the same allowed types, so for the built-in
+    sources they all convert the input to the same value, which is converted once and then matched against
+    each of their types. The members tried are decided once for each type of user_input.
+    """
+    members = [
+        (_member_kind(sub_expected_input_type), sub_expected_input_type, sub_converter)
+        for sub_expected_input_type, sub_converter in zip(sub_expected_input_types, sub_converters)
+    ]
+    accepts_singletons = type(source) is Form or type(source) is Query
+    # the built-in sources leave any other type of value unchanged, unless they can convert it into one of these
+    converts_non_str = bool(enums) or any(t in NON_STR_CONVERTED_TYPES for t in sub_expected_input_types)
+    dispatch = {}
+
+    def get_members(input_type):
+        input_members = []
+        for kind, sub_expected_input_type, sub_converter in members:
+            if kind == _LIST:
+                if input_type is list or accepts_singletons:
+                    input_members.append((kind, sub_expected_input_type, sub_converter))
+            elif kind == _DICT:
+                if input_type is dict or input_type is str:
+                    input_members.append((kind, sub_expected_input_type, sub_converter))
+            elif kind == _VALUE and input_type is not str and not converts_non_str:
+                # the value is unchanged, so only matches its own type, which can't fail
+                if sub_expected_input_type is input_type:
+                    input_members.append((_ANY, sub_expected_input_type, _convert_any))
+                    break
+            else:
+                input_members.append((kind, sub_expected_input_type, sub_converter))
+        return input_members
+
+    def convert_union(user_input):
+        input_members = dispatch.get(type(user_input))
+        if input_members is None:
+            input_members = dispatch[type(user_input)] = get_members(type(user_input))
+        converted = None
+        value_converted = False
+        # go through each type in the union that could accept the input and see if we get a match
+        for kind, sub_expected_input_type, sub_converter in input_members:
+            if kind == _VALUE:
+                if not value_converted:
+                    # converted by the first value member, which raises if the conversion fails
+                    converted = sub_converter(user_input)[0]
+                    value_converted = True
+                if type(converted) is sub_expected_input_type:
+                    return converted, True
+            else:
+                sub_converted_input, sub_success = sub_converter(user_input)
+                if sub_success:
+                    return sub_converted_input, True
+        return user_input, False
+
+    return convert_union
+
+
+def _member_kind(expected_input_type) -> int:
+    """The kind of converter _compile() compiles a union member into"""
+    if get_origin(expected_input_type) is list or expected_input_type is list:
+        return _LIST
+    elif is_typeddict(expected_input_type) or get_origin(expected_input_type) is dict or expected_input_type is dict:
+        return _DICT
+    elif expected_input_type is Any:
+        return _ANY
+    return _VALUE
+
+
+def _compile_list(expected_name, expected_input_type, source, typeddicts, in_place, options) -> Converter:
+    # if using a source that supports multidict style lists,
+    # give singletons the benefit of the doubt. they could still count
+    # as single-element lists
+    accepts_singletons = type(source) is Form or type(source) is Query
+    if len(get_args(expected_input_type)) == 0:
+        # expected type is just a bare list with no sub type
+        sub_expected_input_type = Any
+    else:
+        sub_expected_input_type = get_args(expected_input_type)[0]
+    sub_converter = _compile(expected_name, sub_expected_input_type, source, [], typeddicts, in_place, options)
+    convert_items = sub_expected_input_type is not Any
+
+    def convert_list(user_input):
+        if type(user_input) is not list:
+            if not accepts_singletons:
+                return user_input, False
+            user_input = _listify(user_input)
+        if len(user_input) == 1 and user_input[0] == "":
+            # treat arrays of a single empty string as an empty array to support the Query param &value=
+            return [], True
+        if not convert_items:
+            return user_input, True
+        # go through and validate each item in the array, until one converts to a different value
+        for index, inp in enumerate(user_input):
+            sub_converted_input, sub_success = sub_converter(inp)
+            if sub_converted_input is not inp or not sub_success:
+                break
+        else:
+            return user_input, True
+        if not sub_success:
+            return user_input, False
+        # then convert the rest into a copy
+        converted_list = user_input if in_place else user_input.copy()
+        converted_list[index] = sub_converted_input
+        for index in range(index + 1, len(user_input)):
+            sub_converted_input, sub_success = sub_converter(user_input[index])
+            if not sub_success:
+                return user_input, False
+            converted_list[index] = sub_converted_input
+        return converted_list, True
+
+    return convert_list
+
+
+def _listify(user_input) -> list:
+    if type(user_input) is str and len(user_input) > 0:
+        try:
+            user_input = json.loads(user_input)
+            # check for a stringified list e.g. '[1, 2]'
+            if type(user_input) is not list:
+                user_input = [user_input]
+        except ValueError:
+            user_input = [user_input]
+    else:
+        user_input = [user_input]
+    return user_input
+
+
+def _compile_typeddict(expected_name, expected_input_type, source, typeddicts, in_place, options) -> Converter:
+    if (expected_input_type, in_place) in typeddicts:
+        # recursive TypedDict, defer to the converter once it has been compiled
+        compiled = typeddicts[(expected_input_type, in_place)]
+        return compiled[0] or (lambda user_input: compiled[0](user_input))
+    compiled = typeddicts[(expected_input_type, in_place)] = [None]
+
+    field_types, required_keys = get_typeddict_fields(expected_input_type)
+    field_converters = {
+        key: _compile(expected_name, annotation_type, source, [], typeddicts, in_place, options)
+        for key, annotation_type in field_types.items()
+    }
+    required_keys = list(required_keys)
+
+    def convert_typeddict(user_input):
+        # check for a stringified dict (like from Query)
+        if type(user_input) is str:
+            try:
+                user_input = json.loads(user_input)
+            except ValueError:
+                return user_input, False
+        if type(user_input) is not dict:
+            return user_input, False
+        # check that we have all required keys
+        for key in required_keys:
+            if key not in user_input:
+                return user_input, False
+        converted_dict = None
+        # go through each user input key and make sure the value is the correct type
+        for key, value in user_input.items():
+            field_converter = field_converters.get(key)
+            if field_converter is None:
+                # we are strict in not allowing extra keys
+                # if you want extra keys, use NotRequired
+                return user_input, False
+            sub_converted_input, sub_success = field_converter(value)
+            if not sub_success:
+                return user_input, False
+            if converted_dict is None:
+                if sub_converted_input is value:
+                    continue
+                if in_place:
+                    user_input[key] = sub_converted_input
+                    continue
+                # copy on the first value converted to a different value
+                converted_dict = user_input.copy()
+            converted_dict[key] = sub_converted_input
+        return user_input if converted_dict is None else converted_dict, True
+
+    compiled[0] = convert_typeddict
+    return convert_typeddict
+
+
+def _compile_dict(expected_name, expected_input_type, source, typeddicts, in_place, options) -> Converter:
+    if len(get_args(expected_input_type)) == 0:
+        # expected type is just a bare dict with no sub types
+        key_expected_input_type = Any
+        val_expected_input_type = Any
+    else:
+        key_expected_input_type, val_expected_input_type = get_args(expected_input_type)
+    key_converter = _compile(expected_name, key_expected_input_type, source, [], typeddicts, in_place, options)
+    val_converter = _compile(expected_name, val_expected_input_type, source, [], typeddicts, in_place, options)
+    convert_items = key_expected_input_type is not Any or val_expected_input_type is not Any
+
+    def convert_dict(user_input):
+        # check for a stringified dict (like from Query or Form)
+        if type(user_input) is str and len(user_input) > 0:
+            try:
+                user_input = json.loads(user_input)
+            except ValueError:
+                return user_input, False
+        # check for a normal dict
+        if type(user_input) is not dict:
+            return user_input, False
+        if not convert_items:
+            return user_input, True
+        converted_dict = None
+        # go through and validate each key and value in the dict
+        for index, (key, val) in enumerate(user_input.items()):
+            key_converted_input, key_success = key_converter(key)
+            val_converted_input, val_success = val_converter(val)
+            if not key_success or not val_success:
+                return user_input, False
+            if converted_dict is None:
+                if key_converted_input is key:
+                    if val_converted_input is val:
+                        continue
+                    if in_place:
+                        user_input[key] = val_converted_input
+                        continue
+                # copy on the first key or value converted to a different value,
+                # without the keys after it, which may convert to other keys
+                converted_dict = dict(islice(user_input.items(), index))
+            converted_dict[key_converted_input] = val_converted_input
+        return user_input if converted_dict is None else converted_dict, True
+
+    return convert_dict
+
+
+def _compile_value(expected_name, expected_input_type, source, other_union_allowed_types, options) -> Converter:
+    if expected_input_type is Any:
+        return _convert_any
+
+    # include any other allowed types for proper conversion
+    allowed_types = [expected_input_type] + other_union_allowed_types
+    convert = source.convert
+    if type(source).convert in BUILTIN_CONVERTS and options.blank_none is not None:
+        convert = functools.partial(convert, blank_none=options.blank_none)
+    # the built-in sources only convert str and int values when other types are allowed alongside them,
+    # so values which already have the expected type can skip conversion
+    skip_converted = type(source).convert in BUILTIN_CONVERTS and (
+        expected_input_type not in (str, int) or set(allowed_types) == {expected_input_type}
+    )
+
+    # repeated input strings may be converted once, if every type they could be converted to is immutable
+    cached_convert = None
+    if type(source).convert in BUILTIN_CONVERTS and all(is_immutable_type(t) for t in allowed_types) and (
+        set(allowed_types) - {str, type(None)}
+    ):
+        cached_convert = options.conversion_cache
+
+    def convert_value(user_input):
+        if skip_converted and type(user_input) is expected_input_type:
+            return user_input, True
+        try:
+            user_input = convert(user_input, allowed_types)
+            # the actual "primative" type check
+            return user_input, type(user_input) is expected_input_type
+        except ValueError as e:
+            raise ValidationError(str(e), expected_name, expected_input_type)
+
+    if cached_convert is None:
+        return convert_value
+    cache_allowed_types = tuple(allowed_types)
+
+    def convert_value_cached(user_input):
+        # blank strings aren't cached, as their conversion depends on the blank_none config
+        if type(user_input) is not str or not user_input or (skip_converted and expected_input_type is str):
+            return convert_value(user_input)
+        try:
+            user_input = cached_convert(user_input, cache_allowed_types)
+            return user_input, type(user_input) is expected_input_type
+        except ValueError as e:
+            raise ValidationError(str(e), expected_name, expected_input_type)
+
+    return convert_value_cached
+
+
+def is_immutable_type(t) -> bool:
+    return t in IMMUTABLE_TYPES or isclass(t) and issubclass(t, Enum)
+
+
+def _convert_any(user_input):
+    # Any should always return true, no matter the input
+    return user_input, True
+
+
+def json_pointer(path: str, key: Any) -> str:
+    """Append a list index or dict key to a JSON pointer"""
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def explain_failure(expected_name: str,
+                    expected_input_type: type,
+                    source: Parameter,
+                    user_input: Any,
+                    path: str,
+                    settings: Optional[Settings] = None) -> list[ValidationError]:
+    """
+    Explain why user input failed conversion, as a ValidationError for each invalid
+    part of it, with its JSON pointer as the path. Only called once conversion has
+    already failed, so favours detail over speed.
+
+    :param path: JSON pointer to the user input
+    :param settings: the settings of the app the input was converted for (see compile_converter)
+    """
+    return _explain(expected_name, expected_input_type, source, user_input, path, {}, settings)
+
+
+def _explain(expected_name, expected_input_type, source, user_input, path, converters,
+             settings) -> list[ValidationError]:
+    def converts(sub_expected_input_type, sub_user_input) -> bool:
+        if sub_expected_input_type not in converters:
+            converters[sub_expected_input_type] = compile_converter(
+                expected_name, sub_expected_input_type, source, settings=settings
+            )
+        try:
+            return converters[sub_expected_input_type](sub_user_input)[1]
+        except ValidationError:
+            return False
+
+    def error(error_string, input_type=expected_input_type, error_path=path) -> ValidationError:
+        return ValidationError(error_string, expected_name, input_type, path=error_path)
+
+    type_errors = [error(f"must be type '{expected_input_type}'")]
+    errors = []
+
+    if get_origin(expected_input_type) in UNION_TYPES:
+        # only the member of an Optional can be blamed, other unions fail as a whole
+        sub_expected_input_types = [t for t in expected_input_type.__args__ if t is not type(None)]
+        if user_input is not None and len(sub_expected_input_types) == 1:
+            return _explain(expected_name, sub_expected_input_types[0], source, user_input, path, converters, settings)
+        return type_errors
+
+    elif get_origin(expected_input_type) is list or expected_input_type is list:
+        if type(user_input) is not list:
+            if type(source) is not Form and type(source) is not Query:
+                return type_errors
+            user_input = _listify(user_input)
+        sub_expected_input_type = get_args(expected_input_type)[0] if get_args(expected_input_type) else Any
+        for index, inp in enumerate(user_input):
+            if not converts(sub_expected_input_type, inp):
+                errors.extend(_explain(
+                    expected_name, sub_expected_input_type, source, inp, json_pointer(path, index), converters, settings
+                ))
+
+    elif is_typeddict(expected_input_type):
+        if type(user_input) is str:
+            try:
+                user_input = json.loads(user_input)
+            except ValueError:
+                return type_errors
+        if type(user_input) is not dict:
+            return type_errors
+        field_types, required_keys = get_typeddict_fields(expected_input_type)
+        for key in field_types:
+            if key in required_keys and key not in user_input:
+                errors.append(error(f"is missing required key '{key}'", error_path=json_pointer(path, key)))
+        for key, value in user_input.items():
+            if key not in field_types:
+                errors.append(error(f"has unexpected key '{key}'", error_path=json_pointer(path, key)))
+            elif not converts(field_types[key], value):
+                errors.extend(_explain(
+                    expected_name, field_types[key], source, value, json_pointer(path, key), converters, settings
+                ))
+
+    elif get_origin(expected_input_type) is dict or expected_input_type is dict:
+        if type(user_input) is str and len(user_input) > 0:
+            try:
+                user_input = json.loads(user_input)
+            except ValueError:
+                return type_errors
+        if type(user_input) is not dict:
+            return type_errors
+        key_expected_input_type, val_expected_input_type = get_args(expected_input_type) or (Any, Any)
+        for key, val in user_input.items():
+            if not converts(key_expected_input_type, key):
+                errors.append(error(
+                    f"key must be type '{key_expected_input_type}'", key_expected_input_type, json_pointer(path, key)
+                ))
+            if not converts(val_expected_input_type, val):
+                errors.extend(_explain(
+                    expected_name, val_expected_input_type, source, val, json_pointer(path, key), converters, settings
+                ))
+
+    else:
+        try:
+            compile_converter(expected_name, expected_input_type, source)(user_input)
+        except ValidationError as e:
+            return [error(e.args[0])]
+
+    return errors or type_errors
@@ -1,8 +1,11 @@
+import hashlib
+import json
+import re
 import sys
+from concurrent.futures import Executor
 from enum import Enum
 import flask
-from flask import Blueprint, current_app, jsonify
-from flask_parameter_validation import ValidateParameters
+from flask import Blueprint, current_app, jsonify, request
 
 if sys.version_info >= (3, 10):
     from types import UnionType
@@ -14,8 +17,39 @@ docs_blueprint = Blueprint(
 
 def get_route_docs():
     """
-    Generate documentation for all Flask routes that use the ValidateParameters decorator.
+    Get documentation for all Flask routes that use the ValidateParameters decorator.
     Returns a list of dictionaries, each containing documentation for a particular route.
+    Documentation is generated once per app, and regenerated only when its routes change.
+    """
+    return get_docs_cache()["docs"]
+
+
+def get_docs_cache():
+    """
+    Get the documentation cache of the current app, regenerating it if its routes have changed.
+    """
+    routes_key = get_routes_key()
+    cache = current_app.extensions.get("flask_parameter_validation.docs")
+    if cache is None or cache["routes_key"] != routes_key:
+        cache = {"routes_key": routes_key, "docs": generate_route_docs(), "responses": {}}
+        current_app.extensions["flask_parameter_validation.docs"] = cache
+    return cache
+
+
+def get_routes_key():
+    """
+    Identify the current app's routes and their view functions, which changes when either does.
+    """
+    view_functions = current_app.view_functions
+    return tuple(
+        (id(rule), id(view_functions.get(rule.endpoint)))
+        for rule in current_app.url_map.iter_rules()
+    )
+
+
+def generate_route_docs():
+    """
+    Generate documentation for all Flask routes that use the ValidateParameters decorator.
     """
     docs = []
     for rule in current_app.url_map.iter_rules():  # Iterate through all Flask Routes
@@ -35,15 +69,15 @@ def get_function_docs(func):
     Get documentation for a specific function that uses the ValidateParameters decorator.
     Returns a dictionary containing documentation details, or None if the decorator is not used.
     """
-    fn_list = ValidateParameters().get_fn_list()
-    for fsig, fdocs in fn_list.items():
-        if hasattr(func, "__fpv_discriminated_sig__") and func.__fpv_discriminated_sig__ == fsig:
-            return {
-                "docstring": format_docstring(fdocs.get("docstring")),
-                "decorators": fdocs.get("decorators"),
-                "args": extract_argument_details(fdocs),
-            }
-    return None
+    # The record is copied to the view function's wrappers, as with __fpv_discriminated_sig__
+    fdocs = getattr(func, "__fpv_docs__", None)
+    if fdocs is None:
+        return None
+    return {
+        "docstring": format_docstring(fdocs.get("docstring")),
+        "decorators": fdocs.get("decorators"),
+        "args": extract_argument_details(fdocs),
+    }
 
 
 def format_docstring(docstring):
@@ -112,6 +146,9 @@ def get_arg_location_details(fdocs, idx):
     loc_details = {}
     location = fdocs["argspec"].defaults[idx]
     for param, value in location.__dict__.items():
+        if param.startswith("_"):
+            # Skip internal state, such as compiled validators
+            continue
         if value is not None:
             if callable(value):
                 loc_details[param] = f"{value.__module__}.{value.__name__}"
@@ -123,6 +160,10 @@ def get_arg_location_details(fdocs, idx):
                     loc_details[param] += f"'{value.value}'"
                 else:
                     loc_details[param] = f"FPV: Unsupported Enum type"
+            elif isinstance(value, Executor):
+                loc_details[param] = type(value).__name__
+            elif isinstance(value, re.Pattern):
+                loc_details[param] = value.pattern
             elif type(value).__name__ == 'time':
                 loc_details[param] = value.isoformat()
             elif param == 'sources':
@@ -141,19 +182,45 @@ def http_badge_bg(http_method):
     return color_map.get(http_method, "bg-warning")
 
 
+def cached_docs_response(name, mimetype, render):
+    """
+    Respond with a rendering of the documentation, which is cached along with it,
+    and can be revalidated by clients with an ETag.
+    """
+    config = flask.current_app.config
+    docs_config = {
+        "site_name": config.get("FPV_DOCS_SITE_NAME", "Site"),
+        "custom_blocks": config.get("FPV_DOCS_CUSTOM_BLOCKS", []),
+        "default_theme": config.get("FPV_DOCS_DEFAULT_THEME", "light"),
+    }
+    cache = get_docs_cache()
+    # Config may be changed at runtime, so the rendering is cached per config
+    key = (name, json.dumps(docs_config, sort_keys=True, default=str))
+    if key not in cache["responses"]:
+        body = render(cache["docs"], docs_config)
+        if isinstance(body, flask.Response):
+            body = body.get_data()
+        elif isinstance(body, str):
+            body = body.encode()
+        cache["responses"][key] = (body, hashlib.sha1(body).hexdigest())
+    body, etag = cache["responses"][key]
+    response = flask.Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
 @docs_blueprint.route("/")
 def docs_html():
     """
     Render the documentation as an HTML page.
     """
-    config = flask.current_app.config
-    return flask.render_template(
+    return cached_docs_response("html", "text/html", lambda docs, docs_config: flask.render_template(
         "fpv_default_docs.html",
-        site_name=config.get("FPV_DOCS_SITE_NAME", "Site"),
-        docs=get_route_docs(),
-        custom_blocks=config.get("FPV_DOCS_CUSTOM_BLOCKS", []),
-        default_theme=config.get("FPV_DOCS_DEFAULT_THEME", "light"),
-    )
+        site_name=docs_config["site_name"],
+        docs=docs,
+        custom_blocks=docs_config["custom_blocks"],
+        default_theme=docs_config["default_theme"],
+    ))
 
 
 @docs_blueprint.route("/json")
@@ -161,12 +228,11 @@ def docs_json():
     """
     Provide the documentation as a JSON response.
     """
-    config = flask.current_app.config
-    return jsonify(
+    return cached_docs_response("json", "application/json", lambda docs, docs_config: jsonify(
         {
-            "site_name": config.get("FPV_DOCS_SITE_NAME", "Site"),
-            "docs": get_route_docs(),
-            "custom_blocks": config.get("FPV_DOCS_CUSTOM_BLOCKS", []),
-            "default_theme": config.get("FPV_DOCS_DEFAULT_THEME", "light"),
+            "site_name": docs_config["site_name"],
+            "docs": docs,
+            "custom_blocks": docs_config["custom_blocks"],
+            "default_theme": docs_config["default_theme"],
         }
-    )
+    ))
@@ -1,7 +1,9 @@
 class MissingInputError(Exception):
     """Called if a user doesn't suppy a mandatory input"""
-    def __init__(self, expected_name, expected_type):
+    def __init__(self, expected_name, expected_type, path=None):
         self.message = f"Missing required {expected_type.name} parameter '{expected_name}'."
+        # JSON pointer to the missing input, set when collecting errors
+        self.path = path
         super().__init__(expected_type.name, expected_name)
 
     def __str__(self):
@@ -18,10 +20,12 @@ class InvalidParameterTypeError(Exception):
 
 class ValidationError(Exception):
     """Called if parameter validation fails""" 
-    def __init__(self, error_string, input_name, input_type):
+    def __init__(self, error_string, input_name, input_type, path=None):
         self.message = (
             f"Parameter '{input_name}' {error_string}"
         )
+        # JSON pointer to the invalid input (or part of it), set when collecting errors
+        self.path = path
         super().__init__(error_string, input_name, input_type)
     
     def __str__(self):
@@ -0,0 +1,64 @@
+"""
+    Memoization of validator function results.
+    Results are kept by value, for values which are hashable (or lists of
+    hashable items), so that repeated checks of the same hot values don't
+    call the function again.
+"""
+import threading
+from collections import OrderedDict, namedtuple
+from time import monotonic
+from typing import Any, Callable, Optional
+
+FuncCacheInfo = namedtuple("FuncCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class FuncCache:
+    """
+    Least recently used cache of a validator function's results, optionally expiring them
+
+    :param maxsize: max number of results to keep
+    :param ttl: seconds after which a result is called for again, or None to keep results until evicted
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # Key to tuple of format (expiry time, or None, result), least recently used first
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable[[Any], Any], value: Any) -> Any:
+        """Get the result of func(value), calling it only if the result isn't cached"""
+        try:
+            # Keyed by type, as equal values of different types (such as 1 and True) may be judged differently
+            key = (list, tuple((type(item), item) for item in value)) if type(value) is list else (type(value), value)
+            hash(key)
+        except TypeError:
+            # Unhashable values, such as dicts, are always checked
+            return func(value)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and (cached[0] is None or cached[0] > monotonic()):
+                self._results.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        # Called without the lock, so that other values can be checked meanwhile
+        result = func(value)
+        with self._lock:
+            self._results[key] = (None if self.ttl is None else monotonic() + self.ttl, result)
+            self._results.move_to_end(key)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def info(self) -> FuncCacheInfo:
+        with self._lock:
+            return FuncCacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,126 @@
+"""
+    Precompiled JSON Schema validation.
+    The schema is checked and its validator built once, rather than by
+    jsonschema.validate() on every call.
+"""
+from typing import Any, Callable, Optional
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import Draft3Validator, validator_for
+
+# Keywords which only annotate a schema, and never affect validation
+ANNOTATION_KEYWORDS = {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+
+# Python types of instances each JSON type accepts without doubt, bool is excluded from numbers
+JSON_TYPES = {
+    "object": lambda instance: type(instance) is dict,
+    "array": lambda instance: type(instance) is list,
+    "string": lambda instance: type(instance) is str,
+    "integer": lambda instance: type(instance) is int,
+    "number": lambda instance: type(instance) is int or type(instance) is float,
+    "boolean": lambda instance: type(instance) is bool,
+    "null": lambda instance: instance is None,
+}
+
+
+class CompiledJsonSchema:
+    """A JSON Schema, checked and compiled into a reusable validator"""
+
+    def __init__(self, schema: dict):
+        """
+        :raises jsonschema.exceptions.SchemaError: if the schema itself is invalid
+        """
+        self.schema = schema
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self.validator = validator_class(schema, format_checker=validator_class.FORMAT_CHECKER)
+        # Draft 3 gives keywords such as "required" different meanings, so isn't fast-pathed
+        self.fast_check = None if validator_class is Draft3Validator else compile_fast_check(schema)
+
+    def validate(self, instance: Any) -> None:
+        """
+        Validate an instance against the schema
+
+        :raises jsonschema.exceptions.ValidationError: the best matching error, as with jsonschema.validate()
+        """
+        if self.fast_check is not None and self.fast_check(instance):
+            return
+        error = best_match(self.validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+
+def compile_fast_check(schema: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile common schema shapes (type, properties, required, items and simple bounds)
+    into a function returning True for instances which are certainly valid. Instances it
+    returns False for may still be valid, and must be checked by the full validator.
+
+    :return: the compiled function, or None if the schema uses unsupported keywords
+    """
+    if schema is True or schema == {}:
+        return lambda instance: True
+    if type(schema) is not dict:
+        return None
+    checks = []
+    for keyword, value in schema.items():
+        if keyword in ANNOTATION_KEYWORDS:
+            continue
+        check = _compile_keyword(keyword, value, schema)
+        if check is None:
+            return None
+        checks.append(check)
+    return lambda instance: all(check(instance) for check in checks)
+
+
+def _compile_keyword(keyword: str, value: Any, schema: dict) -> Optional[Callable[[Any], bool]]:
+    if keyword == "type":
+        type_names = [value] if type(value) is str else value
+        if type(type_names) is not list or any(type_name not in JSON_TYPES for type_name in type_names):
+            return None
+        type_checks = [JSON_TYPES[type_name] for type_name in type_names]
+        return lambda instance: any(type_check(instance) for type_check in type_checks)
+    elif keyword == "required":
+        if type(value) is not list:
+            return None
+        return lambda instance: type(instance) is not dict or all(key in instance for key in value)
+    elif keyword == "properties":
+        if type(value) is not dict:
+            return None
+        property_checks = {key: compile_fast_check(sub_schema) for key, sub_schema in value.items()}
+        if None in property_checks.values():
+            return None
+        return lambda instance: type(instance) is not dict or all(
+            property_check(instance[key]) for key, property_check in property_checks.items() if key in instance
+        )
+    elif keyword == "additionalProperties":
+        if "patternProperties" in schema:
+            return None
+        known_keys = schema.get("properties", {})
+        if value is False:
+            return lambda instance: type(instance) is not dict or all(key in known_keys for key in instance)
+        additional_check = compile_fast_check(value)
+        if additional_check is None:
+            return None
+        return lambda instance: type(instance) is not dict or all(
+            additional_check(sub_instance) for key, sub_instance in instance.items() if key not in known_keys
+        )
+    elif keyword == "items":
+        items_check = compile_fast_check(value)
+        if items_check is None:
+            return None
+        return lambda instance: type(instance) is not list or all(items_check(item) for item in instance)
+    elif keyword in ("minItems", "maxItems", "minLength", "maxLength", "minProperties", "maxProperties"):
+        if type(value) is not int:
+            return None
+        applies_to = {"Items": list, "Length": str, "Properties": dict}[keyword[3:]]
+        if keyword.startswith("min"):
+            return lambda instance: type(instance) is not applies_to or len(instance) >= value
+        return lambda instance: type(instance) is not applies_to or len(instance) <= value
+    elif keyword in ("minimum", "maximum"):
+        if type(value) not in (int, float):
+            return None
+        if keyword == "minimum":
+            return lambda instance: not JSON_TYPES["number"](instance) or instance >= value
+        return lambda instance: not JSON_TYPES["number"](instance) or instance <= value
+    return None
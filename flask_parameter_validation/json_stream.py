@@ -0,0 +1,179 @@
+"""
+    Incremental parsing of JSON array request bodies.
+    Array items are decoded one at a time from the request stream, so that
+    only the item being decoded (and one read chunk) is held in memory.
+"""
+import codecs
+import json
+import re
+from typing import IO, Any, Iterator
+
+# Characters which may follow a complete JSON array item
+ITEM_DELIMITERS = " \t\n\r,]"
+
+WHITESPACE = " \t\n\r"
+
+# Characters which may continue a JSON number
+NUMBER_CHARACTERS = frozenset("0123456789+-.eE")
+
+# Literals which may be cut off by the end of the buffer, including "-" of a negative number
+LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+# \uXXXX escapes (or surrogate pairs of them) which may be cut off by the end of the buffer
+PARTIAL_UNICODE_ESCAPE = re.compile(r"u[0-9a-fA-F]{0,4}(\\(u[0-9a-fA-F]{0,4})?)?")
+
+# Max number of characters buffered for a single item
+MAX_ITEM_SIZE = 16 * 1024 * 1024
+
+
+class JsonArrayParser:
+    """
+    Iterator over the items of a JSON array, decoded incrementally from a binary stream
+
+    :raises ValueError: if the stream isn't a single valid JSON array
+    """
+
+    def __init__(self, stream: IO[bytes], chunk_size: int = 65536, max_item_size: int = MAX_ITEM_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.max_item_size = max_item_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        # Characters discarded from the start of the buffer, for error offsets
+        self.discarded = 0
+        self.exhausted = False
+        self.started = False
+        self.finished = False
+        # Decodes UTF-8 split across chunks
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    def is_empty(self) -> bool:
+        """Whether the stream contains only whitespace"""
+        return self._peek() is None
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        if self.finished:
+            raise StopIteration
+        if not self.started:
+            if self._peek() != "[":
+                raise ValueError("expected a JSON array")
+            self.position += 1
+            self.started = True
+            if self._peek() == "]":
+                self._finish()
+        else:
+            char = self._peek()
+            if char == "]":
+                self._finish()
+            if char != ",":
+                raise ValueError(f"expected ',' or ']' at offset {self.offset}")
+            self.position += 1
+        if self._peek() is None:
+            raise ValueError("unexpected end of JSON array")
+        return self._decode_item()
+
+    def _decode_item(self) -> Any:
+        # Read sizes double while an item is incomplete, so large items aren't re-decoded once per chunk
+        read_size = self.chunk_size
+        while True:
+            try:
+                item, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                # Only read on if the item may continue past the end of the buffer, so malformed items fail fast
+                if self.exhausted or not self._is_incomplete(e):
+                    raise ValueError(f"invalid JSON array item at offset {self.offset}")
+                self._read_item(read_size)
+                read_size *= 2
+                continue
+            if end == len(self.buffer) or self.buffer[end] not in ITEM_DELIMITERS:
+                # A number at the end of the buffer may continue in the next chunk
+                if not self.exhausted and NUMBER_CHARACTERS.issuperset(self.buffer[end:]):
+                    self._read_item(read_size)
+                    read_size *= 2
+                    continue
+                if end < len(self.buffer):
+                    raise ValueError(f"invalid JSON array item at offset {self.offset}")
+            self.position = end
+            return item
+
+    def _is_incomplete(self, error: json.JSONDecodeError) -> bool:
+        """Whether a decoding error may be caused by the end of the buffer cutting off the item"""
+        if error.pos >= len(self.buffer) or error.msg.startswith("Unterminated string"):
+            return True
+        rest = self.buffer[error.pos:]
+        if NUMBER_CHARACTERS.issuperset(rest):
+            # A number nested in the item, which may continue in the next chunk
+            return True
+        if error.msg.startswith("Invalid \\uXXXX escape"):
+            return PARTIAL_UNICODE_ESCAPE.fullmatch(rest) is not None
+        return error.msg == "Expecting value" and any(literal.startswith(rest) for literal in LITERALS)
+
+    def _read_item(self, size: int) -> None:
+        """Read more of an incomplete item, unless it is already larger than max_item_size"""
+        remaining = self.max_item_size - (len(self.buffer) - self.position)
+        if remaining < 0:
+            raise ValueError(f"JSON array item at offset {self.offset} is larger than {self.max_item_size} characters")
+        # Reading at most one character past the limit shows whether the item exceeds it
+        self._read(min(size, remaining + 1))
+
+    @property
+    def offset(self) -> int:
+        """Offset of the next character in the stream, in characters"""
+        return self.discarded + self.position
+
+    def _finish(self):
+        self.position += 1
+        if self._peek() is not None:
+            raise ValueError("unexpected data after JSON array")
+        self.finished = True
+        raise StopIteration
+
+    def _peek(self):
+        """Skip whitespace, returning the next character, or None at the end of the stream"""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if self.exhausted:
+                return None
+            self._read(self.chunk_size)
+
+    def _read(self, size: int) -> None:
+        # Discard decoded items, so the buffer only grows to the size of the largest item
+        self.buffer = self.buffer[self.position:]
+        self.discarded += self.position
+        self.position = 0
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.exhausted = True
+            self.buffer += self._utf8.decode(b"", final=True)
+        else:
+            self.buffer += self._utf8.decode(chunk)
+
+
+class ValidatedJsonArray:
+    """
+    Iterator over the validated items of a streamed JSON array, given to view functions.
+    If an item is invalid, iteration raises the validation error, which is also kept as error.
+    """
+
+    def __init__(self, items: Iterator[Any]):
+        self._items = items
+        self.error = None
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise
+        except Exception as e:
+            self.error = e
+            raise
@@ -0,0 +1,140 @@
+"""
+    Validation timing and failure metrics.
+    Signals are only sent while they have receivers, so routes pay nothing
+    for instrumentation that isn't in use.
+"""
+import threading
+from collections import Counter, defaultdict, deque
+from typing import Optional
+
+from blinker import Namespace
+
+_signals = Namespace()
+
+# Sent after each request is validated, with the app as sender and the keyword arguments:
+#   endpoint: the Flask endpoint of the validated route
+#   total: seconds spent validating the request, including parsing its JSON body
+#   parameters: dict of parameter name to dict of phase name ("extraction", "conversion",
+#       "constraints" or "json_schema") to seconds spent in that phase
+#   validated: whether validation succeeded
+validation_timed = _signals.signal("validation-timed")
+
+# Sent for each validation error, with the app as sender and the keyword arguments:
+#   endpoint: the Flask endpoint of the validated route
+#   parameter: the name of the invalid parameter, or None if the request body couldn't be parsed
+#   reason: the class name of the error, e.g. "MissingInputError" or "ValidationError"
+#   error: the error itself
+validation_failed = _signals.signal("validation-failed")
+
+
+class ValidationMetrics:
+    """
+    In-process aggregator of validation timings and failures, per endpoint
+
+    :param app: the Flask app to collect metrics for, see init_app()
+    :param max_samples: how many of the most recent request timings to keep per endpoint
+    """
+
+    def __init__(self, app=None, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        # Apps collected for, whose routes' func caches are summarized
+        self._apps = []
+        self.reset()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        """Start collecting metrics for routes of the given app"""
+        app.extensions["flask_parameter_validation.metrics"] = self
+        self._apps.append(app)
+        validation_timed.connect(self._on_validation_timed, sender=app)
+        validation_failed.connect(self._on_validation_failed, sender=app)
+
+    def reset(self) -> None:
+        """Discard all collected metrics"""
+        with self._lock:
+            self._durations = defaultdict(lambda: deque(maxlen=self.max_samples))
+            self._phases = defaultdict(float)
+            # Validation failures, keyed by (endpoint, parameter, reason)
+            self.failures = Counter()
+
+    def percentile(self, endpoint: str, percent: float) -> Optional[float]:
+        """
+        Get the given percentile of validation time for an endpoint, in seconds
+
+        :return: the percentile, or None if no requests to the endpoint have been validated
+        """
+        with self._lock:
+            durations = sorted(self._durations.get(endpoint, ()))
+        if not durations:
+            return None
+        # Nearest-rank percentile
+        rank = max(1, -(-len(durations) * percent // 100))
+        return durations[int(rank) - 1]
+
+    def summary(self) -> dict:
+        """
+        Summarize collected metrics, as a dict of endpoint to dict of format
+        {"count": int, "p50": float, "p99": float, "parameters": {parameter: {phase: total seconds}},
+        "failures": {parameter: {reason: int}}, "func_cache": {parameter: {"hits": int, "misses": int,
+        "maxsize": int, "currsize": int}}}. Func cache counters are kept by each parameter, so aren't reset.
+        """
+        with self._lock:
+            endpoints = set(self._durations) | {endpoint for endpoint, _, _ in self.failures}
+            counts = {endpoint: len(durations) for endpoint, durations in self._durations.items()}
+            phases = dict(self._phases)
+            failures = dict(self.failures)
+        func_caches = self.func_cache_info()
+        endpoints |= {endpoint for endpoint, _ in func_caches}
+        summary = {}
+        for endpoint in endpoints:
+            summary[endpoint] = {
+                "count": counts.get(endpoint, 0),
+                "p50": self.percentile(endpoint, 50),
+                "p99": self.percentile(endpoint, 99),
+                "parameters": {},
+                "failures": {},
+                "func_cache": {},
+            }
+        for (endpoint, parameter, phase), seconds in phases.items():
+            summary[endpoint]["parameters"].setdefault(parameter, {})[phase] = seconds
+        for (endpoint, parameter, reason), count in failures.items():
+            summary[endpoint]["failures"].setdefault(parameter, {})[reason] = count
+        for (endpoint, parameter), info in func_caches.items():
+            summary[endpoint]["func_cache"][parameter] = info._asdict()
+        return summary
+
+    def func_cache_info(self) -> dict:
+        """
+        Get the hits, misses, maxsize and currsize of the func result cache (see Parameter func_cache)
+        of each parameter using one, as a dict keyed by (endpoint, parameter)
+        """
+        infos = {}
+        for app in self._apps:
+            for endpoint, view_function in app.view_functions.items():
+                plan = getattr(view_function, "__fpv_plan__", None)
+                if plan is None:
+                    continue
+                for parameter in plan.parameters:
+                    # MultiSource parameters have a cache per source
+                    source_infos = [
+                        source.func_cache_info() for source in parameter.sources
+                        if hasattr(source, "func_cache_info") and source.func_cache_info() is not None
+                    ]
+                    if source_infos:
+                        infos[(endpoint, parameter.name)] = type(source_infos[0])(
+                            *(sum(counts) for counts in zip(*source_infos))
+                        )
+        return infos
+
+    def _on_validation_timed(self, sender, endpoint, total, parameters, **extra):
+        with self._lock:
+            self._durations[endpoint].append(total)
+            for parameter, phases in parameters.items():
+                for phase, seconds in phases.items():
+                    self._phases[(endpoint, parameter, phase)] += seconds
+
+    def _on_validation_failed(self, sender, endpoint, parameter, reason, **extra):
+        with self._lock:
+            self.failures[(endpoint, parameter, reason)] += 1
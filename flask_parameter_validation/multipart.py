@@ -0,0 +1,141 @@
+"""
+    Early rejection of invalid multipart uploads.
+    File parameters' content_types and max_length are checked while the
+    request body is parsed, so that an upload is rejected as soon as it is
+    known to be invalid, rather than once it has been received and spooled.
+"""
+import functools
+from typing import Any, Optional
+
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
+from werkzeug.formparser import FormDataParser, MultiPartParser
+from werkzeug.http import parse_options_header
+
+from .exceptions import ValidationError
+from .parameter_types import File
+
+
+class RejectedUpload(Exception):
+    """Raised while parsing a multipart body, once an uploaded file fails a File parameter's check"""
+
+    def __init__(self, parameter, error: ValueError):
+        """
+        :param parameter: the ParameterPlan of the file's argument
+        :param error: the failed check
+        """
+        # Name of the view function argument, as reported to metrics
+        self.argument = parameter.name
+        self.error = ValidationError(
+            str(error), parameter.expected_name, parameter.expected_input_type, path=parameter.path
+        )
+        super().__init__(self.error.message)
+
+
+class RejectedUploadType(RejectedUpload, BadRequest):
+    """An uploaded file's content type isn't one of its File parameter's content_types"""
+
+
+class RejectedUploadLength(RejectedUpload, RequestEntityTooLarge):
+    """An uploaded file is longer than its File parameter's max_length"""
+
+
+def compile_upload_limits(parameters: list) -> Optional[Any]:
+    """
+    Get the form_data_parser_class checking the uploads of a view function's File parameters
+    with a content_types or max_length as they are parsed, or None if it has none
+    """
+    limits = {}
+    for parameter in parameters:
+        for source in parameter.sources:
+            if isinstance(source, File) and (source.content_types is not None or source.max_length is not None):
+                limits[parameter.expected_name] = (parameter, source)
+    if not limits:
+        return None
+    return functools.partial(UploadLimitedFormDataParser, upload_limits=limits)
+
+
+class UploadLimitedFormDataParser(FormDataParser):
+    """FormDataParser checking uploads against File parameters, by field name"""
+
+    def __init__(self, *args, upload_limits: dict, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.upload_limits = upload_limits
+
+    def parse(self, stream, mimetype, content_length, options=None):
+        if mimetype != "multipart/form-data":
+            return super().parse(stream, mimetype, content_length, options)
+        # FormDataParser has no hook choosing its multipart parser, so multipart bodies
+        # are parsed here, with only the public MultiPartParser API
+        parser = UploadLimitedMultiPartParser(
+            self.upload_limits,
+            stream_factory=self.stream_factory,
+            max_form_memory_size=self.max_form_memory_size,
+            max_form_parts=self.max_form_parts,
+            cls=self.cls,
+        )
+        try:
+            boundary = (options or {}).get("boundary", "").encode("ascii")
+            if not boundary:
+                raise ValueError("Missing boundary")
+            form, files = parser.parse(stream, boundary, content_length)
+        except ValueError:
+            if not self.silent:
+                raise
+            return stream, self.cls(), self.cls()
+        return stream, form, files
+
+
+class UploadLimitedMultiPartParser(MultiPartParser):
+    def __init__(self, upload_limits: dict, **kwargs):
+        super().__init__(**kwargs)
+        self.upload_limits = upload_limits
+
+    def start_file_streaming(self, event, total_content_length):
+        limit = self.upload_limits.get(event.name)
+        if limit is None:
+            return super().start_file_streaming(event, total_content_length)
+        parameter, source = limit
+        # Checked before any of the file is received
+        try:
+            # Lowercase, as FileStorage.mimetype is
+            source.validate_content_type(parse_options_header(event.headers.get("content-type"))[0].lower())
+        except ValueError as e:
+            raise RejectedUploadType(parameter, e)
+        container = super().start_file_streaming(event, total_content_length)
+        if source.max_length is None:
+            return container
+        return LengthLimitedContainer(container, parameter, source)
+
+    def parse(self, stream, boundary, content_length):
+        form, files = super().parse(stream, boundary, content_length)
+        # Give views the files themselves, rather than the containers checking their length
+        for _, storage in files.items(multi=True):
+            if isinstance(storage.stream, LengthLimitedContainer):
+                storage.stream = storage.stream.container
+        return form, files
+
+
+class LengthLimitedContainer:
+    """Container of an uploaded file, rejecting it once more than its File parameter's max_length is written"""
+
+    def __init__(self, container, parameter, source: File):
+        self.container = container
+        self.parameter = parameter
+        self.source = source
+        self.length = 0
+
+    def write(self, data: bytes) -> int:
+        self.length += len(data)
+        try:
+            self.source.validate_max_length(self.length)
+        except ValueError as e:
+            # The rest of the file isn't received
+            self.container.close()
+            raise RejectedUploadLength(self.parameter, e)
+        return self.container.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.container, name)
+
+    def __iter__(self):
+        return iter(self.container)
@@ -25,13 +25,17 @@ class File(Parameter):
         self.min_length = min_length
         self.max_length = max_length
 
-    def validate(self, value: FileStorage):
+    def iter_errors(self, value: FileStorage, timings=None):
+        try:
+            self.validate(value)
+        except ValueError as e:
+            yield None, e
+
+    def validate(self, value: FileStorage, timings=None):
         # Content type validation
         if self.content_types is not None:
             # We check mimetype, as it strips charset etc.
-            if value.mimetype not in self.content_types:
-                valid_types = "'" + "'/'".join(self.content_types) + "'"
-                raise ValueError(f"must have content-type {valid_types}.")
+            self.validate_content_type(value.mimetype)
 
         # Min content length validation
         if self.min_length is not None:
@@ -45,9 +49,19 @@ class File(Parameter):
         # Max content length validation
         if self.max_length is not None:
             origin = value.stream.tell()
-            if value.stream.seek(0, io.SEEK_END) > self.max_length:
-                raise ValueError(
-                    f"must have a content-length at most {self.max_length}."
-                )
+            self.validate_max_length(value.stream.seek(0, io.SEEK_END))
             value.stream.seek(origin)
         return True
+
+    def validate_content_type(self, mimetype: str):
+        """Validate a file's mimetype, also checked as a multipart body is parsed (see multipart)"""
+        if self.content_types is not None and mimetype not in self.content_types:
+            valid_types = "'" + "'/'".join(self.content_types) + "'"
+            raise ValueError(f"must have content-type {valid_types}.")
+
+    def validate_max_length(self, length: int):
+        """Validate a file's length, also checked as a multipart body is parsed (see multipart)"""
+        if self.max_length is not None and length > self.max_length:
+            raise ValueError(
+                f"must have a content-length at most {self.max_length}."
+            )
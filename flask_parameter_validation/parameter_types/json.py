@@ -7,5 +7,17 @@ from .parameter import Parameter
 class Json(Parameter):
     name = "json"
 
-    def __init__(self, default=None, **kwargs):
+    def __init__(
+        self,
+        default=None,
+        stream=None,  # bool: Whether to validate a JSON array body item by item as it is iterated, rather than loading it whole
+        ndarray=None,  # bool: Whether list[int] and list[float] values should be given as a numpy.ndarray, rather than a list
+        **kwargs
+    ):
         super().__init__(default, **kwargs)
+        self.stream = stream
+        self.ndarray = ndarray
+        if stream and (self.json_schema is not None or self.func is not None or self.batch_func is not None):
+            raise ValueError("json_schema, func and batch_func can't be used with stream, as they check the whole list")
+        if stream and ndarray:
+            raise ValueError("ndarray can't be used with stream, as streamed items are given one at a time")
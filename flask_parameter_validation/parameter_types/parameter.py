@@ -2,15 +2,19 @@
     Base Parameter class.
     Should only be used as child class for other params.
 """
+import functools
 import re
 import uuid
+from time import perf_counter
 from datetime import date, datetime, time
 from enum import Enum
 import dateutil.parser as parser
-import jsonschema
 from jsonschema.exceptions import ValidationError as JSONSchemaValidationError
 import flask
 from inspect import isclass
+from ..func_cache import FuncCache
+from ..json_schema import CompiledJsonSchema
+from ..settings import get_settings
 
 class Parameter:
 
@@ -26,7 +30,7 @@ class Parameter:
             max_int=None,  # int: max number (if val is int)
             whitelist=None,  # str: character whitelist
             blacklist=None,  # str: character blacklist
-            pattern=None,  # str: regexp pattern
+            pattern=None,  # Union[str, re.Pattern]: regexp pattern
             func=None,  # Callable -> Union[bool, tuple[bool, str]]: function performing a fully customized validation
             datetime_format=None,
             # str: datetime format string (https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes),
@@ -35,6 +39,14 @@ class Parameter:
             json_schema=None,  # dict: JSON Schema to check received dicts or lists against
             blank_none=None,  # bool: Whether blank strings should be converted to None when validating a type of Optional[str]
             list_disable_query_csv=None,  # bool: Whether query strings should be split by `,` when validating a type of list
+            pattern_fullmatch=None,  # bool: Whether pattern must match the whole value, rather than just its start
+            convert_in_place=None,  # bool: Whether list and dict inputs should be converted in place, rather than copied
+            conversion_cache=None,  # int: max number of converted input strings to cache, 0 disables caching
+            func_executor=None,  # concurrent.futures.Executor: executor to call func in, such as a ProcessPoolExecutor
+            func_cache=None,  # int: max number of func results to memoize by value, 0 disables memoization
+            func_cache_ttl=None,  # float: seconds for which memoized func results are used, defaults to until evicted
+            batch_func=None,  # Callable[[list], Sequence[Union[bool, tuple[bool, str]]]]: function validating every selected element of the request at once
+            batch_path=None,  # str: path to the elements checked by batch_func, such as "*/sku", defaults to the items of a list
     ):
         self.default = default
         self.min_list_length = min_list_length
@@ -51,122 +63,197 @@ class Parameter:
         self.comment = comment
         self.alias = alias
         self.json_schema = json_schema
+        # Checked and compiled once, so that invalid schemas fail at startup
+        self._json_schema_validator = CompiledJsonSchema(json_schema) if json_schema is not None else None
         self.blank_none = blank_none
         self.list_disable_query_csv = list_disable_query_csv
-
+        self.pattern_fullmatch = pattern_fullmatch
+        self.convert_in_place = convert_in_place
+        self.conversion_cache = conversion_cache
+        self.func_executor = func_executor
+        self.func_cache = func_cache
+        self.func_cache_ttl = func_cache_ttl
+        if func_cache_ttl is not None and not func_cache:
+            raise ValueError("func_cache_ttl requires a func_cache size")
+        self._func_cache = FuncCache(func_cache, func_cache_ttl) if func and func_cache else None
+        self.batch_func = batch_func
+        self.batch_path = batch_path
+        # Compiled once, so that each validated value is checked in a single pass
+        self._pattern = None
+        self._pattern_match = None
+        if pattern is not None:
+            self._pattern = re.compile(pattern)
+            self._pattern_match = self._pattern.fullmatch if pattern_fullmatch else self._pattern.match
+        self._whitelist_search = compile_whitelist(whitelist) if whitelist is not None else None
+        self._blacklist_search = compile_blacklist(blacklist) if blacklist is not None else None
 
     def func_helper(self, v):
-        func_result = self.func(v)
-        if type(func_result) is bool:
-            if not func_result:
+        if self._func_cache is None:
+            func_result = self.call_func(v)
+        else:
+            # Results are memoized as returned, so cached (bool, str) results keep their messages
+            func_result = self._func_cache.call(self.call_func, v)
+        check_func_result(func_result)
+
+    def call_func(self, v):
+        if self.func_executor is None:
+            return self.func(v)
+        # The calling thread waits, but other parameters may be checked meanwhile (see ValidateParameters executor)
+        return self.func_executor.submit(self.func, v).result()
+
+    # Validator
+    def validate(self, value, timings=None):
+        for index, error in self.iter_errors(value, timings):
+            raise error
+        return True
+
+    def iter_errors(self, value, timings=None):
+        """
+        Yield a tuple of format (list index, or None for the whole value, ValueError)
+        for each value failing validation, stopping at the first failed check of each value
+
+        :param timings: if given, seconds spent on JSON Schema validation are added to its "json_schema" key
+        """
+        if type(value) is list:
+            try:
+                self.validate_list(value, timings)
+            except ValueError as e:
+                yield None, e
+            if self.has_item_checks(in_list=True):
+                # Iterate through values given
+                for index, item in enumerate(value):
+                    try:
+                        self.validate_item(item, in_list=True)
+                    except ValueError as e:
+                        yield index, e
+        else:
+            try:
+                if type(value) is dict:
+                    self.validate_json_schema(value, timings)
+                self.validate_item(value)
+            except ValueError as e:
+                yield None, e
+
+    def validate_list(self, value, timings=None):
+        # Min list len
+        if self.min_list_length is not None:
+            if len(value) < self.min_list_length:
                 raise ValueError(
-                    "value does not match the validator function."
+                    f"must have at least {self.min_list_length} items."
                 )
-        elif type(func_result) is tuple:
-            if len(func_result) == 2 and type(func_result[0]) is bool and type(func_result[1]) is str:
-                if not func_result[0]:
-                    raise ValueError(
-                        func_result[1]
-                    )
-            else:
+        # Max list len
+        if self.max_list_length is not None:
+            if len(value) > self.max_list_length:
                 raise ValueError(
-                    f"validator function returned incorrect type: {str(type(func_result))}, should return bool or (bool, str)"
+                    f"must have have a maximum of {self.max_list_length} items."
                 )
+        if self.func is not None:
+            self.func_helper(value)
+        self.validate_json_schema(value, timings)
 
-    # Validator
-    def validate(self, value):
-        original_value_type_list = type(value) is list
-        if type(value) is list:
-            values = value
-            # Min list len
-            if self.min_list_length is not None:
-                if len(value) < self.min_list_length:
-                    raise ValueError(
-                        f"must have at least {self.min_list_length} items."
-                    )
-            # Max list len
-            if self.max_list_length is not None:
-                if len(value) > self.max_list_length:
-                    raise ValueError(
-                        f"must have have a maximum of {self.max_list_length} items."
-                    )
-            if self.func is not None:
-                self.func_helper(value)
-            if self.json_schema is not None:
-                try:
-                    jsonschema.validate(value, self.json_schema)
-                except JSONSchemaValidationError as e:
-                    raise ValueError(f"failed JSON Schema validation: {e.args[0]}")
-        elif type(value) is dict:
-            if self.json_schema is not None:
-                try:
-                    jsonschema.validate(value, self.json_schema)
-                except JSONSchemaValidationError as e:
-                    raise ValueError(f"failed JSON Schema validation: {e.args[0]}")
-            values = [value]
-        else:
-            values = [value]
-
-        # Iterate through values given (or just one, if not list)
-        for value in values:
-            # Min length
-            if self.min_str_length is not None:
-                if len(value) < self.min_str_length:
-                    raise ValueError(
-                        f"must have at least {self.min_str_length} characters."
-                    )
-            # Max length
-            if self.max_str_length is not None:
-                if len(value) > self.max_str_length:
-                    raise ValueError(
-                        f"must have a maximum of {self.max_str_length} characters."
-                    )
-            # Whitelist
-            if self.whitelist is not None:
-                for char in str(value):
-                    if char not in self.whitelist:
-                        raise ValueError(
-                            f"must contain only characters: {self.whitelist}"
-                        )
-            # Blacklist
-            if self.blacklist is not None:
+    def validate_json_schema(self, value, timings=None):
+        if self._json_schema_validator is not None:
+            started = perf_counter() if timings is not None else None
+            try:
+                self._json_schema_validator.validate(value)
+            except JSONSchemaValidationError as e:
+                raise ValueError(f"failed JSON Schema validation: {e.args[0]}")
+            finally:
+                if timings is not None:
+                    timings["json_schema"] = timings.get("json_schema", 0.0) + perf_counter() - started
+
+    def has_expensive_checks(self):
+        """Whether validate() may call func or check a JSON Schema, which can be offloaded to an executor"""
+        return self.func is not None or self._json_schema_validator is not None
+
+    def has_item_checks(self, in_list=False):
+        """Whether validate_item() checks anything"""
+        if self.func is not None and not in_list:
+            return True
+        checks = (self.min_str_length, self.max_str_length, self.whitelist, self.blacklist,
+                  self.min_int, self.max_int, self._pattern_match)
+        return any(check is not None for check in checks)
+
+    def validate_item(self, value, in_list=False):
+        """Validate a single value, or a single item of a list value"""
+        # Min length
+        if self.min_str_length is not None:
+            if len(value) < self.min_str_length:
+                raise ValueError(
+                    f"must have at least {self.min_str_length} characters."
+                )
+        # Max length
+        if self.max_str_length is not None:
+            if len(value) > self.max_str_length:
+                raise ValueError(
+                    f"must have a maximum of {self.max_str_length} characters."
+                )
+        # Whitelist
+        if self.whitelist is not None:
+            if self._whitelist_search(str(value)) is not None:
+                raise ValueError(
+                    f"must contain only characters: {self.whitelist}"
+                )
+        # Blacklist
+        if self.blacklist is not None:
+            value_str = str(value)
+            if self._blacklist_search is None or self._blacklist_search(value_str) is not None:
+                # Report the first blacklisted item, in blacklist order
                 for bad in self.blacklist:
-                    if bad in str(value):
+                    if bad in value_str:
                         raise ValueError(
                             f"must not contain: {bad}"
                         )
-            # Min int
-            if self.min_int is not None:
-                if int(value) < self.min_int:
-                    raise ValueError(
-                        f"must be at least {self.min_int}."
-                    )
-            # Max int
-            if self.max_int is not None:
-                if int(value) > self.max_int:
-                    raise ValueError(
-                        f"must be at most {self.max_int}."
-                    )
-
-            # Regexp
-            if self.pattern is not None:
-                if not re.match(self.pattern, value):
-                    raise ValueError(
-                        f"pattern does not match: {self.pattern}."
-                    )
-
-            # Callable (non-list)
-            if self.func is not None and not original_value_type_list:
-                self.func_helper(value)
+        # Min int
+        if self.min_int is not None:
+            if int(value) < self.min_int:
+                raise ValueError(
+                    f"must be at least {self.min_int}."
+                )
+        # Max int
+        if self.max_int is not None:
+            if int(value) > self.max_int:
+                raise ValueError(
+                    f"must be at most {self.max_int}."
+                )
 
-        return True
+        # Regexp
+        if self._pattern_match is not None:
+            if not self._pattern_match(value):
+                raise ValueError(
+                    f"pattern does not match: {self._pattern.pattern}."
+                )
 
-    def convert(self, value, allowed_types, current_error=None):
-        """Some parameter types require manual type conversion (see Query)"""
-        blank_none = self.blank_none
-        if blank_none is None:  # Default blank_none to False if not provided or set in app config
-            blank_none = False if "FPV_BLANK_NONE" not in flask.current_app.config else flask.current_app.config["FPV_BLANK_NONE"]
+        # Callable (non-list)
+        if self.func is not None and not in_list:
+            self.func_helper(value)
 
+    def get_blank_none(self, settings=None) -> bool:
+        """Get blank_none, defaulting to FPV_BLANK_NONE from an app's settings (the current app's if not given)"""
+        if self.blank_none is not None:
+            return self.blank_none
+        return (settings if settings is not None else get_settings()).blank_none
+
+    def create_conversion_cache(self, settings=None):
+        """
+        Create a memoized convert(), caching the most recently converted input strings, or None if caching is
+        disabled. The cache size defaults to FPV_CONVERSION_CACHE_SIZE from an app's settings (the current app's
+        if not given, and there is one).
+        """
+        size = self.conversion_cache
+        if size is None:
+            if settings is not None:
+                size = settings.conversion_cache_size
+            elif flask.has_app_context():
+                size = get_settings().conversion_cache_size
+        return functools.lru_cache(maxsize=size)(self.convert) if size else None
+
+    def func_cache_info(self):
+        """Get the hits, misses, maxsize and currsize of the func result cache, or None if it is disabled"""
+        return self._func_cache.info() if self._func_cache is not None else None
+
+    def convert(self, value, allowed_types, current_error=None, blank_none=None):
+        """Some parameter types require manual type conversion (see Query)"""
         error = None
         # Datetime conversion
         if None in allowed_types and value is None:
@@ -194,8 +281,11 @@ class Parameter:
                     return datetime.strptime(str(value), self.datetime_format)
                 except ValueError:
                     error = ValueError(f"datetime format does not match: {self.datetime_format}")
-        if blank_none and type(None) in allowed_types and str in allowed_types and type(value) is str and len(value) == 0:
-            return None
+        if type(None) in allowed_types and str in allowed_types and type(value) is str and len(value) == 0:
+            if blank_none is None:  # Not given by a converter compiled for an app, so resolved from the current app
+                blank_none = self.get_blank_none()
+            if blank_none:
+                return None
         if any(isclass(allowed_type) and (issubclass(allowed_type, str) or issubclass(allowed_type, int) and issubclass(allowed_type, Enum)) for allowed_type in allowed_types):
             for allowed_type in allowed_types:
                 if issubclass(allowed_type, Enum):
@@ -220,4 +310,50 @@ class Parameter:
             return value
         if error and type(value) is str:
             raise error
-        return value
\ No newline at end of file
+        return value
+
+
+def check_func_result(func_result):
+    """
+    Check the result of a validator function, of format bool or (bool, error message)
+    """
+    if type(func_result) is bool:
+        if not func_result:
+            raise ValueError(
+                "value does not match the validator function."
+            )
+    elif type(func_result) is tuple:
+        if len(func_result) == 2 and type(func_result[0]) is bool and type(func_result[1]) is str:
+            if not func_result[0]:
+                raise ValueError(
+                    func_result[1]
+                )
+        else:
+            raise ValueError(
+                f"validator function returned incorrect type: {str(type(func_result))}, should return bool or (bool, str)"
+            )
+
+
+def compile_whitelist(whitelist):
+    """
+    Compile a whitelist into the search() of a regex matching any character not in it
+    """
+    chars = sorted(char for char in whitelist if type(char) is str and len(char) == 1)
+    if not chars:
+        return re.compile(".", re.DOTALL).search
+    return re.compile(f"[^{''.join(re.escape(char) for char in chars)}]").search
+
+
+def compile_blacklist(blacklist):
+    """
+    Compile a blacklist into the search() of a regex matching any item in it,
+    or None if it contains items which can't be searched for
+    """
+    items = list(blacklist)
+    if any(type(item) is not str for item in items):
+        return None
+    if not items:
+        return lambda value: None
+    if all(len(item) == 1 for item in items):
+        return re.compile(f"[{''.join(re.escape(item) for item in items)}]").search
+    return re.compile("|".join(re.escape(item) for item in items)).search
@@ -14,7 +14,7 @@ class Query(Parameter):
     def __init__(self, default=None, **kwargs):
         super().__init__(default, **kwargs)
 
-    def convert(self, value, allowed_types, current_error=None):
+    def convert(self, value, allowed_types, current_error=None, blank_none=None):
         """Convert query parameters to corresponding types."""
         original_value = value
         error = None
@@ -22,7 +22,7 @@ class Query(Parameter):
             # int conversion done before dict to handle potential IntEnum
             if int in allowed_types:
                 try:
-                    enum_test = super().convert(value, allowed_types, current_error)
+                    enum_test = super().convert(value, allowed_types, current_error, blank_none)
                     if issubclass(type(enum_test), Enum) and issubclass(type(enum_test), int):
                         return enum_test
                     return int(value)
@@ -51,4 +51,4 @@ class Query(Parameter):
                     pass
         if type(value) is not str:
             error = None
-        return super().convert(value, allowed_types, current_error=error)
+        return super().convert(value, allowed_types, current_error=error, blank_none=blank_none)
@@ -13,13 +13,13 @@ class Route(Parameter):
     def __init__(self, default=None, **kwargs):
         super().__init__(default, **kwargs)
 
-    def convert(self, value, allowed_types, current_error=None):
+    def convert(self, value, allowed_types, current_error=None, blank_none=None):
         """Convert query parameters to corresponding types."""
         if type(value) is str:
             # int conversion
             if int in allowed_types:
                 try:
-                    enum_test = super().convert(value, allowed_types, current_error)
+                    enum_test = super().convert(value, allowed_types, current_error, blank_none)
                     if issubclass(type(enum_test), Enum) and issubclass(type(enum_test), int):
                         value = enum_test
                     else:
@@ -42,4 +42,4 @@ class Route(Parameter):
                 except AttributeError:
                     pass
 
-        return super().convert(value, allowed_types)
\ No newline at end of file
+        return super().convert(value, allowed_types, blank_none=blank_none)
\ No newline at end of file
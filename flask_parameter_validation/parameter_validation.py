@@ -1,66 +1,136 @@
 import json
-import sys
 import asyncio
 import functools
 import inspect
 import re
 import uuid
-from inspect import signature
-from typing import Optional, Union, get_origin, get_args, Any, get_type_hints
+import weakref
+from concurrent.futures import Future, wait
+from time import perf_counter
+from typing import Optional, get_origin, get_args, Any
 
 import flask
 from flask import request
 from werkzeug.datastructures import ImmutableMultiDict
 from werkzeug.exceptions import BadRequest
-from .exceptions import (InvalidParameterTypeError, MissingInputError,
-                         ValidationError)
+from .exceptions import MissingInputError, ValidationError
+from .json_stream import JsonArrayParser, ValidatedJsonArray
+from .converters import UNION_TYPES, get_typeddict_fields, is_typeddict
+from .metrics import validation_failed, validation_timed
+from .multipart import RejectedUpload
+from .settings import Settings, get_settings, reload_settings
 from .parameter_types import File, Form, Json, Query, Route, Parameter
-from .parameter_types.multi_source import MultiSource
+from .validation_plan import ParameterPlan, RequestInputs, ValidationPlan, submit_in_context
 
-fn_list = dict()
+# Matches JSON content types, such as application/json and application/vnd.api+json
+JSON_CONTENT_TYPE = re.compile("application/[^+]*[+]?(json);?")
 
-# from 3.10 onwards, Unions written X | Y have the type UnionType
-UNION_TYPES = [Union]
-if sys.version_info >= (3, 10):
-    from types import UnionType
-    UNION_TYPES = [Union, UnionType]
 
-if sys.version_info >= (3, 11):
-    from typing import NotRequired, Required, is_typeddict
-elif sys.version_info >= (3, 9):
-    from typing_extensions import NotRequired, Required, is_typeddict
+@functools.lru_cache(maxsize=128)
+def is_json_content_type(content_type: str) -> bool:
+    """Whether a Content-Type header is JSON, cached as few distinct values are seen"""
+    return JSON_CONTENT_TYPE.search(content_type) is not None
+
+
+# Documentation records of decorated functions, by discriminated signature.
+# Records are only referenced strongly by their function, so are released along with it
+fn_list = weakref.WeakValueDictionary()
+
+
+class FunctionDocs(dict):
+    """
+    Documentation record of a decorated function, which can be weakly referenced.
+    Its "decorators" are read from the function's source when first accessed, as
+    reading source files is slow, and only needed to generate documentation.
+    """
+
+    def __init__(self, f, fields: dict):
+        super().__init__(fields)
+        # Weak, so that the function isn't kept alive by its own record
+        self._function = weakref.ref(f)
+
+    def __missing__(self, key):
+        if key != "decorators":
+            raise KeyError(key)
+        decorators = self["decorators"] = get_decorators(self._function())
+        return decorators
+
+    def get(self, key, default=None):
+        if key == "decorators":
+            return self[key]
+        return super().get(key, default)
+
+
+def get_decorators(f) -> list[str]:
+    """
+    Get the lines of decorators applied to a function, as written in its source. Returns
+    an empty list if the source is unavailable, such as when running from a zipapp.
+    """
+    if f is None:
+        return []
+    try:
+        source = inspect.getsource(f)
+    except (OSError, TypeError):
+        return []
+    index = source.find("def ")
+    decorators = []
+    for line in source[:index].strip().splitlines():
+        if line.strip().startswith("@"):
+            decorators.append(line)
+    return decorators
+
 
 class ValidateParameters:
     @classmethod
     def get_fn_list(cls):
         return fn_list
 
-    def __init__(self, error_handler=None):
+    @classmethod
+    def warmup(cls, app) -> int:
+        """
+        Compile the validation plan of every decorated route of an app, so that the first
+        request to each route isn't slowed by it, and configuration errors are raised at
+        startup. When called before forking workers (e.g. gunicorn --preload), the compiled
+        plans are shared with every worker.
+
+        :raises InvalidParameterTypeError: if a route has a parameter with an invalid source
+        :return: the number of decorated routes compiled
+        """
+        compiled = 0
+        # Compiled with the app's settings, so that its config is used
+        settings = get_settings(app)
+        for view_function in app.view_functions.values():
+            plan = getattr(view_function, "__fpv_plan__", None)
+            if plan is not None:
+                plan.compile(settings)
+                compiled += 1
+        return compiled
+
+    @classmethod
+    def reload_settings(cls, app) -> Settings:
+        """
+        Apply changes to an app's FPV_ config options. The options are read once, when the app
+        first validates a request (or is warmed up), so that validation never reads the config.
+        Routes are compiled for the new settings on their next request.
+
+        :return: the app's new settings
+        """
+        return reload_settings(app)
+
+    def __init__(self, error_handler=None, collect_errors=None, executor=None):
         self.custom_error_handler = error_handler
+        # Whether to validate every input and report all errors at once, rather than
+        # stopping at the first. Defaults to the FPV_COLLECT_ERRORS config option
+        self.collect_errors = collect_errors
+        # Executor checking parameters with func or json_schema concurrently, once their
+        # inputs are converted. Defaults to the FPV_EXECUTOR config option
+        self.executor = executor
 
     def __call__(self, f):
         """
         Parent flow for validating each required parameter
         """
-        fsig = f.__module__ + "." + f.__name__
-        # Add a discriminator to the function signature, store it in the properties of the function
-        # This is used in documentation generation to associate the info gathered from inspecting the
-        # function with the properties passed to the ValidateParameters decorator
-        f.__fpv_discriminated_sig__ = f"{uuid.uuid4()}_{fsig}"
-        fsig = f.__fpv_discriminated_sig__
-        argspec = inspect.getfullargspec(f)
-        source = inspect.getsource(f)
-        index = source.find("def ")
-        decorators = []
-        for line in source[:index].strip().splitlines():
-            if line.strip()[0] == "@":
-                decorators.append(line)
-        fdocs = {
-            "argspec": argspec,
-            "docstring": f.__doc__.strip() if f.__doc__ else None,
-            "decorators": decorators.copy(),
-        }
-        fn_list[fsig] = fdocs
+        plan = self._prepare(f)
 
         def nested_func_helper(**kwargs):
             """
@@ -69,54 +139,64 @@ class ValidateParameters:
             if it should unpack the resulting dictionary of inputs as kwargs,
             or just return the error message.
             """
-            # Step 1 - Get expected input details as dict
-            expected_inputs = signature(f).parameters
+            app = flask.current_app._get_current_object()
+            report_failure = functools.partial(self._report_failure, app, request.endpoint)
+            return self._validate_timed(
+                app, request.endpoint, lambda timings: validate_request(kwargs, timings, report_failure)
+            )
 
-            # Step 2 - Validate JSON inputs
+        def validate_request(kwargs, timings, report_failure):
+            settings = get_settings()
+
+            # Step 1 - Validate JSON inputs, if the route expects any
             json_input = None
-            if request.headers.get("Content-Type") is not None:
-                if re.search(
-                        "application/[^+]*[+]?(json);?", request.headers.get("Content-Type")
-                ):
+            if Json in plan.source_classes:
+                content_type = request.headers.get("Content-Type")
+                if content_type is not None and is_json_content_type(content_type):
+                    # Decode with the configured function if given, otherwise with the app's JSON provider
+                    json_loads = settings.json_loads
                     try:
-                        json_input = request.json
-                    except BadRequest:
+                        json_input = request.json if json_loads is None else json_loads(request.get_data())
+                    except (BadRequest, ValueError) as e:
+                        report_failure(None, e)
                         return {"error": ({"error": "Could not parse JSON."}, 400), "validated": False}
 
-            # Step 3 - For Query params, find which parameters should be split by commas
-            split_csv = {}
-            default_list_disable_query_csv = flask.current_app.config.get("FPV_LIST_DISABLE_QUERY_CSV", False)
-            for name, param in expected_inputs.items():
-                list_disable_query_csv = default_list_disable_query_csv
-                if param.default.list_disable_query_csv is not None:
-                    list_disable_query_csv = param.default.list_disable_query_csv
-                split_csv[param.default.alias or name] = not list_disable_query_csv
-
-            # Step 4 - Convert request inputs to dicts
-            request_inputs = {
-                Route: kwargs.copy(),
-                Json: json_input or {},
-                Query: self._to_dict_with_lists(request.args, split_csv),
-                Form: self._to_dict_with_lists(request.form),
-                File: self._to_dict_with_lists(request.files),
-            }
-
-            # Step 5 - Validate each expected input
-            validated_inputs = {}
-            for expected in expected_inputs.values():
-                if self.custom_error_handler is None:
-                    try:
-                        new_input = self.validate(expected, request_inputs)
-                    except (MissingInputError, ValidationError) as e:
-                        return {"error": ({"error": str(e)}, 400), "validated": False}
-                else:
-                    try:
-                        new_input = self.validate(expected, request_inputs)
-                    except Exception as e:
-                        return {"error": self.custom_error_handler(e), "validated": False}
-                validated_inputs[expected.name] = new_input
-
-            return {"inputs": validated_inputs, "validated": True}
+            # Step 2 - Convert request inputs to dicts when first read, so that
+            # sources the route doesn't expect (e.g. a multipart body) are never parsed
+            if plan.upload_limits is not None:
+                # Uploads to File parameters are checked as the multipart body is parsed
+                request.form_data_parser_class = plan.upload_limits
+            request_inputs = RequestInputs({
+                Route: lambda: kwargs.copy(),
+                Json: lambda: json_input or {},
+                # For Query params, find which parameters should be split by commas
+                Query: lambda: self._to_dict_with_lists(request.args, plan.split_csv(settings.list_disable_query_csv)),
+                Form: lambda: self._to_dict_with_lists(request.form),
+                File: lambda: self._to_dict_with_lists(request.files),
+                JsonArrayParser: lambda: JsonArrayParser(request.stream) if is_json_content_type(
+                    request.headers.get("Content-Type") or ""
+                ) else None,
+            })
+
+            # Steps 3 and 4
+            return self._validate_request_inputs(plan, request_inputs, settings, timings, report_failure)
+
+        def stream_error_response(error, inputs):
+            """
+            Get the error response for an error raised by a streamed JSON array while the view
+            iterated it, or None if the error wasn't raised by one
+            """
+            if plan.json_stream is None:
+                return None
+            stream = inputs[plan.json_stream.name]
+            if not isinstance(stream, ValidatedJsonArray) or stream.error is not error:
+                return None
+            self._report_failure(flask.current_app._get_current_object(), request.endpoint, plan.json_stream.name, error)
+            if self._is_collecting_errors(get_settings()):
+                return self._collected_errors_response([error])
+            if self.custom_error_handler is not None:
+                return self.custom_error_handler(error)
+            return {"error": str(error)}, 400
 
         if asyncio.iscoroutinefunction(f):
             # If the view function is async, return and await a coroutine
@@ -124,7 +204,13 @@ class ValidateParameters:
             async def nested_func(**kwargs):
                 validated_inputs = nested_func_helper(**kwargs)
                 if validated_inputs["validated"]:
-                    return await f(**validated_inputs["inputs"])
+                    try:
+                        return await f(**validated_inputs["inputs"])
+                    except ValidationError as e:
+                        response = stream_error_response(e, validated_inputs["inputs"])
+                        if response is None:
+                            raise
+                        return response
                 return validated_inputs["error"]
         else:
             # If the view function is not async, return a function
@@ -132,12 +218,179 @@ class ValidateParameters:
             def nested_func(**kwargs):
                 validated_inputs = nested_func_helper(**kwargs)
                 if validated_inputs["validated"]:
-                    return f(**validated_inputs["inputs"])
+                    try:
+                        return f(**validated_inputs["inputs"])
+                    except ValidationError as e:
+                        # Streamed JSON arrays are validated as the view iterates them
+                        response = stream_error_response(e, validated_inputs["inputs"])
+                        if response is None:
+                            raise
+                        return response
                 return validated_inputs["error"]
 
         nested_func.__name__ = f.__name__
+        # Copied to the view function's wrappers by functools.wraps, for warmup()
+        nested_func.__fpv_plan__ = plan
         return nested_func
 
+    def _prepare(self, f) -> ValidationPlan:
+        """
+        Record the documentation of a view function, and resolve its validation plan
+        """
+        fsig = f.__module__ + "." + f.__name__
+        # Add a discriminator to the function signature, store it in the properties of the function
+        # This is used in documentation generation to associate the info gathered from inspecting the
+        # function with the properties passed to the ValidateParameters decorator
+        f.__fpv_discriminated_sig__ = f"{uuid.uuid4()}_{fsig}"
+        fsig = f.__fpv_discriminated_sig__
+        argspec = inspect.getfullargspec(f)
+        fdocs = FunctionDocs(f, {
+            "argspec": argspec,
+            "docstring": f.__doc__.strip() if f.__doc__ else None,
+        })
+        # Point straight to the record from the function, for constant time lookup
+        f.__fpv_docs__ = fdocs
+        fn_list[fsig] = fdocs
+        return ValidationPlan(f)
+
+    def _validate_request_inputs(self, plan, request_inputs, settings, timings, report_failure) -> dict:
+        """
+        Validate each expected input of a request, returning a dictionary of either the
+        validated "inputs", or the "error" response, and whether the request was "validated"
+        """
+        # Step 3 - Validate each expected input
+        errors = [] if self._is_collecting_errors(settings) else None
+        executor = self.executor if self.executor is not None else settings.executor
+        offload = None if executor is None or errors is not None else functools.partial(submit_in_context, executor)
+        # Errors handled with an error response, others are raised
+        handled = (MissingInputError, ValidationError) if self.custom_error_handler is None else Exception
+        validated_inputs = {}
+        # Names and futures of parameters being checked by the executor
+        pending = []
+        reported_errors = 0
+        # Names of parameters with collected errors, which aren't batch validated
+        failed = set()
+        for expected in plan.parameters:
+            parameter_timings = None if timings is None else timings.setdefault(expected.name, {})
+            try:
+                new_input = expected.validate(request_inputs, errors, parameter_timings, offload, settings)
+            except RejectedUpload as e:
+                # The rest of the request body isn't parsed, so no other input can be validated
+                self._cancel_pending(pending)
+                return self._rejected_upload(e, errors, report_failure)
+            except handled as e:
+                # Errors of earlier parameters still being checked take precedence
+                for index, (name, future) in enumerate(pending):
+                    try:
+                        future.result()
+                    except handled as pending_error:
+                        self._cancel_pending(pending[index + 1:])
+                        return self._failure(name, pending_error, report_failure)
+                return self._failure(expected.name, e, report_failure)
+            if errors and len(errors) > reported_errors:
+                for error in errors[reported_errors:]:
+                    report_failure(expected.name, error)
+                reported_errors = len(errors)
+                failed.add(expected.name)
+            if isinstance(new_input, Future):
+                pending.append((expected.name, new_input))
+            validated_inputs[expected.name] = new_input
+        for index, (name, future) in enumerate(pending):
+            try:
+                validated_inputs[name] = future.result()
+            except handled as e:
+                self._cancel_pending(pending[index + 1:])
+                return self._failure(name, e, report_failure)
+
+        # Validate the elements of parameters with a batch_func, calling each once for the whole request
+        if plan.batch:
+            for name, error in plan.batch.validate(validated_inputs, failed):
+                if errors is not None and isinstance(error, ValidationError):
+                    report_failure(name, error)
+                    errors.append(error)
+                elif isinstance(error, handled):
+                    return self._failure(name, error, report_failure)
+                else:
+                    raise error
+
+        # Step 4 - Report all errors at once, if collecting them
+        if errors:
+            return {"error": self._collected_errors_response(errors), "validated": False}
+
+        return {"inputs": validated_inputs, "validated": True}
+
+    @staticmethod
+    def _cancel_pending(pending) -> None:
+        """
+        Cancel the checks of parameters not yet started by the executor, and wait for those
+        already running, so that no check outlives the request that failed validation
+        """
+        wait([future for name, future in pending if not future.cancel()])
+
+    def _failure(self, parameter, error, report_failure) -> dict:
+        """Get the result of a request failing validation on its first invalid parameter"""
+        report_failure(parameter, error)
+        if self.custom_error_handler is None:
+            return {"error": ({"error": str(error)}, 400), "validated": False}
+        return {"error": self.custom_error_handler(error), "validated": False}
+
+    def _rejected_upload(self, rejected, errors, report_failure) -> dict:
+        """
+        Get the result of a request whose multipart body was rejected while being parsed,
+        responding with 413 if an upload was too long, otherwise 400
+        """
+        report_failure(rejected.argument, rejected.error)
+        if errors is None:
+            if self.custom_error_handler is not None:
+                return {"error": self.custom_error_handler(rejected.error), "validated": False}
+            return {"error": ({"error": str(rejected.error)}, rejected.code), "validated": False}
+        errors.append(rejected.error)
+        response = self._collected_errors_response(errors)
+        if self.custom_error_handler is None:
+            response = response[0], rejected.code
+        return {"error": response, "validated": False}
+
+    def _is_collecting_errors(self, settings) -> bool:
+        if self.collect_errors is None:
+            return settings.collect_errors
+        return self.collect_errors
+
+    def _collected_errors_response(self, errors):
+        if self.custom_error_handler is not None:
+            return self.custom_error_handler(errors)
+        return {
+            "error": str(errors[0]),
+            "errors": [{"path": e.path, "message": str(e)} for e in errors],
+        }, 400
+
+    @staticmethod
+    def _validate_timed(app, endpoint, validate) -> dict:
+        """Call validate(timings), only timing it if something is listening for timings"""
+        if not validation_timed.receivers:
+            return validate(None)
+        timings = {}
+        started = perf_counter()
+        result = validate(timings)
+        validation_timed.send(
+            app,
+            endpoint=endpoint,
+            total=perf_counter() - started,
+            parameters=timings,
+            validated=result["validated"],
+        )
+        return result
+
+    @staticmethod
+    def _report_failure(app, endpoint, parameter, error):
+        if validation_failed.receivers:
+            validation_failed.send(
+                app,
+                endpoint=endpoint,
+                parameter=parameter,
+                reason=type(error).__name__,
+                error=error,
+            )
+
     def _to_dict_with_lists(
             self, multi_dict: ImmutableMultiDict, split_csv: Optional[dict[str, bool]] = None
     ) -> dict:
@@ -232,8 +485,9 @@ class ValidateParameters:
                     return user_input, False
             if type(user_input) is not dict:
                 return user_input, False
+            annotations, required_keys = get_typeddict_fields(expected_input_type)
             # check that we have all required keys
-            for key in expected_input_type.__required_keys__:
+            for key in required_keys:
                 if key not in user_input:
                     return user_input, False
 
@@ -241,15 +495,11 @@ class ValidateParameters:
             converted_dict = {}
             # go through each user input key and make sure the value is the correct type
             for key, value in user_input.items():
-                annotations = get_type_hints(expected_input_type)
                 if key not in annotations:
                     # we are strict in not allowing extra keys
                     # if you want extra keys, use NotRequired
                     return user_input, False
-                # get the Required and NotRequired decorators out of the way, if present                
                 annotation_type = annotations[key]
-                if get_origin(annotation_type) is NotRequired or get_origin(annotation_type) is Required:
-                    annotation_type = get_args(annotation_type)[0]
                 sub_converted_input, sub_success = self._generic_types_validation_helper(expected_name, annotation_type, value, source)
                 if not sub_success:
                     return user_input, False
@@ -312,72 +562,4 @@ class ValidateParameters:
         """
         Validate that a given expected input exists in the requested input collection
         """
-        # Extract useful information from expected input
-        expected_input_type = expected_input.annotation  # i.e. str, int etc.
-        # i.e. Form, Query, Json etc.
-        expected_delivery_type = expected_input.default
-        # Check if an alias is given, otherwise use the input name
-        if expected_delivery_type.alias:
-            expected_name = expected_delivery_type.alias
-        else:
-            expected_name = expected_input.name
-
-        # original_expected_input_type will mutate throughout program,
-        # so we need to keep the original for error messages
-        original_expected_input_type = expected_input.annotation
-
-        # Expected delivery types can be a list if using MultiSource
-        expected_delivery_types = [expected_delivery_type]
-        if type(expected_delivery_type) is MultiSource:
-            expected_delivery_types = expected_delivery_type.sources
-
-        for source_index, source in enumerate(expected_delivery_types):
-            # Validate that the expected delivery type is valid
-            if source.__class__ not in all_request_inputs.keys():
-                raise InvalidParameterTypeError(source)
-
-            # Validate that user supplied input in expected delivery type (unless specified as Optional)
-            user_input = all_request_inputs[source.__class__].get(
-                expected_name
-            )
-            if user_input is None:
-                # If default is given, set and continue
-                if source.default is not None:
-                    user_input = source.default
-                else:
-                    # Optionals are Unions with a NoneType, so we should check if None is part of Union __args__ (if exist)
-                    if (
-                            hasattr(expected_input_type, "__args__") and type(None) in expected_input_type.__args__
-                            and source_index == len(expected_delivery_types) - 1  # If MultiSource, only return None for last source
-                    ):
-                        return user_input
-                    else:
-                        if len(expected_delivery_types) == 1:
-                            raise MissingInputError(
-                                expected_name, source.__class__
-                            )
-                        elif source_index != len(expected_delivery_types) - 1:
-                            continue
-                        else:
-                            raise MissingInputError(
-                                expected_name, source.__class__
-                            )
-
-            converted_user_input, validation_success = self._generic_types_validation_helper(expected_name, expected_input_type, user_input, source)
-
-            # Validate parameter-specific requirements are met
-            try:
-                source.validate(converted_user_input)
-            except ValueError as e:
-                raise ValidationError(str(e), expected_name, expected_input_type)
-
-            # Error if types don't match
-            if not validation_success:
-                type_name = str(original_expected_input_type)
-                raise ValidationError(
-                    f"must be type '{type_name}'",
-                    expected_name,
-                    original_expected_input_type,
-                )
-
-            return converted_user_input
+        return ParameterPlan(expected_input).validate(all_request_inputs)
@@ -0,0 +1,103 @@
+"""
+    Validation of Quart routes.
+    Request bodies are read by awaiting Quart, rather than blocking the event
+    loop, and requests with large bodies are validated in an executor, so that
+    other requests aren't stalled while they are converted and checked.
+"""
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor
+from typing import Optional
+
+from quart import current_app, request
+
+from .parameter_types import File, Form, Json, Query, Route
+from .parameter_validation import ValidateParameters, is_json_content_type
+from .settings import get_settings
+from .validation_plan import RequestInputs
+
+
+class QuartValidateParameters(ValidateParameters):
+    """
+    ValidateParameters for the routes of a Quart app, used in the same way.
+    Json(stream=True) parameters aren't supported.
+    """
+
+    def __init__(self, error_handler=None, collect_errors=None, executor: Optional[Executor] = None,
+                 offload_executor: Optional[Executor] = None):
+        super().__init__(error_handler, collect_errors, executor)
+        # Executor validating requests with large bodies, defaults to the event loop's default executor
+        self.offload_executor = offload_executor
+
+    def __call__(self, f):
+        plan = self._prepare(f)
+        if plan.json_stream is not None:
+            raise ValueError(f"'{plan.json_stream.name}' can't use Json(stream=True), as Quart request bodies are async")
+
+        @functools.wraps(f)
+        async def nested_func(**kwargs):
+            app = current_app._get_current_object()
+            settings = get_settings(app)
+
+            # Read the request body by awaiting Quart, if the route expects any input from it
+            body = form = files = None
+            if Json in plan.source_classes and is_json_content_type(request.headers.get("Content-Type") or ""):
+                body = await request.get_data()
+            if Form in plan.source_classes:
+                form = await request.form
+            if File in plan.source_classes:
+                files = await request.files
+
+            validate = functools.partial(
+                self._validate_quart_request, plan, app, request.endpoint, settings, kwargs, request.args, body,
+                form, files,
+            )
+            size = len(body) if body is not None else request.content_length
+            if settings.async_offload_size is not None and size is not None and size >= settings.async_offload_size:
+                # Validated within a copy of the request's context, as that is where it would otherwise run
+                validated_inputs = await asyncio.get_running_loop().run_in_executor(
+                    self.offload_executor, contextvars.copy_context().run, validate
+                )
+            else:
+                validated_inputs = validate()
+            if validated_inputs["validated"]:
+                return await app.ensure_async(f)(**validated_inputs["inputs"])
+            return validated_inputs["error"]
+
+        # For warmup()
+        nested_func.__fpv_plan__ = plan
+        return nested_func
+
+    def _validate_quart_request(self, plan, app, endpoint, settings, kwargs, args, body, form, files) -> dict:
+        """
+        Validate a Quart request, once its body has been read, returning a dictionary of
+        either the validated "inputs", or the "error" response, and whether it was "validated"
+        """
+        report_failure = functools.partial(self._report_failure, app, endpoint)
+
+        def validate_request(timings):
+            # Step 1 - Validate JSON inputs, decoded with the configured function if given,
+            # otherwise with the app's JSON provider
+            json_input = None
+            if body is not None:
+                try:
+                    json_input = (settings.json_loads or app.json.loads)(body)
+                except ValueError as e:
+                    report_failure(None, e)
+                    return {"error": ({"error": "Could not parse JSON."}, 400), "validated": False}
+
+            # Step 2 - Convert request inputs to dicts when first read
+            request_inputs = RequestInputs({
+                Route: lambda: kwargs.copy(),
+                Json: lambda: json_input or {},
+                # For Query params, find which parameters should be split by commas
+                Query: lambda: self._to_dict_with_lists(args, plan.split_csv(settings.list_disable_query_csv)),
+                Form: lambda: self._to_dict_with_lists(form),
+                File: lambda: self._to_dict_with_lists(files),
+            })
+
+            # Steps 3 and 4
+            return self._validate_request_inputs(plan, request_inputs, settings, timings, report_failure)
+
+        return self._validate_timed(app, endpoint, validate_request)
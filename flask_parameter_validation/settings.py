@@ -0,0 +1,66 @@
+"""
+    Snapshot of an app's FPV_ configuration options.
+    Options are read from the app config once, when the app first validates a
+    request, so that validation never reads the config itself. Changes to the
+    config are applied by ValidateParameters.reload_settings().
+"""
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import flask
+
+# Key of the snapshot in app.extensions
+SETTINGS_EXTENSION = "flask_parameter_validation.settings"
+
+
+# Compared by identity, as each snapshot has its own compiled converters (see ParameterPlan.compile)
+@dataclass(frozen=True, eq=False)
+class Settings:
+    """Validation behavior configuration of an app"""
+
+    # FPV_BLANK_NONE: default of Parameter(blank_none)
+    blank_none: bool = False
+    # FPV_LIST_DISABLE_QUERY_CSV: default of Parameter(list_disable_query_csv)
+    list_disable_query_csv: bool = False
+    # FPV_COLLECT_ERRORS: default of ValidateParameters(collect_errors)
+    collect_errors: bool = False
+    # FPV_JSON_LOADS: function decoding JSON request bodies, or None for the app's JSON provider
+    json_loads: Optional[Callable[[bytes], Any]] = None
+    # FPV_CONVERSION_CACHE_SIZE: default of Parameter(conversion_cache)
+    conversion_cache_size: Optional[int] = None
+    # FPV_ASYNC_OFFLOAD_SIZE: request body size in bytes from which async adapters validate in an executor,
+    # or None to always validate on the event loop
+    async_offload_size: Optional[int] = 65536
+    # FPV_EXECUTOR: default of ValidateParameters(executor)
+    executor: Optional[Executor] = None
+
+    @classmethod
+    def from_config(cls, config) -> "Settings":
+        return cls(
+            blank_none=bool(config.get("FPV_BLANK_NONE", False)),
+            list_disable_query_csv=bool(config.get("FPV_LIST_DISABLE_QUERY_CSV", False)),
+            collect_errors=bool(config.get("FPV_COLLECT_ERRORS", False)),
+            json_loads=config.get("FPV_JSON_LOADS"),
+            conversion_cache_size=config.get("FPV_CONVERSION_CACHE_SIZE"),
+            async_offload_size=config.get("FPV_ASYNC_OFFLOAD_SIZE", 65536),
+            executor=config.get("FPV_EXECUTOR"),
+        )
+
+
+def get_settings(app: Optional[flask.Flask] = None) -> Settings:
+    """
+    Get the settings of an app, defaulting to the current app, snapshotting its config on first use
+    """
+    if app is None:
+        app = flask.current_app._get_current_object()
+    settings = app.extensions.get(SETTINGS_EXTENSION)
+    if settings is None:
+        settings = reload_settings(app)
+    return settings
+
+
+def reload_settings(app: flask.Flask) -> Settings:
+    """Snapshot the current config of an app, replacing its settings"""
+    settings = app.extensions[SETTINGS_EXTENSION] = Settings.from_config(app.config)
+    return settings
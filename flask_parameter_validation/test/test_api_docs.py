@@ -55,3 +55,88 @@ def test_doc_types_of_default(app):
                         n_opt = args[1]
                     assert n_opt["type"] == types[arg_type]["n_opt"]
                     assert opt["type"] == types[arg_type]["opt"]
+
+
+def test_docs_etag(client):
+    for url in ["/docs/", "/docs/json"]:
+        r = client.get(url)
+        assert r.status_code == 200
+        assert r.headers["ETag"]
+        # Test that a matching ETag is not sent the documentation again
+        r_cached = client.get(url, headers={"If-None-Match": r.headers["ETag"]})
+        assert r_cached.status_code == 304
+        assert r_cached.data == b""
+        r_stale = client.get(url, headers={"If-None-Match": '"stale"'})
+        assert r_stale.status_code == 200
+        assert r_stale.data == r.data
+
+
+def test_docs_cache_invalidated_by_new_routes():
+    from flask import Flask, jsonify
+    from flask_parameter_validation import Query, ValidateParameters
+    from flask_parameter_validation.docs_blueprint import docs_blueprint
+
+    # Routes are added once documentation has been generated, so the test needs an app of its own
+    app = Flask(__name__)
+    app.register_blueprint(docs_blueprint)
+
+    @app.get("/first")
+    @ValidateParameters()
+    def first(v: int = Query()):
+        return jsonify({"v": v})
+
+    with app.test_request_context():
+        docs = get_route_docs()
+        assert [doc["rule"] for doc in docs] == ["/first"]
+        # Test that unchanged routes reuse the generated documentation
+        assert get_route_docs() is docs
+
+        @app.get("/second")
+        @ValidateParameters()
+        def second(v: str = Query()):
+            return jsonify({"v": v})
+
+        assert [doc["rule"] for doc in get_route_docs()] == ["/first", "/second"]
+
+
+def test_fn_list_releases_collected_functions():
+    import gc
+    from flask_parameter_validation import Query, ValidateParameters
+
+    def view(v: int = Query()):
+        return v
+
+    decorated = ValidateParameters()(view)
+    fn_list = ValidateParameters.get_fn_list()
+    sig = decorated.__fpv_discriminated_sig__
+    assert fn_list[sig] is decorated.__fpv_docs__
+    assert fn_list[sig]["argspec"].args == ["v"]
+    del view, decorated
+    gc.collect()
+    assert sig not in fn_list
+
+
+def test_decorators_read_lazily():
+    from flask_parameter_validation import Query, ValidateParameters
+
+    @ValidateParameters()
+    def view(v: int = Query()):
+        return v
+
+    fdocs = view.__fpv_docs__
+    # Test that the source isn't read until the decorators are needed
+    assert "decorators" not in fdocs
+    assert fdocs.get("decorators") == ["@ValidateParameters()"]
+    assert "decorators" in fdocs
+    # Test that functions without available source have no decorators
+    namespace = {"Query": Query, "__name__": "no_source_module"}
+    exec("def no_source(v: int = Query()):\n    return v", namespace)
+    no_source = ValidateParameters()(namespace["no_source"])
+    assert no_source.__fpv_docs__["decorators"] == []
+
+
+def test_route_docs_decorators():
+    docs = {doc["rule"]: doc for doc in get_route_docs()}
+    assert docs["/query/list/decorator/req_str"]["decorators"] == [
+        '@decorator("/decorator/req_str")', "    @dummy_decorator", "    @ValidateParameters()"
+    ]
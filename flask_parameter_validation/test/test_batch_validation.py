@@ -0,0 +1,79 @@
+# Batched Validation Functions
+import pytest
+
+from flask_parameter_validation import Json
+from flask_parameter_validation.test.testing_blueprints.batch_blueprint import batch_calls
+
+
+def test_batch_func_called_once(client):
+    batch_calls.clear()
+    body = {
+        "order": {"lines": [{"sku": "A1", "quantity": 1}, {"sku": "B2", "quantity": 2}]},
+        "gifts": [{"sku": "A1", "quantity": 1, "gift_sku": "C3"}, {"sku": "B2", "quantity": 1}],
+        "total": 3,
+    }
+    r = client.post("/batch/order?skus=A1,C3", json=body)
+    assert r.status_code == 200
+    # Elements of every parameter using the same function are validated in one call
+    assert batch_calls == [["A1", "B2", "C3", "A1", "C3"], [3]]
+
+
+def test_batch_func_errors(client):
+    body = {"order": {"lines": [{"sku": "A1", "quantity": 1}, {"sku": "X9", "quantity": 2}]}, "total": 1}
+    r = client.post("/batch/order?skus=Y8", json=body)
+    assert r.status_code == 400
+    assert r.json["error"] == "Parameter 'order' unknown SKU: X9"
+    r = client.post("/batch/order?skus=A1", json={**body, "total": -1})
+    assert r.json["error"] == "Parameter 'order' unknown SKU: X9"
+    body["order"]["lines"][1]["sku"] = "B2"
+    r = client.post("/batch/order?skus=A1", json={**body, "total": -1})
+    assert r.json["error"] == "Parameter 'total' value does not match the validator function."
+    # Elements aren't batch validated if any parameter fails other validation
+    batch_calls.clear()
+    r = client.post("/batch/order?skus=A1", json={**body, "total": -101})
+    assert r.json["error"] == "Parameter 'total' must be at least -100."
+    assert batch_calls == []
+
+
+def test_batch_func_collect_errors(client):
+    batch_calls.clear()
+    body = {
+        "order": {"lines": [{"sku": "X9", "quantity": 1}]},
+        "gifts": [{"sku": "A1", "quantity": 1, "gift_sku": "Z7"}],
+        "total": "x",
+    }
+    r = client.post("/batch/order/collect?skus=A1,Y8", json=body)
+    assert r.status_code == 400
+    assert r.json["errors"] == [
+        {"path": "/total", "message": "Parameter 'total' must be type '<class 'int'>'"},
+        {"path": "/order/lines/0/sku", "message": "Parameter 'order' unknown SKU: X9"},
+        {"path": "/gifts/0/gift_sku", "message": "Parameter 'gifts' unknown SKU: Z7"},
+        {"path": "/skus/1", "message": "Parameter 'skus' unknown SKU: Y8"},
+    ]
+    # Parameters which failed validation aren't batch validated
+    assert batch_calls == [["X9", "Z7", "A1", "Y8"]]
+
+
+def test_batch_func_incorrect_verdicts(client):
+    r = client.get("/batch/ids?v=1")
+    assert r.json == {"v": [1]}
+    r = client.get("/batch/ids?v=1,2")
+    assert r.json["error"] == "Parameter 'v' batch validator function returned 1 verdicts for 2 values"
+    with pytest.raises(ValueError):
+        Json(stream=True, batch_func=lambda values: values)
+
+
+def test_batch_func_exceptions(client):
+    r = client.get("/batch/handler?v=a,b")
+    assert r.json == {"v": ["a", "b"]}
+    # Exceptions raised by batch_func are given to the error handler, as those raised by func are
+    r = client.get("/batch/handler?v=a,down")
+    assert r.status_code == 422
+    assert r.json == {"custom": "store unavailable", "type": "ConnectionError"}
+    r = client.get("/batch/handler?v=bad")
+    assert r.json == {"custom": "Parameter 'v' could not look values up", "type": "ValidationError"}
+    r = client.get("/batch/collect?v=bad&w=x")
+    assert r.json["errors"] == [
+        {"path": "/w", "message": "Parameter 'w' must be type '<class 'int'>'"},
+        {"path": "/v", "message": "Parameter 'v' could not look values up"},
+    ]
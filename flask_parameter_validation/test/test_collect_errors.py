@@ -0,0 +1,56 @@
+# Collect-All-Errors Validation
+from flask_parameter_validation import ValidateParameters
+from flask_parameter_validation.exceptions import MissingInputError, ValidationError
+
+
+def get_paths(r):
+    return [error["path"] for error in r.json["errors"]]
+
+
+def test_collect_errors_reports_every_parameter(client):
+    r = client.post("/collect_errors/collect?c=x", json={"a": "1", "b": "ab"})
+    assert r.status_code == 400
+    assert get_paths(r) == ["/a", "/b", "/c", "/d"]
+    assert r.json["error"] == r.json["errors"][0]["message"]
+    assert r.json["errors"][1]["message"] == "Parameter 'b' must have at least 3 characters."
+    assert r.json["errors"][3]["message"] == "Missing required query parameter 'd'."
+    # Test that valid input yields no errors
+    r = client.post("/collect_errors/collect?d=1", json={"a": 1, "b": "abc"})
+    assert r.json == {"success": True}
+
+
+def test_collect_errors_reports_nested_paths(client):
+    r = client.post("/collect_errors/collect?d=1", json={
+        "a": 1,
+        "b": "abc",
+        "items": [{"id": 1, "name": "x"}, {"id": "2", "name": "y", "extra": 1}, {"name": "z", "tags": ["t", 1]}],
+        "ids": [1, -2, 3, -4],
+        "mapping": {"x/y": "1", "z": 2},
+    })
+    assert get_paths(r) == [
+        "/items/1/extra", "/items/1/id", "/items/2/id", "/items/2/tags/1", "/ids/1", "/ids/3", "/mapping/x~1y"
+    ]
+    assert r.json["errors"][0]["message"] == "Parameter 'items' has unexpected key 'extra'"
+    assert r.json["errors"][2]["message"] == "Parameter 'items' is missing required key 'id'"
+    assert r.json["errors"][4]["message"] == "Parameter 'ids' must be at least 0."
+
+
+def test_collect_errors_custom_error_handler(client):
+    r = client.post("/collect_errors/handler", json={"a": 1, "b": "a", "ids": ["x"]})
+    assert r.status_code == 422
+    assert r.json["errors"] == [
+        [ValidationError.__name__, "/b"], [MissingInputError.__name__, "/d"], [ValidationError.__name__, "/ids/0"]
+    ]
+
+
+def test_collect_errors_config(client, app):
+    # Test that only the first error is reported by default
+    r = client.post("/collect_errors/config", json={"a": "x"})
+    assert "errors" not in r.json
+    # Test that FPV_COLLECT_ERRORS reports all errors
+    app.config.update({"FPV_COLLECT_ERRORS": True})
+    ValidateParameters.reload_settings(app)
+    r = client.post("/collect_errors/config", json={"a": "x"})
+    assert get_paths(r) == ["/a", "/b", "/d"]
+    app.config.pop("FPV_COLLECT_ERRORS", None)
+    ValidateParameters.reload_settings(app)
@@ -0,0 +1,105 @@
+# Conversion Caching
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask
+
+from flask_parameter_validation import ValidateParameters
+from flask_parameter_validation.test.testing_blueprints.conversion_cache_blueprint import get_conversion_cache_blueprint
+
+
+def get_parameters(app):
+    """Get the plan of each parameter of the conversion cache routes, by endpoint and name"""
+    # Each snapshot of the app's settings has its own caches, so the caches of earlier tests aren't counted
+    ValidateParameters.reload_settings(app)
+    return {
+        endpoint.split(".")[-1]: {
+            parameter.name: parameter for parameter in app.view_functions[endpoint].__fpv_plan__.parameters
+        }
+        for endpoint in app.view_functions
+        if endpoint.startswith("conversion_cache.")
+    }
+
+
+def test_conversion_cache_hits(client, app):
+    parameters = get_parameters(app)
+    for v in ["2024-01-01", "2024-01-01", "2024-01-02", "2024-01-01", "2024-01-03", "2024-01-02"]:
+        r = client.get(f"/conversion_cache/date?v={v}")
+        assert r.json == {"v": v}
+    info = parameters["date_route"]["v"].conversion_cache_info(app)
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 4, 2, 2)
+    r = client.get("/conversion_cache/datetime/01.02.2024 1200")
+    assert r.json == {"v": "2024-02-01T12:00:00"}
+    r = client.get("/conversion_cache/datetime/01.02.2024 1200")
+    assert r.json == {"v": "2024-02-01T12:00:00"}
+    assert parameters["datetime_route"]["v"].conversion_cache_info(app).hits == 1
+
+
+def test_conversion_cache_errors_not_cached(client, app):
+    parameters = get_parameters(app)
+    for _ in range(2):
+        r = client.get("/conversion_cache/date?v=not-a-date")
+        assert r.status_code == 400
+        assert r.json["error"] == "Parameter 'v' date format does not match ISO 8601"
+    assert parameters["date_route"]["v"].conversion_cache_info(app).hits == 0
+
+
+def test_conversion_cache_config(client, app):
+    parameters = get_parameters(app)
+    client.get("/conversion_cache/default?v=27b3d7e5-4f5a-4b2a-a0c7-1c1c2c7d6c9e&c=red")
+    assert parameters["default_route"]["v"].conversion_cache_info(app) is None
+    app.config.update({"FPV_CONVERSION_CACHE_SIZE": 100})
+    parameters = get_parameters(app)
+    for _ in range(3):
+        r = client.get("/conversion_cache/default?v=27b3d7e5-4f5a-4b2a-a0c7-1c1c2c7d6c9e&c=red")
+        assert r.json == {"v": ["27b3d7e5-4f5a-4b2a-a0c7-1c1c2c7d6c9e"], "c": "red"}
+    assert parameters["default_route"]["v"].conversion_cache_info(app).hits == 2
+    assert parameters["default_route"]["c"].conversion_cache_info(app).hits == 2
+    app.config.pop("FPV_CONVERSION_CACHE_SIZE", None)
+    ValidateParameters.reload_settings(app)
+
+
+def test_conversion_cache_skips_mutable_and_blank(client, app):
+    parameters = get_parameters(app)
+    for _ in range(2):
+        r = client.get('/conversion_cache/mutable?v={"a":1}')
+        # Test that the dict converted by the first request wasn't reused
+        assert r.json == {"v": {"a": 1, "changed": True}}
+    assert parameters["mutable_route"]["v"].conversion_cache_info(app).currsize == 0
+    for _ in range(2):
+        r = client.get("/conversion_cache/blank?v=&w=1")
+        assert r.json == {"v": "", "w": 1}
+    assert parameters["blank_route"]["w"].conversion_cache_info(app).hits == 1
+    app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
+    r = client.get("/conversion_cache/blank?v=&w=1")
+    assert r.json == {"v": None, "w": 1}
+    app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
+
+
+def test_conversion_cache_per_app():
+    # Both apps have the same routes, but different config
+    blueprint = get_conversion_cache_blueprint("conversion_cache")
+    apps = [Flask(__name__), Flask(__name__)]
+    apps[0].config.update({"FPV_BLANK_NONE": True, "FPV_CONVERSION_CACHE_SIZE": 10})
+    for app in apps:
+        app.register_blueprint(blueprint)
+    clients = [app.test_client() for app in apps]
+    expected = [{"v": None, "w": 1}, {"v": "", "w": 1}]
+    for _ in range(5):
+        for client, expected_json in zip(clients, expected):
+            assert client.get("/conversion_cache/blank?v=&w=1").json == expected_json
+            assert client.get("/conversion_cache/default?c=red").json == {"v": None, "c": "red"}
+    # Test that each app's converters are compiled once, and keep their own cache
+    blank_parameters = apps[0].view_functions["conversion_cache.blank_route"].__fpv_plan__.parameters
+    assert all(len(parameter.compiled) == 2 for parameter in blank_parameters)
+    color_parameter = apps[0].view_functions["conversion_cache.default_route"].__fpv_plan__.parameters[1]
+    assert color_parameter.conversion_cache_info(apps[0]).hits == 4
+    assert color_parameter.conversion_cache_info(apps[1]) is None
+
+    # Test that concurrent requests to both apps don't see each other's settings
+    def get(index):
+        return clients[index % 2].get("/conversion_cache/blank?v=&w=1").json == expected[index % 2]
+
+    with ThreadPoolExecutor(4) as executor:
+        assert all(executor.map(get, range(200)))
@@ -0,0 +1,142 @@
+# Compiled Converter Validation
+import copy
+import datetime
+import sys
+import uuid
+from typing import Any, List, Optional, Union, get_origin
+
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict
+elif sys.version_info >= (3, 9):
+    from typing_extensions import NotRequired, TypedDict
+
+from flask_parameter_validation import Form, Json, Query, Route, ValidateParameters
+from flask_parameter_validation.converters import compile_converter
+from flask_parameter_validation.exceptions import ValidationError
+from flask_parameter_validation.test.enums import Binary, Fruits
+
+
+class Simple(TypedDict):
+    id: int
+    name: str
+    tags: NotRequired[List[str]]
+
+
+class Recursive(TypedDict):
+    v: int
+    children: NotRequired[List["Recursive"]]
+
+
+types = [
+    int, str, float, bool, datetime.date, datetime.datetime, datetime.time, uuid.UUID, Fruits, Binary, Any,
+    Optional[int], Optional[str], Union[bool, int], Union[str, int], Optional[Fruits], list, dict, List[int],
+    Optional[List[int]], List[Optional[int]], dict[str, int], dict[str, List[int]], Simple, List[Simple],
+    Optional[Simple], Recursive, Union[List[int], int], Union[dict, str],
+    Union[int, float, bool, str], Union[float, int], Union[str, List[int], dict], Union[Any, int],
+    Optional[datetime.date], Union[datetime.date, int], Union[uuid.UUID, int], Union[Fruits, int, str],
+    Union[Binary, bool], Union[Fruits, Binary], Union[Simple, List[Simple], str], List[Union[int, str, None]],
+]
+inputs = [
+    1, 0, 1.5, True, None, "", "1", "abc", "1.5", "true", "apple", "2020-01-01", "2020-01-01T10:00:00", "10:00:00",
+    str(uuid.UUID(int=1)), [1, 2], ["1", "2"], [""], ["a", 1], [None, 1], {}, {"a": 1}, {"1": "x"},
+    {"id": 1, "name": "x"}, {"id": "1", "name": "x"}, {"id": 1, "name": "x", "tags": ["a"]},
+    {"id": 1, "name": "x", "extra": 1}, '{"id": 1, "name": "x"}', "[1,2]",
+    {"v": 1, "children": [{"v": 2}]}, {"v": 1, "children": [{"v": "x"}]}, datetime.date(2020, 1, 1),
+    20200101, "-2", " 3 ", "1e3", "false", "0", [{"id": 1, "name": "x"}], uuid.UUID(int=1), "[]",
+]
+
+
+def outcome(converter, user_input):
+    try:
+        converted, success = converter(user_input)
+        return "converted", converted, type(converted), success
+    except ValidationError as e:
+        return "error", e.args
+    except Exception as e:
+        return "exception", type(e)
+
+
+def skip_helper_type_error(expected_input_type, expected) -> bool:
+    # Parameter.convert raises a TypeError for unions of str with generic types, such as Union[str, List[int]],
+    # which union dispatch avoids by only trying the members that can accept the input
+    return expected == ("exception", TypeError) and get_origin(expected_input_type) is Union
+
+
+def test_compiled_converters_match_generic_helper(app):
+    helper = ValidateParameters()._generic_types_validation_helper
+    for source in (Json(), Query(), Form(), Route()):
+        for expected_input_type in types:
+            converter = compile_converter("v", expected_input_type, source)
+            for user_input in inputs:
+                expected = outcome(lambda i: helper("v", expected_input_type, i, source), user_input)
+                if skip_helper_type_error(expected_input_type, expected):
+                    continue
+                assert outcome(converter, user_input) == expected, (
+                    f"{type(source).__name__} {expected_input_type} {user_input!r}"
+                )
+
+
+def test_in_place_converters_match_generic_helper(app):
+    helper = ValidateParameters()._generic_types_validation_helper
+    for source in (Json(), Query(), Form(), Route()):
+        for expected_input_type in types:
+            converter = compile_converter("v", expected_input_type, source, in_place=True)
+            for user_input in inputs:
+                expected = outcome(lambda i: helper("v", expected_input_type, i, source), user_input)
+                if skip_helper_type_error(expected_input_type, expected):
+                    continue
+                # In-place conversion mutates its input, which is partially converted if conversion fails
+                actual = outcome(converter, copy.deepcopy(user_input))
+                if expected[0] == "converted" and expected[-1]:
+                    assert actual == expected, f"{type(source).__name__} {expected_input_type} {user_input!r}"
+                else:
+                    assert actual[0] != "converted" or not actual[-1]
+
+
+def test_converters_copy_only_converted_containers(app):
+    # Test that containers needing no conversion are returned as they are
+    for expected_input_type, user_input in [
+        (List[int], [1, 2]), (list, [1, "a"]), (dict[str, int], {"a": 1}), (dict, {"a": [1]}),
+        (Simple, {"id": 1, "name": "x", "tags": ["a"]}), (List[Simple], [{"id": 1, "name": "x"}]),
+    ]:
+        converted, success = compile_converter("v", expected_input_type, Json())(user_input)
+        assert success and converted is user_input
+    # Test that containers with converted items are copied, leaving the input untouched
+    user_input = [{"id": 1, "name": "x"}, {"id": 2, "name": "y", "tags": ["a"]}]
+    converted, success = compile_converter("v", List[Simple], Query())(user_input)
+    assert success and converted == user_input
+    user_input = ["2020-01-01", datetime.date(2020, 1, 2)]
+    converted, success = compile_converter("v", List[datetime.date], Json())(user_input)
+    assert converted == [datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)]
+    assert user_input == ["2020-01-01", datetime.date(2020, 1, 2)]
+    user_input = {"1": "2020-01-01", "2": "2020-01-02"}
+    converted, success = compile_converter("v", dict[int, datetime.date], Query())(user_input)
+    assert converted == {1: datetime.date(2020, 1, 1), 2: datetime.date(2020, 1, 2)}
+    assert user_input == {"1": "2020-01-01", "2": "2020-01-02"}
+
+
+def test_converters_in_place(app):
+    user_input = [{"id": 1, "when": ["2020-01-01"]}]
+    converted, success = compile_converter("v", List[dict[str, Any]], Json(), in_place=True)(user_input)
+    assert success and converted is user_input
+    user_input = {"a": ["2020-01-01", "2020-01-02"], "b": []}
+    converted, success = compile_converter("v", dict[str, List[datetime.date]], Json(), in_place=True)(user_input)
+    assert success and converted is user_input
+    assert user_input == {"a": [datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)], "b": []}
+    # Test that containers are copied under unions, where another type may need the unconverted input
+    user_input = ["1", "a"]
+    converted, success = compile_converter("v", Union[List[int], List[str]], Query(), in_place=True)(user_input)
+    assert success and converted == ["1", "a"]
+
+
+def test_union_dispatch_converts_once(app):
+    for source in (Query(), Json()):
+        calls = []
+        convert = source.convert
+        source.convert = lambda value, allowed_types: calls.append(value) or convert(value, allowed_types)
+        converter = compile_converter("v", Union[int, float, bool, dict, str], source)
+        assert converter("abc") == ("abc", True)
+        assert calls == ["abc"]
+        assert converter(1.5) == (1.5, True)
+        assert converter({"a": 1}) == ({"a": 1}, True)
+        assert calls == ["abc"]
@@ -0,0 +1,52 @@
+# Concurrent Validation with Executors
+from concurrent.futures import ThreadPoolExecutor
+
+from flask_parameter_validation import ValidateParameters
+from flask_parameter_validation.test.testing_blueprints.executor_blueprint import finished_checks
+
+
+def test_executor_validates_concurrently(client):
+    r = client.post("/executor/concurrent?d=1&source=test", json={"a": 1, "b": 2, "c": {}})
+    assert r.json == {"a": 1, "b": 2, "c": {}, "d": 1}
+    r = client.post("/executor/concurrent?d=1", json={"a": 1, "b": 2, "c": {}})
+    assert r.json["error"] == "Parameter 'd' value does not match the validator function."
+    r = client.post("/executor/concurrent", json={"a": 1, "b": 2, "c": []})
+    assert r.json["error"].startswith("Parameter 'c' failed JSON Schema validation")
+
+
+def test_executor_error_order(client):
+    # Test that an earlier parameter's error is reported, though it is found after a later one's
+    r = client.post("/executor/order", json={"a": -1, "b": "x"})
+    assert r.json["error"] == "Parameter 'a' value does not match the validator function."
+    r = client.post("/executor/order", json={"a": 1, "b": "x"})
+    assert r.json["error"] == "Parameter 'b' must be type '<class 'int'>'"
+    r = client.post("/executor/order", json={"a": 1, "b": 2})
+    assert r.json == {"a": 1, "b": 2}
+    r = client.post("/executor/handler", json={"a": -1})
+    assert r.status_code == 422
+    assert r.json == {"custom": "Parameter 'a' value does not match the validator function."}
+
+
+def test_executor_failure_waits_for_pending(client):
+    # Test that checks still running when validation fails finish before the response
+    finished_checks.clear()
+    r = client.post("/executor/failure", json={"a": -1, "b": 1, "c": "x"})
+    assert r.json["error"] == "Parameter 'a' value does not match the validator function."
+    assert finished_checks == [1]
+
+
+def test_executor_config(client, app):
+    with ThreadPoolExecutor(4) as executor:
+        app.config.update({"FPV_EXECUTOR": executor})
+        ValidateParameters.reload_settings(app)
+        r = client.post("/executor_config/concurrent?d=1&source=test", json={"a": 1, "b": 2, "c": {}})
+        assert r.status_code == 200
+    app.config.pop("FPV_EXECUTOR", None)
+    ValidateParameters.reload_settings(app)
+
+
+def test_func_executor(client):
+    r = client.post("/executor/even", json={"v": 2})
+    assert r.json == {"v": 2}
+    r = client.post("/executor/even", json={"v": 3})
+    assert r.json["error"] == "Parameter 'v' must be even"
@@ -5,6 +5,7 @@ import json
 import uuid
 from typing import Type, List, Optional
 
+from flask_parameter_validation import ValidateParameters
 from flask_parameter_validation.test.enums import Fruits, Binary
 
 
@@ -68,16 +69,19 @@ def test_optional_str_blank_none_unset(client, app):
     url = "/form/str/blank_none/unset"
     # Test that FPV_BLANK_NONE returns empty string when False
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that FPV_BLANK_NONE returns None when True
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that FPV_BLANK_NONE runs as False by default
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
@@ -87,16 +91,19 @@ def test_optional_str_blank_none_true(client, app):
     url = "/form/str/blank_none/true"
     # Test that FPV_BLANK_NONE of False can be overridden to True per-route
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that FPV_BLANK_NONE of True can be 'overridden' to True per-route
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that unset FPV_BLANK_NONE can be overridden to True per-route
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
@@ -106,16 +113,19 @@ def test_optional_str_blank_none_false(client, app):
     url = "/form/str/blank_none/false"
     # Test that FPV_BLANK_NONE of False can be 'overridden' to False per-route
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that FPV_BLANK_NONE of True can be overridden to False per-route
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that unset FPV_BLANK_NONE can be 'overridden' to False per-route
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", data={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
@@ -206,6 +216,28 @@ def test_str_pattern(client):
     assert "error" in r.json
 
 
+def test_str_pattern_compiled(client):
+    url = "/form/str/pattern/compiled"
+    # Test that input matching pattern yields input
+    r = client.post(url, data={"v": "AbC123"})
+    assert "v" in r.json
+    assert r.json["v"] == "AbC123"
+    # Test that input failing pattern yields error
+    r = client.post(url, data={"v": "123ABC"})
+    assert "error" in r.json
+
+
+def test_str_pattern_fullmatch(client):
+    url = "/form/str/pattern/fullmatch"
+    # Test that input matching the whole pattern yields input
+    r = client.post(url, data={"v": "AbC123"})
+    assert "v" in r.json
+    assert r.json["v"] == "AbC123"
+    # Test that input only matching the start of the pattern yields error
+    r = client.post(url, data={"v": "AbC1234"})
+    assert "error" in r.json
+
+
 def test_str_func(client):
     url = "/form/str/func"
     # Test that input passing func yields input
@@ -0,0 +1,66 @@
+# Memoized Validation Functions
+import pytest
+from flask import Flask
+
+from flask_parameter_validation import Query
+from flask_parameter_validation.func_cache import FuncCache
+from flask_parameter_validation.metrics import ValidationMetrics
+from flask_parameter_validation.test.testing_blueprints.func_cache_blueprint import func_calls, get_func_cache_blueprint
+
+
+def test_func_cache_hits():
+    # Metrics receivers stay connected to their app, so are tested with an app of their own
+    func_calls.clear()
+    app = Flask(__name__)
+    app.register_blueprint(get_func_cache_blueprint("func_cache"))
+    metrics = ValidationMetrics(app)
+    client = app.test_client()
+    for v in ["SKU-1", "SKU-1", "SKU-2", "SKU-1", "SKU-3", "SKU-2"]:
+        r = client.get(f"/func_cache/sku?v={v}")
+        assert r.json == {"v": v}
+    assert func_calls == ["SKU-1", "SKU-2", "SKU-3", "SKU-2"]
+    plan = app.view_functions["func_cache.sku"].__fpv_plan__
+    info = plan.parameters[0].delivery_type.func_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 4, 2, 2)
+    assert metrics.summary()["func_cache.sku"]["func_cache"] == {
+        "v": {"hits": 2, "misses": 4, "maxsize": 2, "currsize": 2}
+    }
+
+
+def test_func_cache_messages(client):
+    func_calls.clear()
+    for _ in range(2):
+        # Test that cached (bool, str) results keep their error message
+        r = client.get("/func_cache/sku?v=bad")
+        assert r.status_code == 400
+        assert r.json["error"] == "Parameter 'v' unknown SKU: bad"
+    assert func_calls == ["bad"]
+    func_calls.clear()
+    # Lists are cached by their items, but unhashable values, such as dicts, are always checked
+    for _ in range(2):
+        r = client.post("/func_cache/json", json={"v": [1, 2], "w": {"a": 1}})
+        assert r.json == {"v": [1, 2], "w": {"a": 1}}
+    assert func_calls == [[1, 2], {"a": 1}, {"a": 1}]
+
+
+def test_func_cache_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("flask_parameter_validation.func_cache.monotonic", lambda: now[0])
+    calls = []
+    cache = FuncCache(10, ttl=5)
+
+    def func(v):
+        calls.append(v)
+        return True
+
+    assert cache.call(func, 1) is True
+    now[0] += 4
+    cache.call(func, 1)
+    # Equal values of different types are cached separately
+    cache.call(func, True)
+    now[0] += 2
+    cache.call(func, 1)
+    assert calls == [1, True, 1]
+    assert cache.info() == (1, 3, 10, 2)
+    with pytest.raises(ValueError):
+        Query(func=func, func_cache_ttl=5)
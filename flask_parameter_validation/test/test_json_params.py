@@ -4,6 +4,7 @@ import datetime
 import uuid
 from typing import Type, List, Optional
 
+from flask_parameter_validation import ValidateParameters
 from flask_parameter_validation.test.enums import Binary, Fruits
 
 
@@ -45,16 +46,19 @@ def test_optional_str_blank_none_unset(client, app):
     url = "/json/str/blank_none/unset"
     # Test that FPV_BLANK_NONE returns empty string when False
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that FPV_BLANK_NONE returns None when True
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that FPV_BLANK_NONE runs as False by default
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
@@ -64,16 +68,19 @@ def test_optional_str_blank_none_true(client, app):
     url = "/json/str/blank_none/true"
     # Test that FPV_BLANK_NONE of False can be overridden to True per-route
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that FPV_BLANK_NONE of True can be 'overridden' to True per-route
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that unset FPV_BLANK_NONE can be overridden to True per-route
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
@@ -83,16 +90,19 @@ def test_optional_str_blank_none_false(client, app):
     url = "/json/str/blank_none/false"
     # Test that FPV_BLANK_NONE of False can be 'overridden' to False per-route
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that FPV_BLANK_NONE of True can be overridden to False per-route
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that unset FPV_BLANK_NONE can be 'overridden' to False per-route
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.post(f"{url}", json={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
@@ -183,6 +193,28 @@ def test_str_pattern(client):
     assert "error" in r.json
 
 
+def test_str_pattern_compiled(client):
+    url = "/json/str/pattern/compiled"
+    # Test that input matching pattern yields input
+    r = client.post(url, json={"v": "AbC123"})
+    assert "v" in r.json
+    assert r.json["v"] == "AbC123"
+    # Test that input failing pattern yields error
+    r = client.post(url, json={"v": "123ABC"})
+    assert "error" in r.json
+
+
+def test_str_pattern_fullmatch(client):
+    url = "/json/str/pattern/fullmatch"
+    # Test that input matching the whole pattern yields input
+    r = client.post(url, json={"v": "AbC123"})
+    assert "v" in r.json
+    assert r.json["v"] == "AbC123"
+    # Test that input only matching the start of the pattern yields error
+    r = client.post(url, json={"v": "AbC1234"})
+    assert "error" in r.json
+
+
 def test_str_func(client):
     url = "/json/str/func"
     # Test that input passing func yields input
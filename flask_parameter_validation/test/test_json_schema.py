@@ -0,0 +1,71 @@
+# Compiled JSON Schema Validation
+import jsonschema
+import pytest
+from jsonschema.exceptions import SchemaError
+from jsonschema.exceptions import ValidationError as JSONSchemaValidationError
+
+from flask_parameter_validation import Json
+from flask_parameter_validation.json_schema import CompiledJsonSchema
+
+schema = {
+    "type": "object",
+    "required": ["user_id", "tags"],
+    "additionalProperties": False,
+    "properties": {
+        "user_id": {"type": "integer", "minimum": 0},
+        "name": {"type": ["string", "null"], "maxLength": 5},
+        "tags": {"type": "array", "items": {"type": "string"}, "minItems": 1},
+    }
+}
+instances = [
+    {"user_id": 1, "tags": ["a"]},
+    {"user_id": 1, "name": None, "tags": ["a", "b"]},
+    {"user_id": 1.0, "tags": ["a"]},
+    {"user_id": -1, "tags": ["a"]},
+    {"user_id": True, "tags": ["a"]},
+    {"user_id": 1, "name": "abcdef", "tags": ["a"]},
+    {"user_id": 1, "tags": []},
+    {"user_id": 1, "tags": [1]},
+    {"user_id": 1},
+    {"user_id": 1, "tags": ["a"], "extra": 1},
+    [],
+    None,
+]
+
+
+def get_error_message(validate, instance):
+    try:
+        validate(instance)
+    except JSONSchemaValidationError as e:
+        return e.args[0]
+    return None
+
+
+def test_invalid_schema_fails_on_construction():
+    with pytest.raises(SchemaError):
+        Json(json_schema={"type": "not_a_type"})
+
+
+def test_compiled_schema_matches_jsonschema():
+    compiled = CompiledJsonSchema(schema)
+    assert compiled.fast_check is not None
+    for instance in instances:
+        assert get_error_message(compiled.validate, instance) == get_error_message(
+            lambda i: jsonschema.validate(i, schema), instance
+        ), instance
+
+
+def test_fast_check_only_accepts_valid_instances():
+    compiled = CompiledJsonSchema(schema)
+    for instance in instances:
+        if compiled.fast_check(instance):
+            assert compiled.validator.is_valid(instance)
+    # Test that schemas using unsupported keywords are always fully validated
+    assert CompiledJsonSchema({"type": "string", "pattern": "^a"}).fast_check is None
+    assert CompiledJsonSchema({"$schema": "http://json-schema.org/draft-03/schema#"}).fast_check is None
+
+
+def test_formats_are_checked():
+    compiled = CompiledJsonSchema({"type": "string", "format": "date"})
+    assert get_error_message(compiled.validate, "2024-01-01") is None
+    assert get_error_message(compiled.validate, "not a date") is not None
@@ -0,0 +1,97 @@
+# Streamed JSON Array Validation
+import io
+import json
+from typing import Iterator
+
+import pytest
+
+from flask_parameter_validation import Json, ValidateParameters
+from flask_parameter_validation.json_stream import JsonArrayParser
+
+
+def test_json_array_parser():
+    data = [
+        1, -2.5e-3, "é☃😀", {"a": [None, True, False]}, [], 12345678901234567890, float("-inf"),
+        {"a": [1.5, -2e-3]}, [[1.25, 2]], {"a": 1e5},
+    ]
+    for body in [json.dumps(data).encode(), json.dumps(data, indent=1).encode()]:
+        # Test that chunks may end anywhere, including within nested numbers
+        for chunk_size in list(range(1, 17)) + [1024]:
+            assert list(JsonArrayParser(io.BytesIO(body), chunk_size)) == data
+    for invalid in [b"{}", b"[1,", b"[1 2]", b"[1,]", b"[1]x", b"[12a]", b"[1e]"]:
+        with pytest.raises(ValueError):
+            list(JsonArrayParser(io.BytesIO(invalid), 1))
+    assert JsonArrayParser(io.BytesIO(b" \n")).is_empty()
+
+
+class CountingStream(io.BytesIO):
+    """Request body recording how much of it has been read"""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def test_json_array_parser_fails_fast():
+    tail = b" " * 10_000_000 + b"]"
+    # Test that a malformed item is rejected without reading the rest of the stream
+    for malformed in [b"[1, @", b"[1, {\"a\": tx", b"[1, \"\\q"]:
+        stream = CountingStream(malformed + tail)
+        with pytest.raises(ValueError, match="invalid JSON array item at offset 4"):
+            list(JsonArrayParser(stream))
+        assert stream.bytes_read <= 65536
+    # Test that items still being received are read no further than max_item_size
+    for unterminated in [b"[1, \"", b"[1, [", b"[1, {\"a\": "]:
+        stream = CountingStream(unterminated + tail)
+        with pytest.raises(ValueError, match="larger than 100000 characters"):
+            list(JsonArrayParser(stream, max_item_size=100_000))
+        assert stream.bytes_read < 200_000
+
+
+def test_json_stream_valid(client):
+    r = client.post("/json_stream/items?source=bulk", json=[{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+    assert r.json == {"ids": [1, 2], "source": "bulk"}
+    r = client.post("/json_stream/items", json=[])
+    assert r.json == {"ids": [], "source": None}
+    r = client.post("/json_stream/ints", json=[0, 1, 2])
+    assert r.json == {"v": [0, 1, 2]}
+
+
+def test_json_stream_missing(client):
+    r = client.post("/json_stream/items")
+    assert r.status_code == 400
+    assert r.json["error"] == "Missing required json parameter 'items'."
+    r = client.post("/json_stream/ints")
+    assert r.json == {"v": None}
+    r = client.post("/json_stream/default", data=b"", content_type="application/json")
+    assert r.json == {"v": [1, 2]}
+
+
+def test_json_stream_invalid(client):
+    r = client.post("/json_stream/items", json=[{"id": 1, "name": "a"}, {"id": "x", "name": "b"}])
+    assert r.status_code == 400
+    assert r.json["error"] == "Parameter 'items' must be type 'typing.Iterator[flask_parameter_validation.test.testing_blueprints.json_stream_blueprint.Item]'"
+    r = client.post("/json_stream/items", json=[{"id": i, "name": "a"} for i in range(4)])
+    assert r.json["error"] == "Parameter 'items' must have have a maximum of 3 items."
+    r = client.post("/json_stream/items", data="[{\"id\": 1", content_type="application/json")
+    assert r.json["error"].startswith("Parameter 'items' is not a valid JSON array: ")
+    r = client.post("/json_stream/ints", json=[1, -1])
+    assert r.json["error"] == "Parameter 'v' must be at least 0."
+    r = client.post("/json_stream/ints", json=[])
+    assert r.json["error"] == "Parameter 'v' must have at least 1 items."
+    r = client.post("/json_stream/partial", json=[1, 2, "x"])
+    assert r.status_code == 400
+
+
+def test_json_stream_with_other_json_parameters():
+    with pytest.raises(ValueError):
+        @ValidateParameters()
+        def invalid(v: Iterator[int] = Json(stream=True), w: int = Json()):
+            pass
+    with pytest.raises(ValueError):
+        Json(stream=True, json_schema={"type": "integer"})
@@ -0,0 +1,72 @@
+# Validation Timing and Metrics
+from flask import Flask
+
+from flask_parameter_validation.metrics import ValidationMetrics, validation_failed, validation_timed
+from flask_parameter_validation.test.testing_blueprints.metrics_blueprint import get_metrics_blueprint
+
+
+def test_validation_timed_signal(client, app):
+    received = []
+
+    def receiver(sender, **kwargs):
+        received.append((sender, kwargs))
+
+    with validation_timed.connected_to(receiver, sender=app):
+        r = client.post("/metrics/timed?q=ab", json={"v": 1, "d": {}})
+    assert r.status_code == 200
+    assert len(received) == 1
+    sender, kwargs = received[0]
+    assert sender is app
+    assert kwargs["endpoint"] == "metrics.timed"
+    assert kwargs["validated"] is True
+    assert set(kwargs["parameters"]) == {"v", "d", "q"}
+    assert set(kwargs["parameters"]["d"]) == {"extraction", "conversion", "constraints", "json_schema"}
+    assert set(kwargs["parameters"]["q"]) == {"extraction", "conversion", "constraints"}
+    phase_total = sum(sum(phases.values()) for phases in kwargs["parameters"].values())
+    assert 0 < phase_total <= kwargs["total"]
+    # Test that nothing is sent once the receiver is disconnected
+    client.post("/metrics/timed", json={"v": 1, "d": {}})
+    assert len(received) == 1
+
+
+def test_validation_failed_signal(client, app):
+    received = []
+
+    def receiver(sender, **kwargs):
+        received.append((kwargs["endpoint"], kwargs["parameter"], kwargs["reason"]))
+
+    with validation_failed.connected_to(receiver, sender=app):
+        client.post("/metrics/timed", json={"v": -1, "d": {}})
+        client.post("/metrics/timed", json={"d": {}})
+        client.post("/metrics/timed", data="{", content_type="application/json")
+        client.post("/metrics/collect", json={"a": "x"})
+    assert received == [
+        ("metrics.timed", "v", "ValidationError"),
+        ("metrics.timed", "v", "MissingInputError"),
+        ("metrics.timed", None, "BadRequest"),
+        ("metrics.collect", "a", "ValidationError"),
+        ("metrics.collect", "b", "MissingInputError"),
+    ]
+
+
+def test_validation_metrics():
+    # Metrics receivers stay connected to their app, so are tested with an app of their own
+    app = Flask(__name__)
+    app.register_blueprint(get_metrics_blueprint("metrics"))
+    metrics = ValidationMetrics(app, max_samples=10)
+    assert app.extensions["flask_parameter_validation.metrics"] is metrics
+    client = app.test_client()
+    for i in range(20):
+        client.post("/metrics/timed", json={"v": i, "d": {}})
+    client.post("/metrics/timed", json={"v": -1, "d": {}})
+    client.post("/metrics/collect", json={})
+    summary = metrics.summary()
+    assert summary["metrics.timed"]["count"] == 10
+    assert 0 < summary["metrics.timed"]["p50"] <= summary["metrics.timed"]["p99"]
+    assert summary["metrics.timed"]["p99"] == metrics.percentile("metrics.timed", 100)
+    assert set(summary["metrics.timed"]["parameters"]["d"]) == {"extraction", "conversion", "constraints", "json_schema"}
+    assert summary["metrics.timed"]["failures"] == {"v": {"ValidationError": 1}}
+    assert summary["metrics.collect"]["failures"] == {"a": {"MissingInputError": 1}, "b": {"MissingInputError": 1}}
+    assert metrics.percentile("unknown", 50) is None
+    metrics.reset()
+    assert metrics.summary() == {}
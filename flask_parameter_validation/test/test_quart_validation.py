@@ -0,0 +1,88 @@
+# Quart Route Validation
+import asyncio
+import io
+import threading
+from typing import Optional
+
+import pytest
+
+from flask_parameter_validation import File, Form, Json, Query, Route, ValidateParameters
+
+quart = pytest.importorskip("quart")
+from quart.datastructures import FileStorage  # noqa: E402
+from werkzeug.datastructures import FileStorage as UploadedFile  # noqa: E402
+
+from flask_parameter_validation.quart_validation import QuartValidateParameters  # noqa: E402
+
+
+def get_quart_app(config=None):
+    app = quart.Quart(__name__)
+    app.config.update(config or {})
+    validated_in = {}
+
+    def record_thread(v):
+        validated_in["thread"] = threading.current_thread()
+        return True
+
+    @app.post("/json/<int:id>")
+    @QuartValidateParameters()
+    async def json_route(id: int = Route(), v: list[int] = Json(func=record_thread), q: Optional[str] = Query()):
+        return {"id": id, "v": v, "q": q}
+
+    @app.post("/form")
+    @QuartValidateParameters(collect_errors=True)
+    async def form_route(v: int = Form(min_int=0), w: Optional[bool] = Form()):
+        return {"v": v, "w": w}
+
+    @app.post("/file")
+    @QuartValidateParameters(error_handler=lambda e: ({"custom": str(e)}, 422))
+    def file_route(f: FileStorage = File(content_types=["text/plain"])):
+        return {"name": f.filename}
+
+    return app, validated_in
+
+
+def test_quart_validation():
+    async def run():
+        app, validated_in = get_quart_app()
+        client = app.test_client()
+        r = await client.post("/json/1?q=x", json={"v": [1, 2]})
+        assert await r.get_json() == {"id": 1, "v": [1, 2], "q": "x"}
+        # Test that small requests are validated on the event loop
+        assert validated_in["thread"] is threading.current_thread()
+        r = await client.post("/json/1", json={"v": ["x"]})
+        assert r.status_code == 400
+        assert (await r.get_json())["error"] == "Parameter 'v' must be type 'list[int]'"
+        r = await client.post("/json/1", data="{", headers={"Content-Type": "application/json"})
+        assert (await r.get_json())["error"] == "Could not parse JSON."
+        r = await client.post("/form", form={"v": "1", "w": "true"})
+        assert await r.get_json() == {"v": 1, "w": True}
+        r = await client.post("/form", form={"v": "-1"})
+        assert (await r.get_json())["errors"] == [{"path": "/v", "message": "Parameter 'v' must be at least 0."}]
+        r = await client.post("/file", files={"f": UploadedFile(io.BytesIO(b"abc"), filename="a.txt", content_type="text/plain")})
+        assert await r.get_json() == {"name": "a.txt"}
+        r = await client.post("/file", files={"f": UploadedFile(io.BytesIO(b"abc"), filename="a.png", content_type="image/png")})
+        assert r.status_code == 422
+        assert ValidateParameters.warmup(app) == 3
+
+    asyncio.run(run())
+
+
+def test_quart_large_requests_validated_in_executor():
+    async def run():
+        app, validated_in = get_quart_app({"FPV_ASYNC_OFFLOAD_SIZE": 1000})
+        client = app.test_client()
+        r = await client.post("/json/1", json={"v": list(range(1000))})
+        assert (await r.get_json())["v"] == list(range(1000))
+        assert validated_in["thread"] is not threading.current_thread()
+        r = await client.post("/json/1", json={"v": list(range(1000)) + ["x"]})
+        assert r.status_code == 400
+
+    asyncio.run(run())
+
+
+def test_quart_json_stream_unsupported():
+    with pytest.raises(ValueError):
+        @QuartValidateParameters()
+        async def invalid(v: list[int] = Json(stream=True)):
+            pass
@@ -5,6 +5,7 @@ import json
 import uuid
 from typing import Type, List, Optional
 
+from flask_parameter_validation import ValidateParameters
 from flask_parameter_validation.test.enums import Binary, Fruits
 
 
@@ -92,16 +93,19 @@ def test_optional_str_blank_none_unset(client, app):
     url = "/query/str/blank_none/unset"
     # Test that FPV_BLANK_NONE returns empty string when False
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that FPV_BLANK_NONE returns None when True
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that FPV_BLANK_NONE runs as False by default
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
@@ -111,16 +115,19 @@ def test_optional_str_blank_none_true(client, app):
     url = "/query/str/blank_none/true"
     # Test that FPV_BLANK_NONE of False can be overridden to True per-route
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that FPV_BLANK_NONE of True can be 'overridden' to True per-route
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
     # Test that unset FPV_BLANK_NONE can be overridden to True per-route
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] is None
@@ -130,16 +137,19 @@ def test_optional_str_blank_none_false(client, app):
     url = "/query/str/blank_none/false"
     # Test that FPV_BLANK_NONE of False can be 'overridden' to False per-route
     app.config.update({"FPV_BLANK_NONE": False})
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that FPV_BLANK_NONE of True can be overridden to False per-route
     app.config.update({"FPV_BLANK_NONE": True})
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
     # Test that unset FPV_BLANK_NONE can be 'overridden' to False per-route
     app.config.pop("FPV_BLANK_NONE", None)
+    ValidateParameters.reload_settings(app)
     r = client.get(f"{url}", query_string={"v": ""})
     assert "v" in r.json
     assert r.json["v"] == ""
@@ -400,6 +410,28 @@ def test_str_pattern_async_decorator(client):
     assert "error" in r.json
 
 
+def test_str_pattern_compiled(client):
+    url = "/query/str/pattern/compiled"
+    # Test that input matching pattern yields input
+    r = client.get(url, query_string={"v": "AbC123"})
+    assert "v" in r.json
+    assert r.json["v"] == "AbC123"
+    # Test that input failing pattern yields error
+    r = client.get(url, query_string={"v": "123ABC"})
+    assert "error" in r.json
+
+
+def test_str_pattern_fullmatch(client):
+    url = "/query/str/pattern/fullmatch"
+    # Test that input matching the whole pattern yields input
+    r = client.get(url, query_string={"v": "AbC123"})
+    assert "v" in r.json
+    assert r.json["v"] == "AbC123"
+    # Test that input only matching the start of the pattern yields error
+    r = client.get(url, query_string={"v": "AbC1234"})
+    assert "error" in r.json
+
+
 def test_str_func(client):
     url = "/query/str/func"
     # Test that input passing func yields input
@@ -1354,6 +1386,7 @@ def test_required_list_str_disable_query_csv_unset(client, app):
     url = "/query/list/disable_query_csv/unset"
     # Test that FPV_LIST_DISABLE_QUERY_CSV returns array of two strings when False
     app.config.update({"FPV_LIST_DISABLE_QUERY_CSV": False})
+    ValidateParameters.reload_settings(app)
     v = ["b", "c"]
     r = client.get(f"{url}", query_string={"v": ",".join(v)})
     assert "v" in r.json
@@ -1362,6 +1395,7 @@ def test_required_list_str_disable_query_csv_unset(client, app):
     list_assertion_helper(2, str, v, r.json["v"])
     # Test that FPV_LIST_DISABLE_QUERY_CSV returns array of single string when True
     app.config.update({"FPV_LIST_DISABLE_QUERY_CSV": True})
+    ValidateParameters.reload_settings(app)
     v = "d,e"
     r = client.get(f"{url}", query_string={"v": v})
     assert "v" in r.json
@@ -1370,6 +1404,7 @@ def test_required_list_str_disable_query_csv_unset(client, app):
     list_assertion_helper(1, str, [v], r.json["v"])
     # Test that FPV_LIST_DISABLE_QUERY_CSV runs as False by default
     app.config.pop("FPV_LIST_DISABLE_QUERY_CSV", None)
+    ValidateParameters.reload_settings(app)
     v = ["f", "g"]
     r = client.get(f"{url}", query_string={"v": ",".join(v)})
     assert "v" in r.json
@@ -1382,6 +1417,7 @@ def test_required_list_str_disable_query_csv_true(client, app):
     url = "/query/list/disable_query_csv/true"
     # Test that FPV_LIST_DISABLE_QUERY_CSV of False can be overridden to True per-route
     app.config.update({"FPV_LIST_DISABLE_QUERY_CSV": False})
+    ValidateParameters.reload_settings(app)
     v = "h,i"
     r = client.get(f"{url}", query_string={"v": v})
     assert "v" in r.json
@@ -1390,6 +1426,7 @@ def test_required_list_str_disable_query_csv_true(client, app):
     list_assertion_helper(1, str, [v], r.json["v"])
     # Test that FPV_LIST_DISABLE_QUERY_CSV of True can be 'overridden' to True per-route
     app.config.update({"FPV_LIST_DISABLE_QUERY_CSV": True})
+    ValidateParameters.reload_settings(app)
     v = "j,k"
     r = client.get(f"{url}", query_string={"v": v})
     assert "v" in r.json
@@ -1398,6 +1435,7 @@ def test_required_list_str_disable_query_csv_true(client, app):
     list_assertion_helper(1, str, [v], r.json["v"])
     # Test that unset FPV_LIST_DISABLE_QUERY_CSV can be overridden to True per-route
     app.config.pop("FPV_LIST_DISABLE_QUERY_CSV", None)
+    ValidateParameters.reload_settings(app)
     v = "l,m"
     r = client.get(f"{url}", query_string={"v": v})
     assert "v" in r.json
@@ -1410,6 +1448,7 @@ def test_required_list_str_disable_query_csv_false(client, app):
     url = "/query/list/disable_query_csv/false"
     # Test that FPV_LIST_DISABLE_QUERY_CSV of False can be 'overridden' to False per-route
     app.config.update({"FPV_LIST_DISABLE_QUERY_CSV": False})
+    ValidateParameters.reload_settings(app)
     v = ["n", "o"]
     r = client.get(f"{url}", query_string={"v": ",".join(v)})
     assert "v" in r.json
@@ -1418,6 +1457,7 @@ def test_required_list_str_disable_query_csv_false(client, app):
     list_assertion_helper(2, str, v, r.json["v"])
     # Test that FPV_LIST_DISABLE_QUERY_CSV of True can be overridden to False per-route
     app.config.update({"FPV_LIST_DISABLE_QUERY_CSV": True})
+    ValidateParameters.reload_settings(app)
     v = ["p", "q"]
     r = client.get(f"{url}", query_string={"v": ",".join(v)})
     assert "v" in r.json
@@ -1426,6 +1466,7 @@ def test_required_list_str_disable_query_csv_false(client, app):
     list_assertion_helper(2, str, v, r.json["v"])
     # Test that unset FPV_LIST_DISABLE_QUERY_CSV can be 'overridden' to False per-route
     app.config.pop("FPV_LIST_DISABLE_QUERY_CSV", None)
+    ValidateParameters.reload_settings(app)
     v = ["r", "s"]
     r = client.get(f"{url}", query_string={"v": ",".join(v)})
     assert "v" in r.json
@@ -120,6 +120,28 @@ def test_str_pattern(client):
     assert "error" in r.json
 
 
+def test_str_pattern_compiled(client):
+    url = "/route/str/pattern/compiled"
+    # Test that input matching pattern yields input
+    r = client.get(f"{url}/AbC123")
+    assert "v" in r.json
+    assert r.json["v"] == "AbC123"
+    # Test that input failing pattern yields error
+    r = client.get(f"{url}/123ABC")
+    assert "error" in r.json
+
+
+def test_str_pattern_fullmatch(client):
+    url = "/route/str/pattern/fullmatch"
+    # Test that input matching the whole pattern yields input
+    r = client.get(f"{url}/AbC123")
+    assert "v" in r.json
+    assert r.json["v"] == "AbC123"
+    # Test that input only matching the start of the pattern yields error
+    r = client.get(f"{url}/AbC1234")
+    assert "error" in r.json
+
+
 def test_str_func(client):
     url = "/route/str/func"
     # Test that input passing func yields input
@@ -0,0 +1,95 @@
+# Early Rejection of Multipart Uploads
+import inspect
+import io
+
+from flask import Flask
+from werkzeug.datastructures import FileStorage
+from werkzeug.formparser import FormDataParser, MultiPartParser
+from werkzeug.test import encode_multipart
+
+from flask_parameter_validation.metrics import ValidationMetrics
+from flask_parameter_validation.multipart import UploadLimitedFormDataParser
+from flask_parameter_validation.test.testing_blueprints.upload_limits_blueprint import get_upload_limits_blueprint
+
+
+class CountingStream(io.BytesIO):
+    """Request body recording how much of it has been read"""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def post_multipart(client, url, fields):
+    boundary, data = encode_multipart(fields)
+    stream = CountingStream(data)
+    r = client.post(url, input_stream=stream, content_length=len(data),
+                    content_type=f"multipart/form-data; boundary={boundary}")
+    return r, stream.bytes_read, len(data)
+
+
+def upload(length, content_type="image/png"):
+    return FileStorage(io.BytesIO(b"x" * length), "v.png", content_type=content_type)
+
+
+def test_upload_rejected_while_parsed():
+    # Metrics receivers stay connected to their app, so are tested with an app of their own
+    app = Flask(__name__)
+    app.register_blueprint(get_upload_limits_blueprint("upload_limits"))
+    metrics = ValidationMetrics(app)
+    client = app.test_client()
+    r, _, _ = post_multipart(client, "/upload_limits/upload", {"w": "a", "v": upload(1000), "x": upload(5000)})
+    assert r.json == {"length": 1000, "limited": False, "w": "a"}
+    r, read, length = post_multipart(client, "/upload_limits/upload", {"v": upload(5_000_000), "w": "a"})
+    assert r.status_code == 413
+    assert r.json == {"error": "Parameter 'v' must have a content-length at most 1000."}
+    # Test that the rest of the upload wasn't received
+    assert read < length // 10
+    r, read, length = post_multipart(client, "/upload_limits/upload", {"v": upload(5_000_000, "image/jpeg")})
+    assert r.status_code == 400
+    assert r.json == {"error": "Parameter 'v' must have content-type 'image/png'."}
+    assert read < length // 10
+    assert metrics.summary()["upload_limits.upload"]["failures"] == {"v": {"ValidationError": 2}}
+
+
+def test_upload_rejected_errors(client):
+    r, _, _ = post_multipart(client, "/upload_limits/collect", {"w": "a", "v": upload(5000)})
+    assert r.status_code == 413
+    # Reading 'w' parses the whole body, so the rejected upload is the only error
+    assert r.json["errors"] == [
+        {"path": "/v", "message": "Parameter 'v' must have a content-length at most 1000."},
+    ]
+    r, _, _ = post_multipart(client, "/upload_limits/handler", {"v": upload(5000)})
+    assert r.status_code == 422
+    assert r.json == {"custom": "Parameter 'v' must have a content-length at most 1000.", "path": "/v"}
+
+
+def test_upload_limited_parser_matches_werkzeug():
+    # Werkzeug APIs the parser relies on, so that changes to them fail here rather than bypassing the limits
+    assert list(inspect.signature(FormDataParser.parse).parameters) == [
+        "self", "stream", "mimetype", "content_length", "options"
+    ]
+    assert list(inspect.signature(MultiPartParser.parse).parameters) == ["self", "stream", "boundary", "content_length"]
+    assert list(inspect.signature(MultiPartParser.start_file_streaming).parameters) == [
+        "self", "event", "total_content_length"
+    ]
+    assert {"stream_factory", "max_form_memory_size", "max_form_parts", "cls"} <= set(
+        inspect.signature(MultiPartParser.__init__).parameters
+    )
+    boundary, data = encode_multipart({"w": "a", "v": upload(10), "x": upload(20, "text/plain")})
+    results = []
+    for parser in [FormDataParser(), UploadLimitedFormDataParser(upload_limits={})]:
+        _, form, files = parser.parse(io.BytesIO(data), "multipart/form-data", len(data), {"boundary": boundary})
+        results.append((
+            form.to_dict(flat=False),
+            [(name, f.filename, f.mimetype, f.read()) for name, f in files.items(multi=True)],
+        ))
+    assert results[0] == results[1]
+    for parser in [FormDataParser(), UploadLimitedFormDataParser(upload_limits={})]:
+        _, form, files = parser.parse(io.BytesIO(data), "multipart/form-data", len(data), {})
+        assert not form and not files
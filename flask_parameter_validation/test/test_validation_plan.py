@@ -0,0 +1,119 @@
+# Validation Plan Behavior
+import json
+from typing import Optional
+
+import pytest
+from flask import Flask, jsonify
+
+from flask_parameter_validation import Query, ValidateParameters
+from flask_parameter_validation.exceptions import InvalidParameterTypeError
+
+
+def test_unexpected_sources_not_parsed(client):
+    # Test that a JSON-only route doesn't parse form bodies
+    r = client.post("/plan/json", json={"v": 1})
+    assert r.json == {"v": 1, "form_parsed": False}
+    # Test that a Query-only route doesn't parse multipart bodies
+    r = client.post("/plan/query?v=2", data={"file": (b"content", "file.txt")})
+    assert r.json == {"v": 2, "form_parsed": False}
+
+
+def test_unexpected_json_body_ignored(client):
+    # Test that malformed JSON is not an error for routes not expecting JSON
+    r = client.post("/plan/query?v=1", data="{", content_type="application/json")
+    assert r.json == {"v": 1, "form_parsed": False}
+    # Test that malformed JSON is an error for routes expecting JSON
+    r = client.post("/plan/json", data="{", content_type="application/json")
+    assert r.status_code == 400
+    assert r.json["error"] == "Could not parse JSON."
+    r = client.post("/plan/multi_source?v=1", data="{", content_type="application/json")
+    assert r.status_code == 400
+
+
+def test_warmup(client, app):
+    plans = [view.__fpv_plan__ for view in app.view_functions.values() if hasattr(view, "__fpv_plan__")]
+    # Routes are compiled for each snapshot of the app's settings
+    settings = ValidateParameters.reload_settings(app)
+    assert not any(settings in parameter.compiled for plan in plans for parameter in plan.parameters)
+    assert ValidateParameters.warmup(app) == len(plans)
+    assert all(settings in parameter.compiled for plan in plans for parameter in plan.parameters)
+    r = client.post("/plan/multi_source?v=1")
+    assert r.json == {"v": 1}
+
+
+def test_warmup_invalid_source():
+    # Warming up an app with an invalid route fails, so the route needs an app of its own
+    app = Flask(__name__)
+
+    @app.get("/invalid")
+    @ValidateParameters()
+    def invalid(v: int = 1):
+        return jsonify({"v": v})
+
+    with pytest.raises(InvalidParameterTypeError):
+        ValidateParameters.warmup(app)
+
+
+def test_json_content_types(client):
+    for content_type in ["application/json", "application/json; charset=utf-8", "application/vnd.api+json"]:
+        r = client.post("/plan/json", data='{"v": 1}', content_type=content_type)
+        assert r.json == {"v": 1, "form_parsed": False}
+    r = client.post("/plan/json", data='{"v": 1}', content_type="text/plain")
+    assert r.status_code == 400
+
+
+def test_custom_json_loads(client, app):
+    decoded = []
+
+    def json_loads(data):
+        decoded.append(data)
+        return json.loads(data)
+
+    app.config.update({"FPV_JSON_LOADS": json_loads})
+    ValidateParameters.reload_settings(app)
+    r = client.post("/plan/json", json={"v": 1})
+    assert r.json == {"v": 1, "form_parsed": False}
+    assert decoded == [b'{"v": 1}']
+    # Test that decoding errors are reported as with the default decoder
+    r = client.post("/plan/json", data="{", content_type="application/json")
+    assert r.status_code == 400
+    assert r.json["error"] == "Could not parse JSON."
+    # Test that routes not expecting JSON don't decode it
+    client.post("/plan/query?v=1", json={"v": 2})
+    assert len(decoded) == 2
+    app.config.pop("FPV_JSON_LOADS", None)
+    ValidateParameters.reload_settings(app)
+
+
+def test_default_containers_not_shared(client):
+    # Test that views modifying a default don't change it for later requests
+    assert client.post("/plan/default", json={}).json == {"v": [{"a": 1}]}
+    assert client.post("/plan/default", json={}).json == {"v": [{"a": 1}]}
+
+
+def test_settings_snapshot():
+    # Configured before the app's first request, so the test needs an app of its own
+    app = Flask(__name__)
+    app.config["FPV_BLANK_NONE"] = True
+
+    @app.get("/blank")
+    @ValidateParameters()
+    def blank(v: Optional[str] = Query()):
+        return jsonify({"v": v})
+
+    client = app.test_client()
+    r = client.get("/blank?v=")
+    assert r.json == {"v": None}
+    # Test that config changes only apply once reloaded
+    app.config["FPV_BLANK_NONE"] = False
+    r = client.get("/blank?v=")
+    assert r.json == {"v": None}
+    settings = ValidateParameters.reload_settings(app)
+    assert settings.blank_none is False
+    r = client.get("/blank?v=")
+    assert r.json == {"v": ""}
+    with pytest.raises(AttributeError):
+        settings.blank_none = True
+    # Test that compiled parameters convert without reading the app config
+    converter = app.view_functions["blank"].__fpv_plan__.parameters[0].compile(settings)[0]
+    assert converter("") == ("", True)
@@ -0,0 +1,79 @@
+# Vectorized Numeric List Validation
+import pytest
+from flask import Flask
+
+from flask_parameter_validation import Json, ValidateParameters
+from flask_parameter_validation import vectorized
+from flask_parameter_validation.test.testing_blueprints.vectorized_blueprint import get_vectorized_blueprint
+
+numpy = pytest.importorskip("numpy")
+
+
+def get_payloads():
+    items = list(range(500))
+    return [
+        items,
+        items + [1001],
+        items + [-6],
+        items + [True],
+        items + [1.0],
+        items + ["1"],
+        items + [2 ** 64],
+        list(range(2001)),
+        [x / 100 for x in items[:100]] + [-0.5, 10.9],
+        [x / 100 for x in items[:100]] + [11.0],
+        [x / 100 for x in items[:100]] + [-1.0],
+        [x / 100 for x in items[:100]] + [float("inf")],
+        [x / 100 for x in items[:100]] + [1],
+        [1, 2, 3],
+        [],
+    ]
+
+
+def post_outcome(client, route, payload):
+    # The testing app raises unhandled errors, such as OverflowError for infinite floats, rather than returning a 500
+    try:
+        r = client.post(route, json={"v": payload})
+    except Exception as e:
+        return type(e)
+    return r.status_code, r.json
+
+
+def test_vectorized_matches_item_by_item(client, monkeypatch):
+    # Routes decorated without NumPy are validated item by item
+    item_by_item_app = Flask(__name__)
+    item_by_item_app.config.update({"TESTING": True})
+    with monkeypatch.context() as m:
+        m.setattr(vectorized, "numpy", None)
+        item_by_item_app.register_blueprint(get_vectorized_blueprint("vectorized"))
+    item_by_item_client = item_by_item_app.test_client()
+    for route in ["/vectorized/ints", "/vectorized/floats", "/vectorized/collect"]:
+        for payload in get_payloads():
+            outcome = post_outcome(client, route, payload)
+            assert outcome == post_outcome(item_by_item_client, route, payload), (route, payload[-2:])
+
+
+def test_vectorized_is_used(app):
+    plan = app.view_functions["vectorized.ints"].__fpv_plan__
+    validator = plan.parameters[0].numeric_list
+    assert validator is not None
+    items = list(range(500))
+    assert validator(items) is items
+    assert validator(items + [-6]) is None
+    assert validator(items + [True]) is None
+    assert validator(items[:10]) is None
+
+
+def test_ndarray(client):
+    r = client.post("/vectorized/array", json={"v": list(range(1000))})
+    assert r.json == {"sum": 499500, "w": None}
+    r = client.post("/vectorized/array", json={"v": [1, 2], "w": [0.5]})
+    assert r.json == {"sum": 3, "w": [0.5]}
+    r = client.post("/vectorized/array", json={"v": list(range(1002))})
+    assert r.json["error"] == "Parameter 'v' must be at most 1000."
+    with pytest.raises(ValueError):
+        @ValidateParameters()
+        def invalid(v: list[str] = Json(ndarray=True)):
+            pass
+    with pytest.raises(ValueError):
+        Json(stream=True, ndarray=True)
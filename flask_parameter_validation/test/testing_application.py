@@ -1,11 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from flask import Flask, jsonify
 
 from flask_parameter_validation import Query, Json, Form, Route
+from flask_parameter_validation.test.testing_blueprints.batch_blueprint import get_batch_blueprint
+from flask_parameter_validation.test.testing_blueprints.collect_errors_blueprint import get_collect_errors_blueprint
+from flask_parameter_validation.test.testing_blueprints.conversion_cache_blueprint import get_conversion_cache_blueprint
+from flask_parameter_validation.test.testing_blueprints.executor_blueprint import get_executor_blueprint
 from flask_parameter_validation.test.testing_blueprints.file_blueprint import get_file_blueprint
+from flask_parameter_validation.test.testing_blueprints.func_cache_blueprint import get_func_cache_blueprint
+from flask_parameter_validation.test.testing_blueprints.json_stream_blueprint import get_json_stream_blueprint
+from flask_parameter_validation.test.testing_blueprints.metrics_blueprint import get_metrics_blueprint
 from flask_parameter_validation.test.testing_blueprints.multi_source_blueprint import get_multi_source_blueprint
 from flask_parameter_validation.test.testing_blueprints.parameter_blueprint import get_parameter_blueprint
+from flask_parameter_validation.test.testing_blueprints.upload_limits_blueprint import get_upload_limits_blueprint
+from flask_parameter_validation.test.testing_blueprints.validation_plan_blueprint import get_validation_plan_blueprint
+from flask_parameter_validation.test.testing_blueprints.vectorized_blueprint import get_vectorized_blueprint
 from flask_parameter_validation.docs_blueprint import docs_blueprint
 
 multi_source_sources = [
@@ -24,6 +35,18 @@ def create_app():
     app.register_blueprint(get_parameter_blueprint(Route, "route", "route", "get"))
     app.register_blueprint(get_file_blueprint("file"))
     app.register_blueprint(docs_blueprint)
+    app.register_blueprint(get_validation_plan_blueprint("validation_plan"))
+    app.register_blueprint(get_collect_errors_blueprint("collect_errors"))
+    app.register_blueprint(get_metrics_blueprint("metrics"))
+    app.register_blueprint(get_json_stream_blueprint("json_stream"))
+    app.register_blueprint(get_vectorized_blueprint("vectorized"))
+    app.register_blueprint(get_conversion_cache_blueprint("conversion_cache"))
+    app.register_blueprint(get_executor_blueprint("executor", ThreadPoolExecutor(4)))
+    # Uses the configured FPV_EXECUTOR
+    app.register_blueprint(get_executor_blueprint("executor_config", None))
+    app.register_blueprint(get_batch_blueprint("batch"))
+    app.register_blueprint(get_func_cache_blueprint("func_cache"))
+    app.register_blueprint(get_upload_limits_blueprint("upload_limits"))
     for source_a in multi_source_sources:
         for source_b in multi_source_sources:
             if source_a["name"] != source_b["name"]:
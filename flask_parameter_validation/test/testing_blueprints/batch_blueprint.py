@@ -0,0 +1,76 @@
+import sys
+from typing import Optional
+
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict
+else:
+    from typing_extensions import NotRequired, TypedDict
+
+from flask import Blueprint, jsonify
+
+from flask_parameter_validation import ValidateParameters, Json, Query
+
+KNOWN_SKUS = {"A1", "B2", "C3"}
+
+# Values given to each call of the batch validator functions, cleared by the tests
+batch_calls = []
+
+
+class Line(TypedDict):
+    sku: str
+    quantity: int
+    gift_sku: NotRequired[str]
+
+
+class Order(TypedDict):
+    lines: list[Line]
+
+
+def known_skus(skus):
+    batch_calls.append(skus)
+    return [(sku in KNOWN_SKUS, f"unknown SKU: {sku}") for sku in skus]
+
+
+def positive(values):
+    batch_calls.append(values)
+    return [value > 0 for value in values]
+
+
+def lookup(values):
+    if "down" in values:
+        raise ConnectionError("store unavailable")
+    if "bad" in values:
+        raise ValueError("could not look values up")
+    return [True] * len(values)
+
+
+def get_batch_blueprint(bp_name: str) -> Blueprint:
+    batch_bp = Blueprint(bp_name, __name__, url_prefix="/batch")
+
+    def order(
+            order: Order = Json(batch_func=known_skus, batch_path="lines/*/sku"),
+            gifts: Optional[list[Line]] = Json(batch_func=known_skus, batch_path="*/gift_sku"),
+            skus: list[str] = Query(batch_func=known_skus),
+            total: int = Json(batch_func=positive, min_int=-100),
+    ):
+        return jsonify({"order": order, "gifts": gifts, "skus": skus, "total": total})
+
+    batch_bp.post("/order", endpoint="order")(ValidateParameters()(order))
+    batch_bp.post("/order/collect", endpoint="order_collect")(ValidateParameters(collect_errors=True)(order))
+
+    @batch_bp.get("/ids")
+    @ValidateParameters()
+    def ids(v: list[int] = Query(batch_func=lambda values: [True])):
+        return jsonify({"v": v})
+
+    @batch_bp.get("/handler")
+    @ValidateParameters(error_handler=lambda e: ({"custom": str(e), "type": type(e).__name__}, 422))
+    def handler(v: list[str] = Query(batch_func=lookup)):
+        return jsonify({"v": v})
+
+    @batch_bp.get("/collect")
+    @ValidateParameters(collect_errors=True)
+    def collect(v: list[str] = Query(batch_func=lookup), w: int = Query()):
+        return jsonify({"v": v})
+
+    return batch_bp
@@ -0,0 +1,35 @@
+import sys
+from typing import List, Optional
+
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypedDict
+elif sys.version_info >= (3, 9):
+    from typing_extensions import NotRequired, TypedDict
+
+from flask import Blueprint, jsonify
+
+from flask_parameter_validation import ValidateParameters, Json, Query
+
+
+class Item(TypedDict):
+    id: int
+    name: str
+    tags: NotRequired[List[str]]
+
+
+def error_handler(errors):
+    return {"errors": [[type(e).__name__, e.path] for e in errors]}, 422
+
+
+def get_collect_errors_blueprint(bp_name: str) -> Blueprint:
+    collect_bp = Blueprint(bp_name, __name__, url_prefix="/collect_errors")
+
+    def params(a: int = Json(), b: str = Json(min_str_length=3), c: Optional[int] = Query(),
+               d: int = Query(), items: List[Item] = Json(default=[]), ids: List[int] = Json(default=[], min_int=0),
+               mapping: Optional[dict[str, int]] = Json()):
+        return jsonify({"success": True})
+
+    collect_bp.post("/collect", endpoint="collect")(ValidateParameters(collect_errors=True)(params))
+    collect_bp.post("/handler", endpoint="handler")(ValidateParameters(error_handler, collect_errors=True)(params))
+    collect_bp.post("/config", endpoint="config")(ValidateParameters()(params))
+    return collect_bp
@@ -0,0 +1,46 @@
+import datetime
+import uuid
+from enum import Enum
+from typing import Optional, Union
+
+from flask import Blueprint, jsonify
+
+from flask_parameter_validation import ValidateParameters, Query, Route
+
+
+class Color(str, Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+def get_conversion_cache_blueprint(bp_name: str) -> Blueprint:
+    cache_bp = Blueprint(bp_name, __name__, url_prefix="/conversion_cache")
+
+    @cache_bp.get("/date")
+    @ValidateParameters()
+    def date_route(v: datetime.date = Query(conversion_cache=2)):
+        return jsonify({"v": v.isoformat()})
+
+    @cache_bp.get("/default")
+    @ValidateParameters()
+    def default_route(v: Optional[list[uuid.UUID]] = Query(), c: Optional[Color] = Query()):
+        return jsonify({"v": None if v is None else [str(u) for u in v], "c": c})
+
+    @cache_bp.get("/datetime/<v>")
+    @ValidateParameters()
+    def datetime_route(v: datetime.datetime = Route(datetime_format="%d.%m.%Y %H%M", conversion_cache=10)):
+        return jsonify({"v": v.isoformat()})
+
+    @cache_bp.get("/mutable")
+    @ValidateParameters()
+    def mutable_route(v: Union[dict, int] = Query(conversion_cache=10)):
+        if type(v) is dict:
+            v["changed"] = True
+        return jsonify({"v": v})
+
+    @cache_bp.get("/blank")
+    @ValidateParameters()
+    def blank_route(v: Optional[str] = Query(conversion_cache=10), w: Optional[int] = Query(conversion_cache=10)):
+        return jsonify({"v": v, "w": w})
+
+    return cache_bp
@@ -0,0 +1,67 @@
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+
+from flask import Blueprint, jsonify, request
+
+from flask_parameter_validation import ValidateParameters, Json, Query
+
+# Calls func in a worker process, which is only started by the first call
+func_executor = ProcessPoolExecutor(1)
+# Values checked by slow_finished, once each check has finished
+finished_checks = []
+
+
+def is_even(v):
+    return v % 2 == 0, "must be even"
+
+
+def get_executor_blueprint(bp_name: str, executor: Optional[Executor]) -> Blueprint:
+    executor_bp = Blueprint(bp_name, __name__, url_prefix=f"/{bp_name}")
+    # Both funcs must be called at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=2)
+
+    def wait_for_other(v):
+        barrier.wait()
+        return True
+
+    def slow_positive(v):
+        time.sleep(0.05)
+        return v > 0
+
+    def slow_finished(v):
+        time.sleep(0.1)
+        finished_checks.append(v)
+        return True
+
+    def query_source(v):
+        return request.args.get("source") == "test"
+
+    @executor_bp.post("/concurrent")
+    @ValidateParameters(executor=executor)
+    def concurrent(a: int = Json(func=wait_for_other), b: int = Json(func=wait_for_other),
+                   c: dict = Json(json_schema={"type": "object"}), d: Optional[int] = Query(func=query_source)):
+        return jsonify({"a": a, "b": b, "c": c, "d": d})
+
+    @executor_bp.post("/order")
+    @ValidateParameters(executor=executor)
+    def order(a: int = Json(func=slow_positive), b: int = Json()):
+        return jsonify({"a": a, "b": b})
+
+    @executor_bp.post("/failure")
+    @ValidateParameters(executor=executor)
+    def failure(a: int = Json(func=slow_positive), b: int = Json(func=slow_finished), c: int = Json()):
+        return jsonify({"a": a, "b": b, "c": c})
+
+    @executor_bp.post("/handler")
+    @ValidateParameters(executor=executor, error_handler=lambda e: ({"custom": str(e)}, 422))
+    def handler(a: int = Json(func=slow_positive)):
+        return jsonify({"a": a})
+
+    @executor_bp.post("/even")
+    @ValidateParameters()
+    def even(v: int = Json(func=is_even, func_executor=func_executor)):
+        return jsonify({"v": v})
+
+    return executor_bp
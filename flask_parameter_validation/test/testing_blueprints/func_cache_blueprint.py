@@ -0,0 +1,34 @@
+from typing import Optional
+
+from flask import Blueprint, jsonify
+
+from flask_parameter_validation import ValidateParameters, Json, Query
+
+# Values given to each call of the validator functions, cleared by the tests
+func_calls = []
+
+
+def known_sku(sku):
+    func_calls.append(sku)
+    return sku.startswith("SKU-"), f"unknown SKU: {sku}"
+
+
+def record(value):
+    func_calls.append(value)
+    return True
+
+
+def get_func_cache_blueprint(bp_name: str) -> Blueprint:
+    func_cache_bp = Blueprint(bp_name, __name__, url_prefix="/func_cache")
+
+    @func_cache_bp.get("/sku")
+    @ValidateParameters()
+    def sku(v: str = Query(func=known_sku, func_cache=2)):
+        return jsonify({"v": v})
+
+    @func_cache_bp.post("/json")
+    @ValidateParameters()
+    def json_route(v: list[int] = Json(func=record, func_cache=10), w: Optional[dict] = Json(func=record, func_cache=10)):
+        return jsonify({"v": v, "w": w})
+
+    return func_cache_bp
@@ -0,0 +1,49 @@
+import sys
+from typing import Iterator, Optional
+
+if sys.version_info >= (3, 11):
+    from typing import TypedDict
+elif sys.version_info >= (3, 9):
+    from typing_extensions import TypedDict
+
+from flask import Blueprint, jsonify, request
+
+from flask_parameter_validation import ValidateParameters, Json, Query
+
+
+class Item(TypedDict):
+    id: int
+    name: str
+
+
+def get_json_stream_blueprint(bp_name: str) -> Blueprint:
+    stream_bp = Blueprint(bp_name, __name__, url_prefix="/json_stream")
+
+    @stream_bp.post("/items")
+    @ValidateParameters()
+    def items(items: Iterator[Item] = Json(stream=True, max_list_length=3), source: Optional[str] = Query()):
+        ids = [item["id"] for item in items]
+        # The body must have been read from the stream, rather than buffered whole
+        assert request.get_data() == b""
+        return jsonify({"ids": ids, "source": source})
+
+    @stream_bp.post("/ints")
+    @ValidateParameters()
+    def ints(v: Optional[Iterator[int]] = Json(stream=True, min_int=0, min_list_length=1)):
+        return jsonify({"v": v if v is None else list(v)})
+
+    @stream_bp.post("/default")
+    @ValidateParameters()
+    def default(v: list[int] = Json(stream=True, default=[1, 2])):
+        return jsonify({"v": list(v)})
+
+    @stream_bp.post("/partial")
+    @ValidateParameters()
+    def partial(v: Iterator[int] = Json(stream=True)):
+        # Errors are raised part way through iteration
+        received = []
+        for item in v:
+            received.append(item)
+        return jsonify({"v": received})
+
+    return stream_bp
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from flask import Blueprint, jsonify
+
+from flask_parameter_validation import ValidateParameters, Json, Query
+
+
+def get_metrics_blueprint(bp_name: str) -> Blueprint:
+    metrics_bp = Blueprint(bp_name, __name__, url_prefix="/metrics")
+
+    @metrics_bp.post("/timed")
+    @ValidateParameters()
+    def timed(v: int = Json(min_int=0), d: dict = Json(json_schema={"type": "object"}),
+              q: Optional[str] = Query(min_str_length=2)):
+        return jsonify({"v": v})
+
+    @metrics_bp.post("/collect")
+    @ValidateParameters(collect_errors=True)
+    def collect(a: int = Json(), b: int = Json()):
+        return jsonify({"a": a})
+
+    return metrics_bp
@@ -1,3 +1,4 @@
+import re
 from typing import Optional
 
 from flask import Blueprint, jsonify, current_app
@@ -71,6 +72,20 @@ def get_str_blueprint(ParamType: type[Parameter], bp_name: str, http_verb: str)
     ):
         return jsonify({"v": v})
 
+    @decorator(path("/pattern/compiled", "/<v>"))
+    @ValidateParameters()
+    def pattern_compiled(
+            v: str = ParamType(pattern=re.compile("\\w{3}\\d{3}"))
+    ):
+        return jsonify({"v": v})
+
+    @decorator(path("/pattern/fullmatch", "/<v>"))
+    @ValidateParameters()
+    def pattern_fullmatch(
+            v: str = ParamType(pattern="\\w{3}\\d{3}", pattern_fullmatch=True)
+    ):
+        return jsonify({"v": v})
+
     def is_digit(v):
         return v.isdigit()
 
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from flask import Blueprint, jsonify
+from werkzeug.datastructures import FileStorage
+
+from flask_parameter_validation import ValidateParameters, File, Form
+from flask_parameter_validation.multipart import LengthLimitedContainer
+
+
+def get_upload_limits_blueprint(bp_name: str) -> Blueprint:
+    upload_bp = Blueprint(bp_name, __name__, url_prefix="/upload_limits")
+
+    @upload_bp.post("/upload")
+    @ValidateParameters()
+    def upload(v: FileStorage = File(max_length=1000, content_types=["image/png"]),
+               w: Optional[str] = Form(), x: Optional[FileStorage] = File()):
+        return jsonify({"length": len(v.read()), "limited": isinstance(v.stream, LengthLimitedContainer), "w": w})
+
+    @upload_bp.post("/collect")
+    @ValidateParameters(collect_errors=True)
+    def collect(w: int = Form(), v: FileStorage = File(max_length=1000)):
+        return jsonify({"w": w})
+
+    @upload_bp.post("/handler")
+    @ValidateParameters(error_handler=lambda e: ({"custom": str(e), "path": e.path}, 422))
+    def handler(v: FileStorage = File(max_length=1000)):
+        return jsonify({})
+
+    return upload_bp
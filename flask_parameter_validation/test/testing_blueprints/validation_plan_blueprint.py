@@ -0,0 +1,35 @@
+from typing import Optional
+
+from flask import Blueprint, jsonify, request
+
+from flask_parameter_validation import ValidateParameters, Json, MultiSource, Query
+
+
+def get_validation_plan_blueprint(bp_name: str) -> Blueprint:
+    plan_bp = Blueprint(bp_name, __name__, url_prefix="/plan")
+
+    @plan_bp.post("/json")
+    @ValidateParameters()
+    def json_only(v: int = Json()):
+        return jsonify({"v": v, "form_parsed": "form" in request.__dict__})
+
+    @plan_bp.post("/query")
+    @ValidateParameters()
+    def query_only(v: Optional[int] = Query()):
+        return jsonify({"v": v, "form_parsed": "form" in request.__dict__})
+
+    @plan_bp.post("/multi_source")
+    @ValidateParameters()
+    def multi_source(v: int = MultiSource(Query, Json)):
+        return jsonify({"v": v})
+
+    @plan_bp.post("/default")
+    @ValidateParameters()
+    def default(v: list[dict[str, int]] = Json(default=[{"a": 1}], convert_in_place=True)):
+        # Views modifying a default mustn't change it for later requests
+        response = jsonify({"v": v})
+        v[0]["a"] = 2
+        v.append({})
+        return response
+
+    return plan_bp
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from flask import Blueprint, jsonify
+
+from flask_parameter_validation import ValidateParameters, Json
+from flask_parameter_validation import vectorized
+
+
+def get_vectorized_blueprint(bp_name: str) -> Blueprint:
+    vectorized_bp = Blueprint(bp_name, __name__, url_prefix="/vectorized")
+
+    @vectorized_bp.post("/ints")
+    @ValidateParameters()
+    def ints(v: list[int] = Json(min_int=-5, max_int=1000, max_list_length=2000)):
+        assert type(v) is list
+        return jsonify({"v": v})
+
+    @vectorized_bp.post("/floats")
+    @ValidateParameters()
+    def floats(v: Optional[list[float]] = Json(min_int=0, max_int=10)):
+        return jsonify({"v": v})
+
+    @vectorized_bp.post("/collect")
+    @ValidateParameters(collect_errors=True)
+    def collect(v: list[int] = Json(min_int=0, min_list_length=100)):
+        return jsonify({"v": v})
+
+    if vectorized.numpy is not None:  # ndarray requires NumPy
+        numpy = vectorized.numpy
+
+        @vectorized_bp.post("/array")
+        @ValidateParameters()
+        def array(v: list[int] = Json(ndarray=True, max_int=1000), w: Optional[list[float]] = Json(ndarray=True)):
+            assert type(v) is numpy.ndarray
+            assert v.dtype == numpy.int64
+            assert w is None or w.dtype == numpy.float64
+            return jsonify({"sum": int(v.sum()), "w": None if w is None else w.tolist()})
+
+    return vectorized_bp
@@ -0,0 +1,391 @@
+"""
+    Validation plans.
+    Everything that can be derived from a view function's signature is
+    resolved once, when the function is decorated, so that each request only
+    has to execute the plan.
+"""
+import contextvars
+import copy
+import inspect
+import weakref
+from concurrent.futures import Executor, Future
+from time import perf_counter
+from typing import Any, Callable, Iterator, Optional, get_args
+
+from .batch import BatchPlan, compile_batch_path
+from .converters import UNION_TYPES, compile_converter, explain_failure, json_pointer
+from .exceptions import InvalidParameterTypeError, MissingInputError, ValidationError
+from .json_stream import JsonArrayParser, ValidatedJsonArray
+from .multipart import compile_upload_limits
+from .parameter_types import File, Form, Json, Parameter, Query, Route
+from .parameter_types.multi_source import MultiSource
+from .settings import Settings, get_settings
+from .vectorized import compile_numeric_list
+
+# Sources which request inputs can be read from
+REQUEST_SOURCE_CLASSES = frozenset({Route, Json, Query, Form, File})
+
+
+class ParameterPlan:
+    """Resolved validation details of a single view function argument"""
+
+    def __init__(self, parameter: inspect.Parameter):
+        """
+        :param parameter: the argument, as given by inspect.signature()
+        """
+        self.name = parameter.name
+        # i.e. str, int etc.
+        self.expected_input_type = parameter.annotation
+        # i.e. Form, Query, Json etc.
+        self.delivery_type = parameter.default
+        # Check if an alias is given, otherwise use the input name
+        self.expected_name = getattr(self.delivery_type, "alias", None) or self.name
+        # JSON pointer to the input, used when collecting errors
+        self.path = json_pointer("", self.expected_name)
+        self.list_disable_query_csv = getattr(self.delivery_type, "list_disable_query_csv", None)
+        # Optionals are Unions with a NoneType, so we should check if None is part of Union __args__ (if exist)
+        self.optional = (
+            hasattr(self.expected_input_type, "__args__") and type(None) in self.expected_input_type.__args__
+        )
+        # Expected delivery types can be a list if using MultiSource
+        if type(self.delivery_type) is MultiSource:
+            self.sources = self.delivery_type.sources
+        else:
+            self.sources = [self.delivery_type]
+        # Streamed JSON arrays are validated item by item, so only their item type is converted
+        self.stream = bool(getattr(self.delivery_type, "stream", None))
+        self.stream_item_type = get_stream_item_type(self.expected_input_type) if self.stream else None
+        # Large Json list[int] and list[float] inputs are checked with NumPy, when it is installed
+        self.numeric_list = compile_numeric_list(self.delivery_type, self.expected_input_type)
+        # Validator of this and other parameters' elements, called once per request (see BatchPlan)
+        self.batch_func = getattr(self.delivery_type, "batch_func", None)
+        self.batch_steps = compile_batch_path(getattr(self.delivery_type, "batch_path", None))
+        # Tuples of format (converter of each source, conversion cache of each source), keyed by the settings
+        # of each app using the parameter, as conversion depends on their config. Compiled on first use, as
+        # type hints may contain forward references that can only be resolved once the whole module has been imported
+        self.compiled = weakref.WeakKeyDictionary()
+
+    def compile(self, settings: Settings) -> list:
+        """
+        Compile the type annotation into a converter for each source, once for each app's settings
+        """
+        compiled = self.compiled.get(settings)
+        if compiled is None:
+            conversion_caches = [
+                source.create_conversion_cache(settings) if isinstance(source, Parameter) else None
+                for source in self.sources
+            ]
+            converters = [
+                compile_converter(
+                    self.expected_name, self.stream_item_type if self.stream else self.expected_input_type, source,
+                    in_place=bool(source.convert_in_place), settings=settings, conversion_cache=conversion_cache,
+                )
+                if isinstance(source, Parameter) else None
+                for source, conversion_cache in zip(self.sources, conversion_caches)
+            ]
+            compiled = self.compiled[settings] = (converters, conversion_caches)
+        return compiled[0]
+
+    def conversion_cache_info(self, app=None):
+        """
+        Get the hits, misses, maxsize and currsize of the conversion caches used for an app (the current app
+        if not given), summed over the parameter's sources, or None if caching is disabled
+        """
+        compiled = self.compiled.get(get_settings(app))
+        cache_infos = [cache.cache_info() for cache in compiled[1] if cache is not None] if compiled else []
+        if not cache_infos:
+            return None
+        return type(cache_infos[0])._make(map(sum, zip(*cache_infos)))
+
+    def validate(self, all_request_inputs: dict, errors: Optional[list] = None, timings: Optional[dict] = None,
+                 offload: Optional[Callable[..., Future]] = None, settings: Optional[Settings] = None) -> Any:
+        """
+        Validate that the expected input exists in the requested input collection,
+        returning the converted input
+
+        :param errors: if given, every validation error is appended to it, with a path to
+            each invalid part of the input, rather than raising the first
+        :param timings: if given, seconds spent in each validation phase ("extraction",
+            "conversion", "constraints" and "json_schema") are added to it
+        :param offload: if given, function of format offload(fn, *args) -> Future, calling fn in an
+            executor. Expensive constraint checks (func and json_schema) are then offloaded once the
+            input is converted, returning a Future of the converted input. Not used when collecting errors
+        :param settings: the settings of the app the request is for, defaulting to the current app's
+        """
+        if settings is None:
+            settings = get_settings()
+        converters = self.compile(settings)
+        if self.stream:
+            return self._validate_stream(all_request_inputs[JsonArrayParser], converters[0])
+        last_source_index = len(self.sources) - 1
+        for source_index, source in enumerate(self.sources):
+            # Validate that the expected delivery type is valid
+            if source.__class__ not in all_request_inputs:
+                raise InvalidParameterTypeError(source)
+
+            # Validate that user supplied input in expected delivery type (unless specified as Optional)
+            if timings is None:
+                user_input = all_request_inputs[source.__class__].get(self.expected_name)
+            else:
+                # Includes reading the source, for the first parameter to read it
+                started = perf_counter()
+                user_input = all_request_inputs[source.__class__].get(self.expected_name)
+                add_timing(timings, "extraction", started)
+            if user_input is None:
+                # If default is given, set and continue
+                if source.default is not None:
+                    user_input = source.default
+                    if type(user_input) is list or type(user_input) is dict:
+                        # Converted containers may be the input itself, which must not be shared between requests
+                        user_input = copy.deepcopy(user_input)
+                elif self.optional and source_index == last_source_index:
+                    # If MultiSource, only return None for last source
+                    return user_input
+                elif source_index != last_source_index:
+                    continue
+                elif errors is not None:
+                    errors.append(MissingInputError(self.expected_name, source.__class__, path=self.path))
+                    return None
+                else:
+                    raise MissingInputError(self.expected_name, source.__class__)
+
+            if self.numeric_list is not None:
+                started = perf_counter() if timings is not None else None
+                numeric_list = self.numeric_list(user_input)
+                if timings is not None:
+                    add_timing(timings, "conversion", started)
+                if numeric_list is not None:
+                    return self._validate_numeric_list(source, user_input, numeric_list, errors, timings)
+
+            if errors is not None:
+                return self._collect_errors(source, converters[source_index], user_input, errors, timings, settings)
+
+            if timings is None:
+                converted_user_input, validation_success = converters[source_index](user_input)
+            else:
+                started = perf_counter()
+                try:
+                    converted_user_input, validation_success = converters[source_index](user_input)
+                finally:
+                    add_timing(timings, "conversion", started)
+
+            if offload is not None and source.has_expensive_checks():
+                # Checked concurrently with other parameters
+                return offload(self._check, source, converted_user_input, validation_success, timings)
+            return self._check(source, converted_user_input, validation_success, timings)
+
+    def _check(self, source, converted_user_input, validation_success: bool, timings: Optional[dict] = None) -> Any:
+        """Check that converted input meets the source's requirements, returning it"""
+        # Validate parameter-specific requirements are met
+        try:
+            if timings is None:
+                source.validate(converted_user_input)
+            else:
+                self._timed_constraints(source.validate, converted_user_input, timings)
+        except ValueError as e:
+            raise ValidationError(str(e), self.expected_name, self.expected_input_type)
+
+        # Error if types don't match
+        if not validation_success:
+            raise ValidationError(
+                f"must be type '{self.expected_input_type}'",
+                self.expected_name,
+                self.expected_input_type,
+            )
+
+        if self.numeric_list is not None:
+            return self.numeric_list.result(converted_user_input)
+        return converted_user_input
+
+    def _collect_errors(self, source, converter, user_input, errors: list, timings: Optional[dict] = None,
+                        settings: Optional[Settings] = None) -> Any:
+        started = perf_counter() if timings is not None else None
+        try:
+            converted_user_input, validation_success = converter(user_input)
+        except ValidationError:
+            converted_user_input, validation_success = user_input, False
+        if not validation_success:
+            errors.extend(explain_failure(
+                self.expected_name, self.expected_input_type, source, user_input, self.path, settings
+            ))
+        if timings is not None:
+            add_timing(timings, "conversion", started)
+        if not validation_success:
+            return None
+        # Validate parameter-specific requirements are met, for each item of a list
+        if timings is None:
+            source_errors = list(source.iter_errors(converted_user_input))
+        else:
+            source_errors = self._timed_constraints(
+                lambda value, timings: list(source.iter_errors(value, timings)), converted_user_input, timings
+            )
+        for index, error in source_errors:
+            errors.append(ValidationError(
+                str(error), self.expected_name, self.expected_input_type,
+                path=self.path if index is None else json_pointer(self.path, index),
+            ))
+        if self.numeric_list is not None and not source_errors:
+            return self.numeric_list.result(converted_user_input)
+        return converted_user_input
+
+    def _validate_numeric_list(self, source, user_input: list, numeric_list: Any, errors: Optional[list] = None,
+                               timings: Optional[dict] = None) -> Any:
+        # Items have already been converted and checked, leaving only the checks of the whole list
+        try:
+            if timings is None:
+                source.validate_list(user_input)
+            else:
+                self._timed_constraints(source.validate_list, user_input, timings)
+        except ValueError as e:
+            if errors is None:
+                raise ValidationError(str(e), self.expected_name, self.expected_input_type)
+            errors.append(ValidationError(str(e), self.expected_name, self.expected_input_type, path=self.path))
+            return None
+        return numeric_list
+
+    def _validate_stream(self, parser: Optional[JsonArrayParser], converter) -> Optional[ValidatedJsonArray]:
+        source = self.delivery_type
+        if parser is None or parser.is_empty():
+            if source.default is not None:
+                return ValidatedJsonArray(self._iter_stream(iter(copy.deepcopy(source.default)), converter))
+            if self.optional:
+                return None
+            raise MissingInputError(self.expected_name, source.__class__)
+        return ValidatedJsonArray(self._iter_stream(parser, converter))
+
+    def _iter_stream(self, items: Iterator, converter) -> Iterator:
+        source = self.delivery_type
+        check_items = source.has_item_checks(in_list=True)
+        index = 0
+        while True:
+            try:
+                item = next(items)
+            except StopIteration:
+                break
+            except ValueError as e:
+                raise ValidationError(f"is not a valid JSON array: {e}", self.expected_name, self.expected_input_type,
+                                      path=self.path)
+            path = json_pointer(self.path, index)
+            # Lists are checked the same way as in Parameter.validate_list(), but as items arrive
+            if source.max_list_length is not None and index >= source.max_list_length:
+                raise ValidationError(f"must have have a maximum of {source.max_list_length} items.",
+                                      self.expected_name, self.expected_input_type, path=self.path)
+            converted_item, validation_success = converter(item)
+            if not validation_success:
+                raise ValidationError(f"must be type '{self.expected_input_type}'", self.expected_name,
+                                      self.expected_input_type, path=path)
+            if check_items:
+                try:
+                    source.validate_item(converted_item, in_list=True)
+                except ValueError as e:
+                    raise ValidationError(str(e), self.expected_name, self.expected_input_type, path=path)
+            yield converted_item
+            index += 1
+        if source.min_list_length is not None and index < source.min_list_length:
+            raise ValidationError(f"must have at least {source.min_list_length} items.", self.expected_name,
+                                  self.expected_input_type, path=self.path)
+
+    @staticmethod
+    def _timed_constraints(check: Callable, value: Any, timings: dict) -> Any:
+        # JSON Schema validation is timed separately, within the constraint checks
+        json_schema_seconds = timings.get("json_schema", 0.0)
+        started = perf_counter()
+        try:
+            return check(value, timings=timings)
+        finally:
+            add_timing(timings, "constraints", started + timings.get("json_schema", 0.0) - json_schema_seconds)
+
+
+def get_stream_item_type(expected_input_type) -> Any:
+    """
+    Get the item type of a streamed parameter's type hint, such as Item of Iterator[Item],
+    Iterable[Item], list[Item] or Optional[Iterator[Item]]
+    """
+    if getattr(expected_input_type, "__origin__", None) in UNION_TYPES:
+        expected_input_type = next(arg for arg in get_args(expected_input_type) if arg is not type(None))
+    args = get_args(expected_input_type)
+    return args[0] if args else Any
+
+
+def submit_in_context(executor: Executor, fn: Callable, *args) -> Future:
+    """Call fn in an executor, within a copy of the current context (such as Flask's request context)"""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def add_timing(timings: dict, phase: str, started: float) -> None:
+    """Add the seconds elapsed since started to a phase of timings"""
+    timings[phase] = timings.get(phase, 0.0) + perf_counter() - started
+
+
+class ValidationPlan:
+    """Resolved validation details of every argument of a view function"""
+
+    def __init__(self, f: Callable):
+        self.parameters = [
+            ParameterPlan(parameter)
+            for parameter in inspect.signature(f).parameters.values()
+        ]
+        # Request input sources read by at least one parameter, other than streamed JSON arrays
+        self.source_classes = {
+            source.__class__ for parameter in self.parameters if not parameter.stream for source in parameter.sources
+        }
+        # The parameter streaming the request body as a JSON array, if any
+        stream_parameters = [parameter for parameter in self.parameters if parameter.stream]
+        if stream_parameters and (len(stream_parameters) > 1 or Json in self.source_classes):
+            raise ValueError(
+                f"'{stream_parameters[0].name}' streams the whole JSON body, so can't be used with other Json parameters"
+            )
+        self.json_stream = stream_parameters[0] if stream_parameters else None
+        # Parameters validated together by their batch_func, once every parameter has been validated
+        self.batch = BatchPlan(self.parameters)
+        # Parser of multipart bodies, rejecting invalid uploads of File parameters as they are received
+        self.upload_limits = compile_upload_limits(self.parameters)
+        # For Query params, which parameters should be split by commas,
+        # keyed by the configured FPV_LIST_DISABLE_QUERY_CSV default
+        self._split_csv = {
+            default_list_disable_query_csv: {
+                parameter.expected_name: not (
+                    default_list_disable_query_csv
+                    if parameter.list_disable_query_csv is None
+                    else parameter.list_disable_query_csv
+                )
+                for parameter in self.parameters
+            }
+            for default_list_disable_query_csv in (False, True)
+        }
+
+    def split_csv(self, default_list_disable_query_csv: bool) -> dict[str, bool]:
+        return self._split_csv[bool(default_list_disable_query_csv)]
+
+    def compile(self, settings: Settings) -> "ValidationPlan":
+        """
+        Compile every parameter for an app's settings ahead of its first use, reporting invalid sources now
+        rather than per request
+
+        :raises InvalidParameterTypeError: if a parameter's source isn't a request input source
+        """
+        for parameter in self.parameters:
+            for source in parameter.sources:
+                if source.__class__ not in REQUEST_SOURCE_CLASSES:
+                    raise InvalidParameterTypeError(source)
+            parameter.compile(settings)
+        return self
+
+
+class RequestInputs(dict):
+    """
+    Request inputs by source class, each source is only materialized when a
+    parameter first reads from it. Reading some sources (e.g. Form and File)
+    forces the whole request body to be parsed.
+    """
+
+    def __init__(self, loaders: dict[type, Callable[[], dict]]):
+        super().__init__()
+        self.loaders = loaders
+
+    def __contains__(self, source_class) -> bool:
+        return source_class in self.loaders
+
+    def __missing__(self, source_class) -> dict:
+        request_input = self[source_class] = self.loaders[source_class]()
+        return request_input
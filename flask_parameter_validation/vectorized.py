@@ -0,0 +1,121 @@
+"""
+    Vectorized validation of large numeric lists.
+    Json list[int] and list[float] inputs are type checked in a single pass, and
+    their min_int and max_int bounds are checked with NumPy array comparisons.
+    Inputs which fail, or can't be checked this way, are left to be validated
+    item by item, so that errors are exactly those of the item by item path.
+"""
+from typing import Any, Optional, get_args
+
+from .converters import UNION_TYPES
+from .parameter_types import Json
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy is optional
+    numpy = None
+
+# Shorter lists are validated item by item, as building an array costs more than it saves
+VECTORIZED_MIN_LENGTH = 64
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def get_numeric_item_type(expected_input_type) -> Optional[type]:
+    """
+    Get int or float for a type hint of list[int] or list[float], which may be Optional,
+    or None for any other type hint
+    """
+    if getattr(expected_input_type, "__origin__", None) in UNION_TYPES or type(expected_input_type) in UNION_TYPES:
+        args = [arg for arg in get_args(expected_input_type) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        expected_input_type = args[0]
+    if getattr(expected_input_type, "__origin__", None) is not list:
+        return None
+    args = get_args(expected_input_type)
+    if len(args) == 1 and args[0] in (int, float):
+        return args[0]
+    return None
+
+
+def compile_numeric_list(source, expected_input_type) -> Optional["NumericListValidator"]:
+    """
+    Compile a vectorized validator for a parameter, or return None if it can't be vectorized
+
+    :raises ValueError: if an ndarray is requested for a type other than list[int] or list[float]
+    :raises ImportError: if an ndarray is requested without NumPy installed
+    """
+    item_type = get_numeric_item_type(expected_input_type)
+    as_ndarray = bool(getattr(source, "ndarray", None))
+    if as_ndarray:
+        if item_type is None:
+            raise ValueError(f"ndarray can only be used with list[int] or list[float], not '{expected_input_type}'")
+        if numpy is None:
+            raise ImportError("NumPy must be installed to use ndarray")
+    if numpy is None or item_type is None or type(source) is not Json or source.stream:
+        return None
+    # Other item checks are of strings, so aren't vectorized
+    string_checks = (source.min_str_length, source.max_str_length, source.whitelist, source.blacklist,
+                     source._pattern_match)
+    if any(check is not None for check in string_checks):
+        return None
+    return NumericListValidator(item_type, source.min_int, source.max_int, as_ndarray)
+
+
+class NumericListValidator:
+    """Converts and checks the items of a list[int] or list[float] input at once"""
+
+    def __init__(self, item_type: type, min_int=None, max_int=None, as_ndarray: bool = False):
+        self.item_type = item_type
+        self.dtype = numpy.int64 if item_type is int else numpy.float64
+        self.min_int = min_int
+        self.max_int = max_int
+        self.as_ndarray = as_ndarray
+        # Bounds which can't be compared exactly with the array are checked item by item
+        bounds = [bound for bound in (min_int, max_int) if bound is not None]
+        self.vectorized = all(type(bound) is int for bound in bounds) and (
+            all(INT64_MIN <= bound <= INT64_MAX for bound in bounds) if item_type is int
+            else all(float(bound) == bound for bound in bounds)
+        )
+
+    def __call__(self, user_input: Any) -> Optional[Any]:
+        """
+        Validate every item of a list input, returning the input (or its ndarray),
+        or None if it must be validated item by item
+        """
+        if not self.vectorized or type(user_input) is not list or len(user_input) < VECTORIZED_MIN_LENGTH:
+            return None
+        # Items must be exactly int or float, as when converted item by item (so bool isn't an int)
+        if set(map(type, user_input)) != {self.item_type}:
+            return None
+        if self.min_int is None and self.max_int is None and not self.as_ndarray:
+            return user_input
+        try:
+            array = numpy.array(user_input, dtype=self.dtype)
+        except OverflowError:
+            return None
+        if self.min_int is not None or self.max_int is not None:
+            # Items are compared as int(item), which truncates floats, and fails for infinity and NaN
+            if self.item_type is float:
+                if not numpy.isfinite(array).all():
+                    return None
+                bounded = numpy.trunc(array)
+            else:
+                bounded = array
+            if self.min_int is not None and (bounded < self.min_int).any():
+                return None
+            if self.max_int is not None and (bounded > self.max_int).any():
+                return None
+        return array if self.as_ndarray else user_input
+
+    def result(self, value: Any) -> Any:
+        """Get the value given to the view, for a value validated item by item"""
+        if not self.as_ndarray or type(value) is not list:
+            return value
+        try:
+            return numpy.array(value, dtype=self.dtype)
+        except OverflowError:
+            # Integers beyond 64 bits are kept as Python ints
+            return numpy.array(value, dtype=object)
@@ -28,9 +28,15 @@ setup(
     install_requires=[
         "Flask",
         "flask[async]",
+        # The public multipart parser API used by multipart.py
+        "Werkzeug>=2.3,<4",
         "python-dateutil",
         "jsonschema",
     ],
+    extras_require={
+        "numpy": ["numpy"],
+        "quart": ["quart"],
+    },
     python_requires=">=3.9,<3.14",
     classifiers=[
         "Environment :: Web Environment",